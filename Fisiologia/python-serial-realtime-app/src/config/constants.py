@@ -9,6 +9,12 @@ SERIAL_DATA_PATTERN = re.compile(
     r"Crudo:(-?\d+(?:\.\d+)?),Filtrado:(-?\d+(?:\.\d+)?),Normalizado:(-?\d+(?:\.\d+)?)", 
     re.IGNORECASE
 )
+# Patrón para extraer el canal raw ("Raw:<valor>")
+RAW_DATA_PATTERN = re.compile(r"Raw:(-?\d+(?:\.\d+)?)", re.IGNORECASE)
+
+# === PROTOCOLO BINARIO ===
+# Palabra de sincronismo de cada trama (bytes 0xA5 0x5A en little-endian)
+BINARY_FRAME_SYNC = 0x5AA5
 
 # === CONSTANTES MATEMÁTICAS ===
 PI = 3.14159265359
@@ -1,8 +1,14 @@
 """
 Configuración específica del puerto serie
 """
+import json
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
 import serial
 import serial.tools.list_ports
+from config.settings import (DEFAULT_BAUD, TIMEOUT, PORT_PROBE_TIMEOUT, PORT_PROBE_DURATION,
+                             PORT_CACHE_FILE, BINARY_FRAME_CHANNELS, BINARY_FRAME_DTYPE)
 
 class SerialConfig:
     """Gestión de configuración del puerto serie"""
@@ -14,38 +20,170 @@ class SerialConfig:
         return [port.device for port in ports]
     
     @staticmethod
-    def validate_port(port, baud=115200):
+    def validate_port(port, baud=DEFAULT_BAUD, timeout=TIMEOUT):
         """Valida si un puerto serie es accesible"""
         try:
-            ser = serial.Serial(port, baud, timeout=1)
+            ser = serial.Serial(port, baud, timeout=timeout)
             ser.close()
             return True
         except Exception:
             return False
     
     @staticmethod
-    def get_default_port():
-        """Obtiene el puerto por defecto según el sistema operativo"""
-        import platform
+    def detect_data_format(data):
+        """Identifica el formato de los datos recibidos
+
+        Args:
+            data (bytes): bytes leídos del puerto
+
+        Returns:
+            str | None: 'binary', 'triple', 'raw', 'plain' o None si no hay
+            ninguna trama o línea válida
+        """
+        from core.processing.binary_protocol import BinaryFrameDecoder
+        from core.processing.line_format import sniff_line_format
+
+        _, frames = BinaryFrameDecoder(BINARY_FRAME_CHANNELS, BINARY_FRAME_DTYPE).feed(data)
+        if len(frames):
+            return 'binary'
+
+        # La primera línea puede estar cortada: solo se miran líneas completas
+        lines = [raw_line.decode('utf-8', errors='ignore').strip()
+                 for raw_line in data.split(b'\n')[1:-1]]
+        return sniff_line_format([line for line in lines if line])
+    
+    @staticmethod
+    def probe_port(port, baud=DEFAULT_BAUD, timeout=PORT_PROBE_TIMEOUT,
+                   duration=PORT_PROBE_DURATION):
+        """Abre un puerto con timeout corto y escucha hasta reconocer el formato
+
+        Returns:
+            dict | None: {'port', 'baud', 'format'} con format None si el puerto
+            abre pero no envía datos válidos, o None si no se puede abrir
+        """
+        try:
+            ser = serial.Serial(port, baud, timeout=timeout)
+        except Exception:
+            return None
+
+        data = b''
+        data_format = None
+        try:
+            deadline = time.monotonic() + duration
+            while time.monotonic() < deadline:
+                data += ser.read(ser.in_waiting or 256)
+                data_format = SerialConfig.detect_data_format(data)
+                if data_format:
+                    break
+        except Exception:
+            pass
+        finally:
+            ser.close()
+        return {'port': port, 'baud': baud, 'format': data_format}
+    
+    @staticmethod
+    def discover_ports(candidates, baud=DEFAULT_BAUD, timeout=PORT_PROBE_TIMEOUT,
+                       duration=PORT_PROBE_DURATION):
+        """Sondea varios puertos en paralelo
+
+        El tiempo total queda acotado por el sondeo más lento y no por la suma.
+
+        Returns:
+            list: resultados de probe_port de los puertos accesibles, primero
+            los que enviaron datos reconocibles, en el orden de candidates
+        """
+        candidates = list(dict.fromkeys(candidates))
+        if not candidates:
+            return []
+        with ThreadPoolExecutor(max_workers=len(candidates)) as executor:
+            results = executor.map(
+                lambda port: SerialConfig.probe_port(port, baud, timeout, duration),
+                candidates)
+            found = [result for result in results if result is not None]
+        return sorted(found, key=lambda result: result['format'] is None)
+    
+    @staticmethod
+    def load_port_cache():
+        """Lee el último puerto que funcionó y su formato
+
+        Returns:
+            dict | None: {'port', 'baud', 'format'} o None si no hay caché válida
+        """
+        try:
+            with open(PORT_CACHE_FILE, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            return cached if cached.get('port') else None
+        except (OSError, ValueError, AttributeError):
+            return None
+    
+    @staticmethod
+    def get_cached_format(port, baud=DEFAULT_BAUD):
+        """Formato guardado para un puerto, si la caché es de ese puerto y velocidad
+
+        Returns:
+            str | None: 'binary', 'triple', 'raw', 'plain' o None
+        """
+        cached = SerialConfig.load_port_cache()
+        if cached and cached['port'] == port and cached.get('baud', baud) == baud:
+            return cached.get('format')
+        return None
+    
+    @staticmethod
+    def save_port_cache(port, baud=DEFAULT_BAUD, data_format=None):
+        """Guarda el último puerto que funcionó y su formato
+
+        Si no se indica el formato se conserva el guardado para el mismo puerto.
+        """
+        if data_format is None:
+            cached = SerialConfig.load_port_cache()
+            if cached and cached['port'] == port:
+                data_format = cached.get('format')
+        try:
+            with open(PORT_CACHE_FILE, 'w', encoding='utf-8') as f:
+                json.dump({'port': port, 'baud': baud, 'format': data_format}, f)
+        except OSError:
+            pass
+    
+    @staticmethod
+    def get_candidate_ports():
+        """Puertos a sondear según el sistema operativo"""
         system = platform.system()
-        
+        available_ports = SerialConfig.get_available_ports()
+
         if system == 'Linux':
-            # Buscar puertos USB comunes en Linux
+            # Puertos USB comunes en Linux
             common_ports = ['/dev/ttyUSB0', '/dev/ttyACM0', '/dev/ttyUSB1']
-            for port in common_ports:
-                if SerialConfig.validate_port(port):
-                    return port
+            usb_ports = [p for p in available_ports if 'USB' in p or 'ACM' in p]
+            return list(dict.fromkeys(usb_ports + common_ports))
         elif system == 'Windows':
-            # Buscar puertos COM en Windows
-            for i in range(1, 20):
-                port = f'COM{i}'
-                if SerialConfig.validate_port(port):
-                    return port
+            # Puertos COM enumerados; si no se enumera ninguno, COM1-COM19
+            return available_ports or [f'COM{i}' for i in range(1, 20)]
         elif system == 'Darwin':  # macOS
-            # Buscar puertos USB en macOS
-            available_ports = SerialConfig.get_available_ports()
-            usb_ports = [p for p in available_ports if 'usb' in p.lower()]
-            if usb_ports:
-                return usb_ports[0]
-        
-        return None
+            # Puertos USB en macOS
+            return [p for p in available_ports if 'usb' in p.lower()]
+        return available_ports
+    
+    @staticmethod
+    def get_default_port(baud=DEFAULT_BAUD):
+        """Obtiene el puerto por defecto según el sistema operativo
+
+        Se prueba primero el último puerto que funcionó; si no responde, se
+        sondean todos los candidatos en paralelo y se prefiere uno que envíe
+        datos reconocibles. El resultado se guarda en caché.
+        """
+        cached = SerialConfig.load_port_cache()
+        if cached:
+            result = SerialConfig.probe_port(cached['port'], cached.get('baud', baud))
+            if result is not None:
+                if result['format'] is None:
+                    result['format'] = cached.get('format')
+                SerialConfig.save_port_cache(result['port'], result['baud'], result['format'])
+                return result['port']
+
+        found = SerialConfig.discover_ports(SerialConfig.get_candidate_ports(), baud)
+        if not found:
+            return None
+
+        best = found[0]
+        SerialConfig.save_port_cache(best['port'], best['baud'], best['format'])
+        return best['port']
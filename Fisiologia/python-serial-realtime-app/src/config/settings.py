@@ -2,15 +2,53 @@
 Configuraciones generales. Incluye parametros del puerto serie, configuraciones de señal,
 filtros, análisis, interfaz y exportación de datos.
 """
+import os
 
 # === CONFIGURACIONES DEL PUERTO SERIE ===
 DEFAULT_PORT = '/dev/ttyUSB0'
 DEFAULT_BAUD = 115200
 TIMEOUT = 1
+SERIAL_BATCH_INTERVAL = 0.02  # s entre lotes de muestras enviados a la UI
+SERIAL_READ_TIMEOUT = 0.02  # s de espera máxima de cada lectura por bloques
+SERIAL_READ_CHUNK = 4096  # bytes pedidos cuando no hay datos en espera
+LINE_SNIFF_LINES = 20  # líneas observadas para detectar el formato de texto
+LINE_FORMAT_MAX_FAILURES = 50  # líneas inválidas antes de volver a detectar el formato
+
+# Protocolo de datos: 'text' (líneas ASCII) o 'binary' (tramas con CRC)
+SERIAL_PROTOCOL = 'text'
+BINARY_FRAME_CHANNELS = 3  # canales por trama (crudo, filtrado, normalizado)
+BINARY_FRAME_DTYPE = 'int16'  # 'int16' o 'float32'
+BINARY_RAW_CHANNEL = 0  # índice del canal crudo dentro de la trama
+
+# Cola acotada entre el hilo lector y la interfaz
+SERIAL_QUEUE_CAPACITY = 6000  # muestras (60 s a 100 Hz) antes de aplicar la política
+SERIAL_QUEUE_POLICY = 'drop_oldest'  # 'block', 'drop_oldest' o 'drop_newest'
+SERIAL_QUEUE_BLOCK_TIMEOUT = 0.5  # s de espera del lector con la política 'block'
+
+# Adquisición: 'thread' (hilo lector en el proceso de la UI) o 'process'
+# (proceso hijo que escribe en un anillo de memoria compartida)
+ACQUISITION_BACKEND = 'thread'
+SHARED_RING_CAPACITY = 60000  # muestras del anillo compartido (10 min a 100 Hz)
+PROCESS_STATS_INTERVAL = 1.0  # s entre estadísticas enviadas por el proceso hijo
+
+# Grabación continua de la sesión
+RECORDING_DIR = os.path.join(os.path.expanduser('~'), 'ppg_recordings')
+RECORDER_CHUNK_INTERVAL = 1.0  # s entre bloques bajados a disco (pérdida máxima ante un corte)
+RECORDER_FORMAT = 'csv'  # 'csv' o 'packed' (.ppgz: delta + zig-zag + bits, ~1 byte por muestra)
+
+# Autodetección de puertos
+PORT_PROBE_TIMEOUT = 0.1  # s de espera de cada lectura al sondear un puerto
+PORT_PROBE_DURATION = 0.5  # s máximos escuchando un puerto para identificar el formato
+PORT_CACHE_FILE = os.path.join(os.path.expanduser('~'), '.ppg_analyzer_port.json')
 
 # === CONFIGURACIONES DE SEÑAL ===
 SAMPLING_FREQUENCY = 100  # Hz
 MAX_POINTS = SAMPLING_FREQUENCY * 60  # Buffer de 60 segundos
+# Reloj de muestras: tiempos por contador con el período medido contra el host
+SAMPLE_CLOCK_DRIFT_GAIN = 0.01  # fracción del error corregida por lote
+SAMPLE_GAP_THRESHOLD = 0.25  # s de salto del reloj del host para declarar un hueco
+SAMPLE_CLOCK_RATE_GAIN = 0.05  # fracción del error de período corregida por lote
+SAMPLE_CLOCK_WARMUP = 3.0  # s durante los que el período medido se adopta directamente
 DEFAULT_WINDOW_SIZE = 5  # segundos para visualización
 
 # === CONFIGURACIONES DE FILTROS ===
@@ -18,6 +56,7 @@ DEFAULT_WINDOW_SIZE = 5  # segundos para visualización
 LOWCUT = 0.5  # Hz
 HIGHCUT = 8.0  # Hz
 FILTER_ORDER = 4
+FILTER_CACHE_SIZE = 64  # diseños de filtro (SOS) distintos que se conservan en la caché LRU
 
 # Filtro de media móvil
 DEFAULT_MOVING_AVERAGE_WINDOW = 5
@@ -35,6 +74,7 @@ OVERLAP_PERCENTAGE = 50  # % de solapamiento entre segmentos
 # Tamaños de ventana
 DEFAULT_WINDOW_WIDTH = 1200
 DEFAULT_WINDOW_HEIGHT = 700
+PLOT_DECIMATION_FACTOR = 4  # muestras por bloque entre niveles de la pirámide mín/máx
 
 # Colores de la interfaz
 COLORS = {
@@ -48,7 +88,7 @@ COLORS = {
 
 # === CONFIGURACIONES DE EXPORTACIÓN ===
 DEFAULT_EXPORT_FORMAT = 'csv'
-EXPORT_FORMATS = ['csv', 'xlsx', 'json']
+EXPORT_FORMATS = ['csv', 'xlsx', 'json', 'parquet', 'feather']  # parquet/feather requieren pyarrow
 
 # Columnas para exportación
 EXPORT_COLUMNS = [
@@ -57,3 +97,21 @@ EXPORT_COLUMNS = [
     'filtered_signal', 
     'normalized_signal'
 ]
+EXPORT_CHUNK_ROWS = 50000  # filas por bloque (avance y cancelación entre bloques)
+
+# Carga de CSV
+CSV_LOAD_CHUNK_ROWS = 200000  # filas por bloque en lecturas con progreso o recorte
+
+RANGE_INDEX_STRIDE = 1000  # filas entre entradas del índice tiempo → byte
+
+# Archivos de sesión HDF5 (.h5)
+SESSION_FILE_CHUNK = 8192  # muestras por bloque comprimido de cada canal
+SESSION_FILE_COMPRESSION = 4  # nivel gzip (0-9)
+
+# Grabaciones comprimidas (.ppgz)
+PACKED_BLOCK_SAMPLES = 65536  # muestras por bloque al convertir o exportar
+
+# Catálogo de grabaciones
+CATALOG_DB = os.path.join(os.path.expanduser('~'), '.ppg_analyzer_catalog.sqlite')
+CATALOG_WORKERS = None  # procesos para calcular resúmenes; None = uno por núcleo
+CATALOG_MIN_QUALITY = 0.7  # índice de calidad mínimo para guardar la FC media
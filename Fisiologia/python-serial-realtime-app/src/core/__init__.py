@@ -3,23 +3,36 @@ Módulo core - Funciones principales de procesamiento y análisis de señales PP
 
 Este módulo contiene:
 - Análisis de señales PPG (ppg_analisis.py)
-- Filtrado de señales (filter.py)
+- Filtrado de señales con caché LRU de diseños SOS (filter.py)
 - Procesamiento en tiempo real (ppg_processor.py)
 - Manejo de comunicación serial (serial_handler.py)
 """
+import importlib
 
-# Importar funciones de análisis PPG
-from .ppg_analisis import (
-    get_temporal_features,
-    get_dc_component,
-    get_ac_component
-)
+# Importación diferida (PEP 562): importar un submódulo como core.acquisition
+# (p. ej. en el proceso hijo de adquisición) no carga heartpy ni scipy
+_LAZY_ATTRS = {
+    # Funciones de análisis PPG
+    'get_temporal_features': '.ppg_analisis',
+    'get_dc_component': '.ppg_analisis',
+    'get_ac_component': '.ppg_analisis',
+    # Funciones de filtrado
+    'apply_filter': '.filter',
+    'linebase_removal': '.filter',
+    'design_filter': '.filter',
+    'filter_cache_info': '.filter',
+    'clear_filter_cache': '.filter',
+}
 
-# Importar funciones de filtrado
-from .filter import (
-    apply_filter,
-    linebase_removal
-)
+
+def __getattr__(name):
+    """Importa el submódulo de un atributo la primera vez que se pide"""
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
 
 # __all__ = [
 #     # Análisis PPG
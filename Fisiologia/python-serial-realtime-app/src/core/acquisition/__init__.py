@@ -0,0 +1,28 @@
+"""
+Submódulo acquisition - Lectura de datos desde el puerto serie sin dependencia de Qt.
+
+Este módulo contiene:
+- Lectura por bloques y separación de líneas (line_reader.py)
+- Decodificación de bloques leídos en muestras con tiempo (chunk_decoder.py)
+- Sesión de lectura en un hilo con callbacks (serial_session.py)
+- Lector asyncio con loop.add_reader para muchos puertos (async_reader.py)
+- Grabación continua con fsync periódico y recuperación (session_recorder.py)
+- Adquisición en un proceso hijo con memoria compartida (process_acquisition.py)
+"""
+
+from .line_reader import SerialLineReader, ReaderStats
+from .chunk_decoder import ChunkDecoder
+from .serial_session import SerialSession
+from .async_reader import AsyncSerialReader
+from .session_recorder import SessionRecorder
+from .process_acquisition import ProcessAcquisition
+
+__all__ = [
+    'SerialLineReader',
+    'ReaderStats',
+    'ChunkDecoder',
+    'SerialSession',
+    'AsyncSerialReader',
+    'SessionRecorder',
+    'ProcessAcquisition',
+]
@@ -0,0 +1,180 @@
+"""
+Lectura asyncio del puerto serie: un solo bucle de eventos atiende muchos puertos.
+
+En lugar de un hilo bloqueado en ``read()`` por puerto, el descriptor de cada
+puerto se registra con ``loop.add_reader``; cuando hay bytes disponibles se
+leen sin bloquear, se decodifican con ``ChunkDecoder`` y los lotes se publican
+en una ``asyncio.Queue`` para consumidores asíncronos.
+
+Requiere un puerto con ``fileno()`` (POSIX). En Windows usar ``SerialSession``.
+"""
+import asyncio
+import time
+from config.settings import SERIAL_READ_CHUNK, SERIAL_BATCH_INTERVAL, SAMPLING_FREQUENCY
+from core.processing.sample_batcher import SampleBatcher
+from .chunk_decoder import ChunkDecoder
+from .line_reader import SerialLineReader
+
+
+class AsyncSerialReader:
+    """Lector de un puerto serie basado en loop.add_reader
+
+    Uso::
+
+        reader = AsyncSerialReader(serial_port)
+        reader.start()
+        async for timestamps, values, gaps in reader:
+            ...
+    """
+
+    def __init__(self, serial_port, protocol='text', sample_rate=SAMPLING_FREQUENCY,
+                 batch_interval=SERIAL_BATCH_INTERVAL, max_batches=0):
+        """
+        Args:
+            serial_port (serial.Serial): puerto abierto; se pasa a modo no bloqueante
+            protocol (str, optional): 'text' o 'binary'. Defaults to 'text'.
+            sample_rate (float, optional): frecuencia nominal del reloj de muestras
+            batch_interval (float, optional): segundos entre lotes publicados
+            max_batches (int, optional): lotes máximos en la cola; 0 = sin límite.
+                Con la cola llena se descarta el lote más antiguo y sus muestras
+                se informan como hueco en el lote que se publica.
+
+        Raises:
+            ValueError: si el puerto no expone un descriptor de archivo
+        """
+        if not hasattr(serial_port, 'fileno'):
+            raise ValueError("El puerto no expone fileno(): use SerialSession")
+        self.serial_port = serial_port
+        # timeout=0: las lecturas devuelven solo lo disponible, sin bloquear
+        self.line_reader = SerialLineReader(serial_port, read_timeout=0,
+                                            chunk_size=SERIAL_READ_CHUNK)
+        self.decoder = ChunkDecoder(self.line_reader, protocol, sample_rate)
+        self.batch_interval = batch_interval
+        # Sin maxsize: el límite se aplica solo a los lotes, así el fin de la
+        # lectura (None o la excepción) siempre entra sin descartar nada más
+        self.batches = asyncio.Queue()
+        self.max_batches = max_batches
+        self.dropped_batches = 0
+        self.dropped_samples = 0
+        self.reading = False
+        self._batcher = SampleBatcher(batch_interval)
+        self._gaps = []
+        self._loop = None
+        self._flush_handle = None
+
+    def start(self, loop=None):
+        """Registra el descriptor del puerto en el bucle de eventos"""
+        if self.reading:
+            return
+        self._loop = loop or asyncio.get_running_loop()
+        self._loop.add_reader(self.serial_port.fileno(), self._on_readable)
+        self.reading = True
+        self._schedule_flush()
+
+    def stop(self):
+        """Quita el descriptor del bucle, publica lo pendiente y cierra la cola"""
+        if not self.reading:
+            return
+        self.reading = False
+        self._loop.remove_reader(self.serial_port.fileno())
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+        self._flush()
+        self._publish(None)
+
+    def is_reading(self):
+        """Verifica si el puerto está registrado en el bucle"""
+        return self.reading
+
+    def _on_readable(self):
+        """Callback del bucle: hay bytes disponibles en el puerto"""
+        try:
+            chunk = self.line_reader.read_chunk()
+            if not chunk:
+                # Legible pero sin datos: el dispositivo se desconectó
+                raise IOError(f"El puerto {self.serial_port.port} se cerró")
+            timestamps, values, gaps = self.decoder.decode(chunk, time.monotonic())
+        except Exception as e:
+            self.reading = False
+            self._loop.remove_reader(self.serial_port.fileno())
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+            # Entregar lo ya decodificado antes del error
+            self._flush()
+            self._publish(e)
+            return
+
+        if len(values):
+            self._batcher.add_many(timestamps, values)
+        self._gaps.extend(gaps)
+        if self._batcher.is_due():
+            self._flush()
+
+    def _schedule_flush(self):
+        """Publica periódicamente lo acumulado aunque no lleguen más bytes"""
+        if self.reading:
+            self._flush()
+            self._flush_handle = self._loop.call_later(self.batch_interval, self._schedule_flush)
+
+    def _flush(self):
+        """Publica el lote en curso con los huecos detectados"""
+        if not len(self._batcher) and not self._gaps:
+            return
+        timestamps, values = self._batcher.flush()
+        gaps, self._gaps = self._gaps, []
+        self._publish((timestamps, values, gaps))
+
+    def _publish(self, item):
+        """Encola un lote, una excepción o el fin de la lectura (None)
+
+        Si el consumidor está atrasado se descarta el lote más antiguo: sus
+        muestras pasan a ser un hueco y, junto con los huecos que llevaba, se
+        entregan en el lote que se publica.
+        """
+        if isinstance(item, tuple) and self.max_batches:
+            dropped_gaps = []
+            while self.batches.qsize() >= self.max_batches:
+                timestamps, values, gaps = self.batches.get_nowait()
+                self.dropped_batches += 1
+                dropped_gaps += gaps
+                if len(values):
+                    # Las muestras siguientes siguen en la cola: el hueco se
+                    # ubica en la última descartada, como en SampleQueue
+                    dropped_gaps.append((float(timestamps[-1]), len(values)))
+                    self.dropped_samples += len(values)
+            if dropped_gaps:
+                timestamps, values, gaps = item
+                item = (timestamps, values, dropped_gaps + gaps)
+        self.batches.put_nowait(item)
+
+    async def get_batch(self):
+        """Espera el próximo lote
+
+        Returns:
+            tuple | None: (timestamps, values, gaps), o None al terminar la lectura
+
+        Raises:
+            Exception: el error de lectura que detuvo el puerto
+        """
+        item = await self.batches.get()
+        if isinstance(item, Exception):
+            raise item
+        return item
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        item = await self.get_batch()
+        if item is None:
+            raise StopAsyncIteration
+        return item
+
+    def get_stats(self):
+        """Tasas del lector, estado del decodificador y lotes y muestras descartados"""
+        stats = self.line_reader.stats.snapshot()
+        stats.update(self.decoder.get_stats())
+        stats['samples_per_s'] = self.decoder.samples_per_s(stats)
+        stats['dropped_batches'] = self.dropped_batches
+        stats['dropped_samples'] = self.dropped_samples
+        return stats
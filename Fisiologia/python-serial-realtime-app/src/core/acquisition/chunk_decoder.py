@@ -0,0 +1,99 @@
+"""
+Conversión de bloques de bytes del puerto serie en muestras con tiempo.
+
+Reúne, para un puerto, la separación de líneas o el decodificador de tramas
+binarias, el parser del formato de texto y el reloj de muestras. Lo comparten
+el lector con hilo (``serial_session.py``) y el lector asyncio
+(``async_reader.py``).
+"""
+import numpy as np
+from config.settings import (LINE_SNIFF_LINES, LINE_FORMAT_MAX_FAILURES, BINARY_FRAME_CHANNELS,
+                             BINARY_FRAME_DTYPE, BINARY_RAW_CHANNEL, SAMPLING_FREQUENCY,
+                             SAMPLE_CLOCK_DRIFT_GAIN, SAMPLE_GAP_THRESHOLD, SAMPLE_CLOCK_RATE_GAIN,
+                             SAMPLE_CLOCK_WARMUP)
+from core.processing.binary_protocol import BinaryFrameDecoder
+from core.processing.line_format import LINE_FORMATS, LineFormatParser
+from core.processing.sample_clock import SampleClock
+
+
+class ChunkDecoder:
+    """Decodifica bloques leídos en (tiempos, valores raw) y huecos"""
+
+    def __init__(self, line_reader, protocol='text', sample_rate=SAMPLING_FREQUENCY,
+                 sample_clock=None, line_format=None):
+        """
+        Args:
+            line_reader (SerialLineReader): separador de líneas del puerto
+            protocol (str, optional): 'text' o 'binary'. Defaults to 'text'.
+            sample_rate (float, optional): frecuencia nominal del reloj de muestras
+            sample_clock (SampleClock, optional): reloj a continuar (p. ej. al
+                reanudar una lectura); por defecto uno nuevo
+            line_format (str, optional): formato de línea ya conocido (p. ej.
+                el guardado con el puerto); se usa sin detectarlo al inicio
+                y se vuelve a detectar si deja de coincidir
+
+        Raises:
+            ValueError: si el protocolo no es 'text' ni 'binary'
+        """
+        if protocol not in ('text', 'binary'):
+            raise ValueError(f"Protocolo desconocido: {protocol}")
+        self.line_reader = line_reader
+        self.protocol = protocol
+        self.frame_decoder = None
+        if protocol == 'binary':
+            self.frame_decoder = BinaryFrameDecoder(BINARY_FRAME_CHANNELS, BINARY_FRAME_DTYPE)
+        if line_format not in LINE_FORMATS:
+            line_format = None
+        self.line_parser = LineFormatParser(LINE_SNIFF_LINES, LINE_FORMAT_MAX_FAILURES, line_format)
+        if sample_clock is None:
+            sample_clock = SampleClock(sample_rate, SAMPLE_CLOCK_DRIFT_GAIN, SAMPLE_GAP_THRESHOLD,
+                                       rate_gain=SAMPLE_CLOCK_RATE_GAIN, warmup=SAMPLE_CLOCK_WARMUP)
+        self.sample_clock = sample_clock
+
+    def decode(self, chunk, host_time):
+        """Convierte un bloque de bytes en muestras
+
+        Args:
+            chunk (bytes): bloque leído (puede estar vacío)
+            host_time (float): time.monotonic() al leerlo
+
+        Returns:
+            tuple: (timestamps, values, gaps) - np.ndarray float64 con los
+            tiempos del reloj de muestras, valores raw y lista de huecos
+            (tiempo, muestras perdidas) detectados en este bloque
+        """
+        if self.frame_decoder is not None:
+            # Tramas binarias: decodificación vectorizada de todo el bloque
+            seq, frames = self.frame_decoder.feed(chunk)
+            values = frames[:, BINARY_RAW_CHANNEL]
+            if len(values):
+                # Tiempos por número de secuencia: los saltos son huecos
+                timestamps = self.sample_clock.stamp(len(values), host_time, seq)
+            else:
+                timestamps = np.empty(0, dtype=np.float64)
+        else:
+            # Formato detectado una vez; luego parseo por lotes sin regex
+            values = self.line_parser.parse(self.line_reader.split_lines(chunk))
+            # Un solo llamado al reloj del host por bloque leído
+            timestamps = self.sample_clock.stamp(len(values), host_time)
+        return timestamps, np.asarray(values, dtype=np.float64), self.sample_clock.pop_gaps()
+
+    def get_stats(self):
+        """Estado del reloj de muestras y del parser o decodificador binario
+
+        Returns:
+            dict: fs estimada, muestras perdidas y contadores de formato
+        """
+        stats = self.sample_clock.get_stats()
+        if self.frame_decoder is not None:
+            stats.update(self.frame_decoder.get_stats())
+        else:
+            stats.update(self.line_parser.get_stats())
+        return stats
+
+    def samples_per_s(self, reader_stats):
+        """Muestras por segundo a partir de las tasas del lector"""
+        if self.frame_decoder is not None:
+            # En modo binario no hay líneas: las muestras son tramas
+            return reader_stats['bytes_per_s'] / self.frame_decoder.frame_size
+        return reader_stats['lines_per_s']
@@ -0,0 +1,108 @@
+"""
+Lectura por bloques del puerto serie con separación de líneas propia.
+
+En lugar de consultar ``in_waiting`` en un bucle con pausas de 1 ms y llamar a
+``readline()`` por cada línea, se hace una lectura bloqueante con timeout de
+todo lo disponible y se separan las líneas en Python, conservando la línea
+parcial del final para la próxima lectura.
+"""
+import time
+
+
+class ReaderStats:
+    """Contadores de bytes, líneas y despertares del hilo lector"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        """Reinicia los contadores y la ventana de medición"""
+        self.total_bytes = 0
+        self.total_lines = 0
+        self.total_wakeups = 0
+        self._last = (time.monotonic(), 0, 0, 0)
+
+    def snapshot(self):
+        """Devuelve totales y tasas desde la última llamada
+
+        Returns:
+            dict: bytes/s, lines/s, wakeups/s y totales
+        """
+        now = time.monotonic()
+        t0, bytes0, lines0, wakeups0 = self._last
+        elapsed = max(now - t0, 1e-9)
+        stats = {
+            'bytes_per_s': (self.total_bytes - bytes0) / elapsed,
+            'lines_per_s': (self.total_lines - lines0) / elapsed,
+            'wakeups_per_s': (self.total_wakeups - wakeups0) / elapsed,
+            'total_bytes': self.total_bytes,
+            'total_lines': self.total_lines,
+            'total_wakeups': self.total_wakeups,
+        }
+        self._last = (now, self.total_bytes, self.total_lines, self.total_wakeups)
+        return stats
+
+
+class SerialLineReader:
+    """Lee el puerto serie por bloques y lo separa en líneas"""
+
+    def __init__(self, serial_port, read_timeout=0.02, chunk_size=4096,
+                 max_line_length=65536):
+        """
+        Args:
+            serial_port (serial.Serial): puerto abierto. Se ajusta su timeout.
+            read_timeout (float, optional): espera máxima de cada lectura (s).
+                Acota la latencia y la cantidad de despertares en reposo.
+            chunk_size (int, optional): bytes a pedir cuando no hay nada en espera.
+            max_line_length (int, optional): largo máximo de una línea parcial;
+                si se supera (p. ej. basura sin saltos de línea) se descarta.
+        """
+        self.serial_port = serial_port
+        self.serial_port.timeout = read_timeout
+        self.chunk_size = chunk_size
+        self.max_line_length = max_line_length
+        self.stats = ReaderStats()
+        self._carry = b''
+
+    def read_chunk(self):
+        """Lectura bloqueante (con timeout) de lo que haya disponible
+
+        Returns:
+            bytes: bloque leído, vacío si venció el timeout
+        """
+        chunk = self.serial_port.read(self.serial_port.in_waiting or self.chunk_size)
+        self.stats.total_wakeups += 1
+        self.stats.total_bytes += len(chunk)
+        return chunk
+
+    def split_lines(self, chunk):
+        """Separa un bloque en líneas completas y guarda el resto parcial
+
+        Returns:
+            list: líneas decodificadas, sin espacios ni líneas vacías
+        """
+        if not chunk:
+            return []
+
+        data = self._carry + chunk
+        parts = data.split(b'\n')
+        self._carry = parts.pop()
+        if len(self._carry) > self.max_line_length:
+            self._carry = b''
+
+        lines = []
+        for part in parts:
+            line = part.decode('utf-8', errors='ignore').strip()
+            if line:
+                lines.append(line)
+        self.stats.total_lines += len(lines)
+        return lines
+
+    def read_lines(self):
+        """Lee un bloque del puerto y devuelve las líneas completas"""
+        return self.split_lines(self.read_chunk())
+
+    def reset(self):
+        """Descarta la línea parcial pendiente y reinicia estadísticas"""
+        self._carry = b''
+        self.stats.reset()
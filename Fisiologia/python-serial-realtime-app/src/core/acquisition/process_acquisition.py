@@ -0,0 +1,274 @@
+"""
+Adquisición en un proceso hijo que escribe en un anillo de memoria compartida.
+
+El proceso hijo abre el puerto, corre ``SerialSession`` y, opcionalmente,
+graba con ``SessionRecorder`` (CSV o ``.ppgz`` según la extensión); cada lote se escribe en un ``SharedSampleRing``. El proceso
+principal solo lee las muestras nuevas del anillo (sin copias ni
+serialización), de modo que un análisis con SciPy, el dibujo o una
+exportación lenta en la interfaz no demoran la lectura del puerto: el hilo
+lector del hijo no compite por el GIL del proceso principal.
+
+Los eventos poco frecuentes (huecos, errores, estado y estadísticas) viajan
+por una ``multiprocessing.Queue``.
+
+El puerto lo abre el hijo recién cuando terminó de importar sus módulos y
+avisó que está listo; hasta ese momento el proceso principal puede mantenerlo
+abierto (``release_port``), de modo que el puerto queda cerrado solo entre
+ese aviso y la apertura en el hijo.
+
+Cada inicio lanza un hijo con su propio reloj de muestras; al reanudar, sus
+tiempos se desplazan para continuar desde el último tiempo entregado más la
+duración de la pausa, que se informa como hueco.
+"""
+import multiprocessing
+import queue
+import time
+from config.settings import (SERIAL_BATCH_INTERVAL, SAMPLING_FREQUENCY, SHARED_RING_CAPACITY,
+                             PROCESS_STATS_INTERVAL)
+from core.processing.shared_ring import SharedSampleRing
+
+
+def _acquisition_main(port, baudrate, protocol, sample_rate, ring_name, output,
+                      events, stop_event, open_event, line_format=None):
+    """Punto de entrada del proceso hijo: lee el puerto hasta que se pida detener"""
+    # Importaciones del hijo: pyserial y la sesión no hacen falta en el proceso principal
+    import serial
+    from core.acquisition.serial_session import SerialSession
+    from core.acquisition.session_recorder import SessionRecorder, format_for_path
+
+    # Listo para leer: el proceso principal suelta el puerto y da la orden de abrirlo
+    events.put(('ready', None))
+    while not open_event.wait(0.05):
+        if stop_event.is_set():
+            events.put(('status', False))
+            return
+
+    ring = SharedSampleRing(name=ring_name, writer=True)
+    recorder = None
+    start_time = []
+
+    def on_batch(timestamps, values):
+        ring.write(timestamps, values)
+        if recorder is not None:
+            if not start_time:
+                start_time.append(timestamps[0])
+            recorder.write(timestamps - start_time[0], values)
+
+    session = SerialSession(
+        SERIAL_BATCH_INTERVAL, protocol, sample_rate,
+        on_batch=on_batch,
+        on_gap=lambda gap_time, missing: events.put(('gap', (gap_time, missing))),
+        on_error=lambda message: events.put(('error', message)),
+    )
+    try:
+        serial_port = serial.serial_for_url(port, baudrate, timeout=1)
+    except Exception as e:
+        events.put(('error', str(e)))
+        ring.close()
+        return
+
+    try:
+        if output:
+            # Grabación en curso junto al destino: ante un corte queda el .part recuperable
+            recorder = SessionRecorder(output + '.part', fmt=format_for_path(output),
+                                       on_error=lambda message: events.put(
+                                           ('error', f"Error de grabación: {message}")))
+            recorder.start()
+        session.start(serial_port, line_format)
+        events.put(('status', True))
+        while session.is_reading() and not stop_event.wait(PROCESS_STATS_INTERVAL):
+            events.put(('stats', session.get_stats()))
+    except Exception as e:
+        events.put(('error', str(e)))
+    finally:
+        session.stop()
+        if serial_port.is_open:
+            serial_port.close()
+        if recorder is not None:
+            recorder.finalize(output)
+        ring.close()
+        events.put(('status', False))
+
+
+class ProcessAcquisition:
+    """Controla un proceso de adquisición y entrega sus lotes por callbacks
+
+    Los callbacks se invocan desde ``poll()``, en el hilo que la llame.
+    """
+
+    def __init__(self, protocol='text', sample_rate=SAMPLING_FREQUENCY,
+                 capacity=SHARED_RING_CAPACITY, output=None,
+                 on_batch=None, on_gap=None, on_error=None, on_status=None):
+        """
+        Args:
+            protocol (str, optional): 'text' o 'binary'. Defaults to 'text'.
+            sample_rate (float, optional): frecuencia nominal del reloj de muestras
+            capacity (int, optional): muestras del anillo compartido; es el
+                atraso máximo del proceso principal sin perder muestras
+            output (str, optional): grabación del proceso hijo (CSV o ``.ppgz``)
+            on_batch (callable, optional): (timestamps, valores raw); los
+                arreglos pueden ser vistas de solo lectura del anillo
+            on_gap (callable, optional): (tiempo del hueco, muestras perdidas)
+            on_error (callable, optional): mensaje de error del proceso hijo
+            on_status (callable, optional): True al iniciar y False al terminar
+
+        Raises:
+            ValueError: si el protocolo no es 'text' ni 'binary'
+        """
+        if protocol not in ('text', 'binary'):
+            raise ValueError(f"Protocolo desconocido: {protocol}")
+        self.protocol = protocol
+        self.sample_rate = sample_rate
+        self.capacity = capacity
+        self.output = output
+        self.on_batch = on_batch
+        self.on_gap = on_gap
+        self.on_error = on_error
+        self.on_status = on_status
+
+        # 'spawn': el hijo no hereda el estado de Qt ni hilos del proceso principal
+        self._context = multiprocessing.get_context('spawn')
+        self.process = None
+        self.ring = None
+        self._events = None
+        self._stop_event = None
+        self._open_event = None
+        self._release_port = None
+        self._cursor = 0
+        self._stats = {}
+        self.overrun_samples = 0
+        self._time_offset = 0.0
+        self._last_time = None
+        self._stopped_at = None
+
+    def start(self, port, baudrate, release_port=None, line_format=None):
+        """Lanza el proceso hijo que abre y lee el puerto
+
+        Args:
+            port (str): puerto o URL de pyserial
+            baudrate (int): velocidad del puerto
+            release_port (callable, optional): se llama desde ``poll()`` cuando
+                el hijo está listo, para cerrar el puerto en este proceso justo
+                antes de que el hijo lo abra. Sin él el hijo lo abre en cuanto
+                termina de importar.
+            line_format (str, optional): formato de línea conocido; el hijo
+                no lo detecta al inicio
+        """
+        if self.is_reading():
+            return
+        self._close_ring()
+        self.ring = SharedSampleRing(self.capacity)
+        self._cursor = 0
+        self._stats = {}
+        self.overrun_samples = 0
+        if self._last_time is not None:
+            # Reanudación: el reloj del hijo nuevo empieza en 0
+            pause = time.monotonic() - self._stopped_at
+            self._time_offset = self._last_time + pause
+            self._notify(self.on_gap, self._time_offset, int(round(pause * self.sample_rate)))
+        self._events = self._context.Queue()
+        self._stop_event = self._context.Event()
+        self._open_event = self._context.Event()
+        self._release_port = release_port
+        if release_port is None:
+            self._open_event.set()
+        self.process = self._context.Process(
+            target=_acquisition_main,
+            args=(port, baudrate, self.protocol, self.sample_rate, self.ring.name,
+                  self.output, self._events, self._stop_event, self._open_event, line_format),
+            daemon=True)
+        self.process.start()
+
+    def stop(self, timeout=2.0):
+        """Pide al hijo que termine, lo espera y entrega lo pendiente"""
+        if self.process is None:
+            return
+        self._stop_event.set()
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.poll()
+        self.process = None
+        self._stopped_at = time.monotonic()
+
+    def reset_clock(self):
+        """Vuelve los tiempos a 0 para una sesión nueva (no al reanudar)"""
+        self._time_offset = 0.0
+        self._last_time = None
+
+    def is_reading(self):
+        """Verifica si el proceso hijo está vivo"""
+        return self.process is not None and self.process.is_alive()
+
+    def poll(self):
+        """Entrega las muestras nuevas del anillo y los eventos del hijo
+
+        Returns:
+            int: muestras entregadas
+        """
+        if self.ring is None:
+            return 0
+
+        # Eventos primero: un hueco llega antes que las muestras que lo siguen
+        while True:
+            try:
+                kind, payload = self._events.get_nowait()
+            except queue.Empty:
+                break
+            if kind == 'ready':
+                if self._release_port is not None:
+                    self._release_port()
+                self._open_event.set()
+            elif kind == 'stats':
+                self._stats = payload
+            elif kind == 'gap':
+                gap_time, missing = payload
+                self._notify(self.on_gap, gap_time + self._time_offset, missing)
+            elif kind == 'error':
+                self._notify(self.on_error, payload)
+            elif kind == 'status':
+                self._notify(self.on_status, payload)
+
+        timestamps, values, self._cursor, lost = self.ring.read_since(self._cursor)
+        self.overrun_samples += lost
+        if lost and len(timestamps):
+            # Muestras sobrescritas en el anillo antes de leerlas: hueco
+            self._notify(self.on_gap, float(timestamps[0]) + self._time_offset, lost)
+        if len(timestamps):
+            if self._time_offset:
+                timestamps = timestamps + self._time_offset
+            self._last_time = float(timestamps[-1])
+            self._notify(self.on_batch, timestamps, values)
+        return len(timestamps)
+
+    def get_stats(self):
+        """Últimas estadísticas del lector del hijo y estado del anillo
+
+        Returns:
+            dict | None: estadísticas de ``SerialSession`` más ocupación y
+            muestras sobrescritas del anillo; None si no se inició
+        """
+        if self.ring is None:
+            return None
+        stats = dict(self._stats)
+        stats['ring_capacity'] = self.capacity
+        stats['ring_pending'] = self.ring.written - self._cursor
+        stats['ring_overrun'] = self.overrun_samples
+        return stats
+
+    def close(self):
+        """Detiene el hijo y libera la memoria compartida"""
+        self.stop()
+        self._close_ring()
+
+    def _close_ring(self):
+        if self.ring is not None:
+            self.ring.close()
+            self.ring = None
+
+    @staticmethod
+    def _notify(callback, *args):
+        """Invoca un callback si fue configurado"""
+        if callback is not None:
+            callback(*args)
@@ -0,0 +1,159 @@
+"""
+Sesión de lectura del puerto serie en un hilo propio, sin dependencia de Qt.
+
+Los resultados se entregan por callbacks que se invocan desde el hilo lector.
+La interfaz gráfica los reemite como señales en ``ui.serial_reader.SerialReader``;
+el modo sin interfaz (``headless.py``) los encola para procesarlos en el hilo
+principal.
+"""
+import threading
+import time
+from config.settings import (SERIAL_READ_TIMEOUT, SERIAL_READ_CHUNK, SERIAL_BATCH_INTERVAL,
+                             SAMPLING_FREQUENCY)
+from core.processing.sample_batcher import SampleBatcher
+from .chunk_decoder import ChunkDecoder
+from .line_reader import SerialLineReader
+
+
+class SerialSession:
+    """Lee un puerto serie en un hilo y entrega lotes de muestras por callbacks"""
+
+    def __init__(self, batch_interval=None, protocol='text', sample_rate=SAMPLING_FREQUENCY,
+                 on_batch=None, on_line=None, on_gap=None, on_error=None, on_status=None):
+        """
+        Args:
+            batch_interval (float, optional): si se indica (segundos), el hilo
+                parsea las líneas y llama a on_batch con un lote cada intervalo
+                en lugar de on_line por cada línea.
+            protocol (str, optional): 'text' o 'binary'. El modo binario
+                siempre entrega lotes.
+            sample_rate (float, optional): frecuencia nominal (Hz) del reloj de muestras
+            on_batch (callable, optional): (timestamps, valores raw) como np.ndarray
+            on_line (callable, optional): línea de texto (modo sin lotes)
+            on_gap (callable, optional): (tiempo del hueco, muestras perdidas)
+            on_error (callable, optional): mensaje de error; la lectura se detiene
+            on_status (callable, optional): True al iniciar y False al detener
+
+        Raises:
+            ValueError: si el protocolo no es 'text' ni 'binary'
+        """
+        if protocol not in ('text', 'binary'):
+            raise ValueError(f"Protocolo desconocido: {protocol}")
+        if protocol == 'binary' and not batch_interval:
+            batch_interval = SERIAL_BATCH_INTERVAL
+
+        self.batch_interval = batch_interval
+        self.protocol = protocol
+        self.sample_rate = sample_rate
+        self.on_batch = on_batch
+        self.on_line = on_line
+        self.on_gap = on_gap
+        self.on_error = on_error
+        self.on_status = on_status
+
+        self.serial_port = None
+        self.reading = False
+        self.reading_thread = None
+        self.line_reader = None
+        self.decoder = None
+        self._clock_reset_pending = False
+
+    def start(self, serial_port, line_format=None):
+        """Inicia la lectura del puerto (ya abierto) en un hilo propio
+
+        Args:
+            serial_port (serial.Serial): puerto abierto
+            line_format (str, optional): formato de línea conocido; evita
+                detectarlo con las primeras líneas
+        """
+        if self.reading:
+            return
+
+        self.serial_port = serial_port
+        self.line_reader = SerialLineReader(serial_port, SERIAL_READ_TIMEOUT, SERIAL_READ_CHUNK)
+        # Formato y contadores desde cero; el reloj de muestras sigue corriendo
+        # al reanudar, de modo que la pausa queda como hueco y no como un
+        # retroceso de los tiempos
+        clock = self.decoder.sample_clock if self.decoder is not None else None
+        self.decoder = ChunkDecoder(self.line_reader, self.protocol, self.sample_rate, clock,
+                                    line_format)
+        self.reading = True
+        self.reading_thread = threading.Thread(target=self._read_loop, daemon=True)
+        self.reading_thread.start()
+        self._notify(self.on_status, True)
+
+    def stop(self):
+        """Detiene la lectura y espera al hilo lector"""
+        self.reading = False
+        if self.reading_thread and self.reading_thread.is_alive():
+            self.reading_thread.join(timeout=1.0)
+        self._notify(self.on_status, False)
+
+    def is_reading(self):
+        """Verifica si está leyendo datos"""
+        return self.reading
+
+    def reset_clock(self):
+        """Reinicia el reloj de muestras: la próxima muestra vuelve a tiempo 0
+
+        Para una sesión nueva; entre pausas el reloj no se reinicia. Si la
+        lectura está en curso, lo reinicia el hilo lector antes del próximo bloque.
+        """
+        if self.reading:
+            self._clock_reset_pending = True
+        elif self.decoder is not None:
+            self.decoder.sample_clock.reset()
+
+    def _read_loop(self):
+        """Bucle principal de lectura de datos"""
+        batcher = SampleBatcher(self.batch_interval) if self.batch_interval else None
+        while self.reading and self.serial_port and self.serial_port.is_open:
+            try:
+                # Lectura bloqueante con timeout: no hay espera activa en reposo
+                if batcher is None:
+                    for line in self.line_reader.read_lines():
+                        # Entregar la línea completa para procesamiento posterior
+                        self._notify(self.on_line, line)
+                    continue
+
+                if self._clock_reset_pending:
+                    self._clock_reset_pending = False
+                    self.decoder.sample_clock.reset()
+                timestamps, values, gaps = self.decoder.decode(self.line_reader.read_chunk(),
+                                                               time.monotonic())
+                if len(values):
+                    batcher.add_many(timestamps, values)
+                for gap_time, missing in gaps:
+                    self._notify(self.on_gap, gap_time, missing)
+
+                if batcher.is_due():
+                    self._notify(self.on_batch, *batcher.flush())
+            except Exception as e:
+                self._notify(self.on_error, str(e))
+                self.reading = False
+                break
+
+        # Entregar las muestras pendientes al detener la lectura
+        if batcher is not None and len(batcher):
+            self._notify(self.on_batch, *batcher.flush())
+
+    def get_stats(self):
+        """Obtiene tasas del lector, estado del reloj de muestras y del parser
+
+        Returns:
+            dict | None: bytes/s, líneas/s, lecturas/s, muestras/s, fs estimada,
+            muestras perdidas y contadores del parser o del decodificador
+            binario; None si la lectura no se inició
+        """
+        if self.line_reader is None:
+            return None
+        stats = self.line_reader.stats.snapshot()
+        stats.update(self.decoder.get_stats())
+        stats['samples_per_s'] = self.decoder.samples_per_s(stats)
+        return stats
+
+    @staticmethod
+    def _notify(callback, *args):
+        """Invoca un callback si fue configurado"""
+        if callback is not None:
+            callback(*args)
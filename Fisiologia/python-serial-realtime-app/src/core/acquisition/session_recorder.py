@@ -0,0 +1,289 @@
+"""
+Grabación continua y a prueba de cortes de toda la sesión de adquisición.
+
+Un hilo propio recibe los lotes de muestras y los agrega a un CSV en curso
+(``*.csv.part``) con las columnas de exportación (``timestamp``,
+``raw_signal`` de ``EXPORT_COLUMNS``), así guardar la sesión en CSV da el
+mismo esquema que cualquier otra exportación. Cada ``chunk_interval`` segundos baja a disco el bloque
+acumulado (``flush`` + ``os.fsync``) y anota en un índice (``*.csv.part.idx``,
+una línea JSON por bloque) el tamaño del archivo con ese bloque completo.
+
+Con ``fmt='packed'`` cada bloque se graba con ``delta_codec`` en lugar de
+texto (archivo ``.ppgz``, ~1 byte por muestra con cuentas enteras del ADC).
+
+Si la aplicación se cierra de forma inesperada se pierde a lo sumo el último
+bloque: ``SessionRecorder.recover`` recorta el archivo al último bloque
+indexado y ``restore`` además lo deja con su nombre definitivo (la interfaz
+ofrece hacerlo al iniciar con lo que devuelve ``pending_recordings``). Guardar la sesión solo cierra el archivo y lo mueve a su destino.
+
+La usan la interfaz, el modo sin interfaz (``headless.py``) y el proceso hijo
+de ``process_acquisition``: toda grabación de muestras pasa por aquí.
+"""
+import io
+import json
+import os
+import queue
+import shutil
+import threading
+import time
+import numpy as np
+from config.settings import EXPORT_COLUMNS, RECORDER_CHUNK_INTERVAL, RECORDER_FORMAT
+from core.processing.delta_codec import PACKED_EXTENSION, encode_block, file_header
+
+CSV_HEADER = ','.join(EXPORT_COLUMNS[:2]) + '\n'
+RECORDER_FORMATS = ('csv', 'packed')
+
+
+def format_for_path(path):
+    """Formato de grabación según la extensión del destino
+
+    Args:
+        path (str): archivo final (``.ppgz`` → 'packed'; cualquier otro → 'csv')
+
+    Returns:
+        str: uno de ``RECORDER_FORMATS``
+    """
+    return 'packed' if os.path.splitext(path)[1].lower() == PACKED_EXTENSION else 'csv'
+
+
+def value_format(values):
+    """Formato de la columna raw que no pierde dígitos
+
+    Las cuentas enteras del ADC (también las de 24 bits) se escriben con
+    ``%d``; cualquier otro valor, con los 17 dígitos significativos que
+    reproducen exactamente un float64.
+
+    Args:
+        values (np.ndarray): valores del lote
+
+    Returns:
+        str: formato para ``np.savetxt``
+    """
+    values = np.asarray(values)
+    if np.all(np.isfinite(values)) and np.array_equal(values, np.round(values)):
+        return '%d'
+    return '%.17g'
+
+
+class SessionRecorder:
+    """Graba lotes de muestras en un archivo de solo agregado con fsync periódico"""
+
+    def __init__(self, path, chunk_interval=RECORDER_CHUNK_INTERVAL, on_error=None,
+                 fmt=RECORDER_FORMAT):
+        """
+        Args:
+            path (str): archivo en curso (se sugiere la extensión ``.csv.part``
+                o ``.ppgz.part``); si existe, se recorta a su último bloque
+                completo y la grabación continúa al final
+            chunk_interval (float, optional): segundos entre bloques bajados a disco
+            on_error (callable, optional): mensaje de error; se llama desde el
+                hilo de grabación, que se detiene
+            fmt (str, optional): 'csv' (texto) o 'packed' (``delta_codec``)
+
+        Raises:
+            ValueError: si el formato no es uno de ``RECORDER_FORMATS``
+        """
+        if fmt not in RECORDER_FORMATS:
+            raise ValueError(f"Formato de grabación no soportado: {fmt}")
+        self.path = path
+        self.fmt = fmt
+        self.index_path = path + '.idx'
+        self.chunk_interval = chunk_interval
+        self.on_error = on_error
+
+        self.samples = 0
+        self.chunks = 0
+        self.error = None
+        self._queue = queue.Queue()
+        self._thread = None
+        self._file = None
+        self._index = None
+
+    def start(self):
+        """Abre los archivos y lanza el hilo de grabación"""
+        if self.is_recording():
+            return
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        if os.path.exists(self.path):
+            self.recover(self.path)
+            entries = self._index_entries(self.index_path)
+            self.chunks = len(entries)
+            self.samples = entries[-1]['samples'] if entries else 0
+        self._file = open(self.path, 'ab')
+        self._index = open(self.index_path, 'a', encoding='utf-8')
+        if self._file.tell() == 0:
+            # El encabezado es el bloque 0: un archivo recuperado siempre lo conserva
+            header = CSV_HEADER.encode() if self.fmt == 'csv' else file_header()
+            self._commit(header, 0, None)
+        self.error = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def is_recording(self):
+        """Verifica si el hilo de grabación está activo"""
+        return self._thread is not None and self._thread.is_alive()
+
+    def write(self, timestamps, values):
+        """Encola un lote para grabar (no bloquea)
+
+        Args:
+            timestamps (np.ndarray): tiempos relativos (s) de cada muestra
+            values (np.ndarray): valores raw
+        """
+        if not len(timestamps):
+            return
+        # Copias: los lotes pueden ser vistas de buffers que se reutilizan
+        self._queue.put((np.array(timestamps, dtype=np.float64),
+                         np.array(values, dtype=np.float64)))
+
+    def _run(self):
+        """Bucle del hilo: acumula lotes y baja un bloque cada chunk_interval"""
+        pending = []
+        next_commit = time.monotonic() + self.chunk_interval
+        running = True
+        try:
+            while running:
+                try:
+                    item = self._queue.get(timeout=max(next_commit - time.monotonic(), 0))
+                    if item is None:
+                        running = False
+                    else:
+                        pending.append(item)
+                except queue.Empty:
+                    pass
+
+                if pending and (not running or time.monotonic() >= next_commit):
+                    timestamps = np.concatenate([t for t, _ in pending])
+                    values = np.concatenate([v for _, v in pending])
+                    pending = []
+                    self._commit(self._encode(timestamps, values), len(timestamps),
+                                 timestamps[-1])
+                if time.monotonic() >= next_commit:
+                    next_commit = time.monotonic() + self.chunk_interval
+        except Exception as e:
+            self.error = str(e)
+            if self.on_error is not None:
+                self.on_error(self.error)
+
+    def _encode(self, timestamps, values):
+        """Bytes de un bloque en el formato de la grabación"""
+        if self.fmt == 'packed':
+            return encode_block(timestamps, values)
+        text = io.StringIO()
+        np.savetxt(text, np.column_stack((timestamps, values)),
+                   fmt=('%.6f', value_format(values)), delimiter=',')
+        return text.getvalue().encode()
+
+    def _commit(self, data, samples, last_time):
+        """Escribe un bloque, lo baja a disco y lo registra en el índice"""
+        self._file.write(data)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self.samples += samples
+        entry = {'chunk': self.chunks, 'offset': self._file.tell(),
+                 'samples': self.samples, 'last_time': last_time}
+        self._index.write(json.dumps(entry) + '\n')
+        self._index.flush()
+        os.fsync(self._index.fileno())
+        self.chunks += 1
+
+    def stop(self):
+        """Graba lo pendiente y cierra los archivos (el archivo en curso se conserva)"""
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+        for handle in (self._file, self._index):
+            if handle is not None:
+                handle.close()
+        self._file = None
+        self._index = None
+
+    def finalize(self, destination):
+        """Cierra la grabación y mueve el archivo a su destino definitivo
+
+        Args:
+            destination (str): ruta final (``.csv`` o ``.ppgz`` según el formato)
+
+        Returns:
+            str: ruta final
+        """
+        self.stop()
+        try:
+            os.replace(self.path, destination)
+        except OSError:
+            # Otro sistema de archivos: copiar y borrar
+            shutil.move(self.path, destination)
+        if os.path.exists(self.index_path):
+            os.remove(self.index_path)
+        return destination
+
+    def discard(self):
+        """Detiene la grabación y elimina el archivo en curso y su índice"""
+        self.stop()
+        for path in (self.path, self.index_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    @staticmethod
+    def recover(path):
+        """Recorta una grabación interrumpida a su último bloque completo
+
+        Args:
+            path (str): archivo en curso que quedó tras un cierre inesperado
+
+        Returns:
+            int: muestras conservadas
+        """
+        entries = SessionRecorder._index_entries(path + '.idx')
+        offset = entries[-1]['offset'] if entries else 0
+        with open(path, 'r+b') as data:
+            data.truncate(offset)
+        # Reescribir el índice sin una posible línea final a medio escribir
+        with open(path + '.idx', 'w', encoding='utf-8') as index:
+            for entry in entries:
+                index.write(json.dumps(entry) + '\n')
+        return entries[-1]['samples'] if entries else 0
+
+    @staticmethod
+    def restore(path):
+        """Recupera una grabación interrumpida y la deja con su nombre final
+
+        Args:
+            path (str): archivo en curso (``*.part``)
+
+        Returns:
+            tuple: (ruta final sin ``.part``, muestras conservadas)
+        """
+        samples = SessionRecorder.recover(path)
+        destination = path[:-len('.part')] if path.endswith('.part') else path
+        os.replace(path, destination)
+        os.remove(path + '.idx')
+        return destination, samples
+
+    @staticmethod
+    def _index_entries(index_path):
+        """Entradas completas del índice (se detiene en la primera inválida)"""
+        entries = []
+        if os.path.exists(index_path):
+            with open(index_path, encoding='utf-8') as index:
+                for line in index:
+                    try:
+                        entries.append(json.loads(line))
+                    except ValueError:
+                        break
+        return entries
+
+    @staticmethod
+    def pending_recordings(directory):
+        """Grabaciones en curso que quedaron en una carpeta (p. ej. tras un corte)
+
+        Returns:
+            list[str]: rutas de los archivos ``*.part``
+        """
+        if not os.path.isdir(directory):
+            return []
+        return sorted(os.path.join(directory, name) for name in os.listdir(directory)
+                      if name.endswith('.part'))
@@ -1,25 +1,78 @@
-from scipy.signal import butter, filtfilt, firwin, lfilter
+from functools import lru_cache
+from scipy.signal import butter, firwin, lfilter, sosfiltfilt
 import numpy as np
-from config.settings import LOWCUT, HIGHCUT, FILTER_ORDER
+from config.settings import LOWCUT, HIGHCUT, FILTER_ORDER, FILTER_CACHE_SIZE
 
-def apply_filter(data, lowcut, highcut, fs, order=4):
-    """Aplica un filtro butterworth pasa banda a los datos
+@lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _design_sos(btype, cutoffs, fs, order):
+    """Diseño Butterworth en secciones de segundo orden (una vez por clave)"""
+    return butter(order, cutoffs, btype=btype, fs=fs, output='sos')
+
+def design_filter(btype, cutoffs, fs, order=FILTER_ORDER):
+    """Coeficientes SOS de un filtro Butterworth, desde una caché LRU
+    
+    La vista previa y los procesos por lotes piden miles de veces el mismo
+    filtro: solo el primer pedido de cada (tipo, cortes, fs, orden) llama a
+    ``scipy.signal.butter``.
+    
     Args:
-        data (np.ndarray): señal de entrada
+        btype (str): 'lowpass', 'highpass', 'bandpass' o 'bandstop'
+            (también 'low', 'high', 'band')
+        cutoffs (float | tuple): frecuencia de corte, o (baja, alta) en Hz
+        fs (float): frecuencia de muestreo
+        order (int, optional): orden del filtro. Defaults to FILTER_ORDER.
+
+    Returns:
+        np.ndarray: matriz SOS (secciones x 6); es una copia, modificarla no
+        altera la caché
+    """
+    if np.ndim(cutoffs):
+        cutoffs = tuple(float(c) for c in cutoffs)
+    else:
+        cutoffs = float(cutoffs)
+    return _design_sos(btype, cutoffs, float(fs), int(order)).copy()
+
+def filter_cache_info():
+    """Estadísticas de la caché de diseños
+    
+    Returns:
+        CacheInfo: ``hits`` (aciertos), ``misses`` (diseños calculados),
+        ``maxsize`` y ``currsize``
+    """
+    return _design_sos.cache_info()
+
+def clear_filter_cache():
+    """Vacía la caché de diseños y sus contadores"""
+    _design_sos.cache_clear()
+
+
+def apply_filter(data, lowcut, highcut, fs, order=4, axis=-1):
+    """Aplica un filtro butterworth pasa banda de fase cero a los datos
+    
+    Usa secciones de segundo orden (``sosfiltfilt``), estables aun con
+    órdenes altos y bandas angostas. Además de una señal 1-D acepta un
+    arreglo 2-D (canales x muestras, o registros x muestras de varios
+    sujetos) que se filtra completo a lo largo de ``axis`` en una sola
+    llamada.
+    
+    Args:
+        data (np.ndarray): señal de entrada, 1-D o N-D
         lowcut (float): frecuencia de corte baja
         highcut (float): frecuencia de corte alta
         fs (int): frecuencia de muestreo
         order (int, optional): orden del filtro. Defaults to 4.
+        axis (int, optional): eje de las muestras. Defaults to -1.
 
     Returns:
-        np.ndarray: señal filtrada
+        np.ndarray: señal filtrada, con la misma forma que ``data``
         
     Raises:
         ValueError: si los parámetros no son válidos
     """
     # Validar que hay datos
-    if data is None or len(data) == 0:
+    if data is None or np.size(data) == 0:
         raise ValueError("No hay datos para filtrar")
+    data = np.asarray(data, dtype=np.float64)
     
     # Validar parámetros del filtro
     if lowcut >= highcut:
@@ -35,11 +88,9 @@ def apply_filter(data, lowcut, highcut, fs, order=4):
     if order < 1:
         raise ValueError("El orden del filtro debe ser al menos 1")
     
-    # Aplicar el filtro
-    low = lowcut / nyq
-    high = highcut / nyq
-    b, a = butter(order, [low, high], btype="band")
-    y = filtfilt(b, a, data)
+    # Aplicar el filtro (diseño desde la caché)
+    sos = design_filter('bandpass', (lowcut, highcut), fs, order)
+    y = sosfiltfilt(sos, data, axis=axis)
     return y
 
 def linebase_removal(data, fs):
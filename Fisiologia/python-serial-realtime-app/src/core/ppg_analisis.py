@@ -4,20 +4,21 @@ Lo que hace es analizar señales PPG para extraer características temporales y
 Usa la librería HeartPy para el análisis temporal y SciPy para el análisis de amplitud """
 import numpy as np
 import heartpy as hp
-from scipy.signal import butter, filtfilt
+from scipy.signal import sosfiltfilt
 import pandas as pd
+from core.filter import design_filter
 
 # --- Filtros ---
 
-def _butter_lowpass_filter(data, cutoff, fs, order=4):
+def _butter_lowpass_filter(data, cutoff, fs, order=4, axis=-1):
     """
     Aplica un filtro Butterworth low-pass de orden 'order'.
-    Usa filtfilt para evitar desfase.
+    Usa sosfiltfilt para evitar desfase; el diseño sale de la caché de
+    ``core.filter``. Con un arreglo 2-D filtra todas las filas a lo largo
+    de ``axis``.
     """
-    nyq = 0.5 * fs  # Frecuencia de Nyquist
-    normal_cutoff = cutoff / nyq
-    b, a = butter(order, normal_cutoff, btype='low', analog=False)
-    y = filtfilt(b, a, data)
+    sos = design_filter('lowpass', cutoff, fs, order)
+    y = sosfiltfilt(sos, data, axis=axis)
     return y
 
 # --- Funciones Principales del Módulo ---
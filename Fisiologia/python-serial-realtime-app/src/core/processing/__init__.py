@@ -0,0 +1,61 @@
+"""
+Submódulo processing - Estructuras de datos para el procesamiento en tiempo real.
+
+Este módulo contiene:
+- Buffer circular preasignado (ring_buffer.py)
+- Anillo de muestras en memoria compartida entre procesos (shared_ring.py)
+- Almacén columnar creciente para la sesión completa (column_store.py)
+- Pirámide de decimación mín/máx para graficar (minmax_pyramid.py)
+- Parseo de líneas del puerto serie (line_parser.py)
+- Detección del formato de línea y parseo por lotes (line_format.py)
+- Acumulación de muestras en lotes (sample_batcher.py)
+- Cola acotada entre hilo lector y consumidor (sample_queue.py)
+- Protocolo binario por tramas (binary_protocol.py)
+- Códec delta + zig-zag + empaquetado de bits para grabaciones (delta_codec.py)
+- Reloj de muestras que sigue la tasa real del dispositivo y detecta huecos (sample_clock.py)
+- Procesador en tiempo real sin Qt: buffers y FC/HRV (stream_processor.py)
+"""
+import importlib
+
+from .ring_buffer import RingBuffer
+from .shared_ring import SharedSampleRing
+from .column_store import ColumnStore
+from .minmax_pyramid import MinMaxPyramid
+from .line_parser import parse_raw_value
+from .line_format import LineFormatParser, sniff_line_format
+from .sample_batcher import SampleBatcher
+from .sample_queue import SampleQueue, QUEUE_POLICIES
+from .binary_protocol import BinaryFrameDecoder, encode_frames
+from .delta_codec import encode_deltas, decode_deltas, encode_block, decode_block
+from .sample_clock import SampleClock
+
+__all__ = [
+    'RingBuffer',
+    'SharedSampleRing',
+    'ColumnStore',
+    'MinMaxPyramid',
+    'parse_raw_value',
+    'LineFormatParser',
+    'sniff_line_format',
+    'SampleBatcher',
+    'SampleQueue',
+    'QUEUE_POLICIES',
+    'BinaryFrameDecoder',
+    'encode_frames',
+    'encode_deltas',
+    'decode_deltas',
+    'encode_block',
+    'decode_block',
+    'SampleClock',
+    'PPGStreamProcessor',
+]
+
+
+def __getattr__(name):
+    """PPGStreamProcessor se importa al pedirlo: carga scipy y el lector del
+    proceso hijo no lo usa"""
+    if name == 'PPGStreamProcessor':
+        value = importlib.import_module('.stream_processor', __name__).PPGStreamProcessor
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
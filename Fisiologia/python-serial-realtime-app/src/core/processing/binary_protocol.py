@@ -0,0 +1,190 @@
+"""
+Protocolo binario por tramas para el puerto serie.
+
+Formato de cada trama (little-endian, sin relleno)::
+
+    | sync (u16) | secuencia (u16) | N canales (int16 o float32) | CRC (u16) |
+
+El CRC es CRC-16/CCITT-FALSE (``binascii.crc_hqx`` con valor inicial 0xFFFF)
+calculado sobre la secuencia y los canales. El decodificador interpreta cada
+bloque leído con ``np.frombuffer`` sobre un arreglo estructurado, sin parsear
+texto, y se resincroniza buscando la palabra de sincronismo cuando una trama
+llega corrupta.
+"""
+from binascii import crc_hqx
+import struct
+import numpy as np
+from config.constants import BINARY_FRAME_SYNC
+
+
+def frame_dtype(n_channels, channel_dtype='int16'):
+    """Tipo estructurado NumPy de una trama
+
+    Args:
+        n_channels (int): cantidad de canales por trama
+        channel_dtype (str, optional): 'int16' o 'float32'. Defaults to 'int16'.
+
+    Returns:
+        np.dtype: dtype con campos sync, seq, data y crc
+    """
+    channel_dtype = np.dtype(channel_dtype).newbyteorder('<')
+    if channel_dtype not in (np.dtype('<i2'), np.dtype('<f4')):
+        raise ValueError("El tipo de canal debe ser int16 o float32")
+    if n_channels < 1:
+        raise ValueError("La trama debe tener al menos un canal")
+    return np.dtype([
+        ('sync', '<u2'),
+        ('seq', '<u2'),
+        ('data', channel_dtype, (n_channels,)),
+        ('crc', '<u2'),
+    ])
+
+
+def encode_frames(values, start_seq=0, channel_dtype='int16', sync=BINARY_FRAME_SYNC):
+    """Codifica muestras como tramas binarias (útil para simuladores y pruebas)
+
+    Args:
+        values (array-like): matriz (tramas x canales)
+        start_seq (int, optional): número de secuencia de la primera trama
+        channel_dtype (str, optional): 'int16' o 'float32'
+        sync (int, optional): palabra de sincronismo
+
+    Returns:
+        bytes: tramas concatenadas
+    """
+    values = np.atleast_2d(np.asarray(values))
+    dtype = frame_dtype(values.shape[1], channel_dtype)
+    frames = np.zeros(len(values), dtype=dtype)
+    frames['sync'] = sync
+    frames['seq'] = (start_seq + np.arange(len(values))) & 0xFFFF
+    frames['data'] = values
+
+    raw = bytearray(frames.tobytes())
+    size = dtype.itemsize
+    for off in range(0, len(raw), size):
+        crc = crc_hqx(raw[off + 2:off + size - 2], 0xFFFF)
+        raw[off + size - 2:off + size] = struct.pack('<H', crc)
+    return bytes(raw)
+
+
+class BinaryFrameDecoder:
+    """Decodificador incremental de tramas binarias con resincronización"""
+
+    def __init__(self, n_channels=3, channel_dtype='int16', sync=BINARY_FRAME_SYNC):
+        """
+        Args:
+            n_channels (int, optional): canales por trama. Defaults to 3.
+            channel_dtype (str, optional): 'int16' o 'float32'. Defaults to 'int16'.
+            sync (int, optional): palabra de sincronismo.
+        """
+        self.dtype = frame_dtype(n_channels, channel_dtype)
+        self.frame_size = self.dtype.itemsize
+        self.n_channels = n_channels
+        self.sync = sync
+        self._sync_bytes = struct.pack('<H', sync)
+        self._buffer = bytearray()
+        self._last_seq = None
+
+        # Estadísticas
+        self.frames_ok = 0
+        self.crc_errors = 0
+        self.bytes_discarded = 0
+        self.lost_frames = 0
+
+    def feed(self, chunk):
+        """Agrega bytes leídos y decodifica todas las tramas completas
+
+        Args:
+            chunk (bytes): bloque leído del puerto
+
+        Returns:
+            tuple: (seq, data) - np.ndarray uint16 con las secuencias y
+            np.ndarray (tramas x canales) con los valores
+        """
+        if chunk:
+            self._buffer += chunk
+        buf = self._buffer
+        size = self.frame_size
+        n = len(buf)
+        pos = 0
+        seq_parts = []
+        data_parts = []
+
+        while n - pos >= size:
+            start = buf.find(self._sync_bytes, pos)
+            if start < 0:
+                # Conservar el último byte por si es el inicio de un sync
+                self.bytes_discarded += (n - 1) - pos
+                pos = n - 1
+                break
+            self.bytes_discarded += start - pos
+            pos = start
+
+            count = (n - pos) // size
+            if count == 0:
+                break
+
+            frames = np.frombuffer(buf, dtype=self.dtype, count=count, offset=pos)
+            bad_sync = frames['sync'] != self.sync
+            valid = int(np.argmax(bad_sync)) if bad_sync.any() else count
+
+            # Verificación de CRC trama por trama sobre el mismo buffer
+            with memoryview(buf) as view:
+                crcs = frames['crc']
+                for i in range(valid):
+                    off = pos + i * size
+                    if crc_hqx(view[off + 2:off + size - 2], 0xFFFF) != crcs[i]:
+                        valid = i
+                        self.crc_errors += 1
+                        break
+
+            if valid:
+                seq_parts.append(frames['seq'][:valid].copy())
+                data_parts.append(frames['data'][:valid].copy())
+            del frames, crcs, bad_sync
+
+            pos += valid * size
+            if valid < count:
+                # Trama corrupta: saltar su sync y buscar el siguiente
+                pos += 1
+                self.bytes_discarded += 1
+
+        del buf[:pos]
+
+        if not seq_parts:
+            return (np.empty(0, dtype=np.uint16),
+                    np.empty((0, self.n_channels), dtype=self.dtype['data'].base))
+
+        seq = np.concatenate(seq_parts)
+        data = np.concatenate(data_parts)
+        self._count_lost(seq)
+        self.frames_ok += len(seq)
+        return seq, data
+
+    def _count_lost(self, seq):
+        """Acumula las tramas perdidas según los saltos de secuencia"""
+        if self._last_seq is not None:
+            seq_all = np.concatenate(([self._last_seq], seq.astype(np.int64)))
+        else:
+            seq_all = seq.astype(np.int64)
+        steps = np.diff(seq_all) & 0xFFFF
+        self.lost_frames += int(np.sum(steps[steps > 0] - 1))
+        self._last_seq = int(seq[-1])
+
+    def get_stats(self):
+        """Obtiene los contadores del decodificador"""
+        return {
+            'frames_ok': self.frames_ok,
+            'crc_errors': self.crc_errors,
+            'bytes_discarded': self.bytes_discarded,
+            'lost_frames': self.lost_frames,
+        }
+
+    def reset(self):
+        """Descarta bytes pendientes y reinicia contadores"""
+        self._buffer = bytearray()
+        self._last_seq = None
+        self.frames_ok = 0
+        self.crc_errors = 0
+        self.bytes_discarded = 0
+        self.lost_frames = 0
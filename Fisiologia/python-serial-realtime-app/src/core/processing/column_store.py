@@ -0,0 +1,138 @@
+"""
+Almacén columnar creciente para sesiones completas de adquisición.
+
+Cada columna vive en un arreglo NumPy preasignado que crece por bloques
+(duplicando su capacidad cuando se llena), de modo que agregar un lote cuesta
+O(1) amortizado en lugar de copiar toda la historia como ``np.append``. Las
+columnas siempre son contiguas: leerlas o recortarlas por rango de tiempo
+devuelve vistas sin copia.
+"""
+import numpy as np
+
+
+class ColumnStore:
+    """Columnas numéricas de igual largo con agregado amortizado O(1)
+
+    La primera columna es el tiempo (creciente) y se usa para los recortes
+    por rango con ``time_range``.
+    """
+
+    def __init__(self, columns, chunk_size=4096, dtype=np.float64):
+        """
+        Args:
+            columns (list[str]): nombres de las columnas; la primera es el tiempo
+            chunk_size (int, optional): capacidad inicial y mínimo de crecimiento.
+                Defaults to 4096.
+            dtype (np.dtype, optional): tipo de dato. Defaults to np.float64.
+
+        Raises:
+            ValueError: si no hay columnas o el bloque no es positivo
+        """
+        if not columns:
+            raise ValueError("Se requiere al menos una columna")
+        if chunk_size < 1:
+            raise ValueError("El tamaño de bloque debe ser al menos 1")
+
+        self.columns = list(columns)
+        self.time_column = self.columns[0]
+        self.chunk_size = int(chunk_size)
+        self.dtype = np.dtype(dtype)
+        self._capacity = self.chunk_size
+        self._data = {name: np.empty(self._capacity, dtype=self.dtype) for name in self.columns}
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __getitem__(self, name):
+        return self.column(name)
+
+    def column(self, name):
+        """Vista de las muestras almacenadas de una columna
+
+        Args:
+            name (str): nombre de la columna
+
+        Returns:
+            np.ndarray: vista sin copia (válida hasta el próximo agregado que
+            haga crecer el almacén)
+        """
+        return self._data[name][:self._size]
+
+    def append(self, *values):
+        """Agrega un lote con un arreglo por columna, en el orden de ``columns``
+
+        Raises:
+            ValueError: si la cantidad de arreglos o sus largos no coinciden
+        """
+        if len(values) != len(self.columns):
+            raise ValueError(f"Se esperaban {len(self.columns)} columnas")
+        arrays = [np.atleast_1d(np.asarray(v, dtype=self.dtype)) for v in values]
+        n = len(arrays[0])
+        if any(len(a) != n for a in arrays):
+            raise ValueError("Las columnas del lote tienen largos distintos")
+        if n == 0:
+            return
+
+        self._reserve(self._size + n)
+        for name, array in zip(self.columns, arrays):
+            self._data[name][self._size:self._size + n] = array
+        self._size += n
+
+    def _reserve(self, needed):
+        """Crece por duplicación (redondeando a bloques) si no hay lugar"""
+        if needed <= self._capacity:
+            return
+        capacity = max(2 * self._capacity, needed)
+        capacity = -(-capacity // self.chunk_size) * self.chunk_size
+        for name in self.columns:
+            grown = np.empty(capacity, dtype=self.dtype)
+            grown[:self._size] = self._data[name][:self._size]
+            self._data[name] = grown
+        self._capacity = capacity
+
+    def load(self, *values):
+        """Reemplaza todo el contenido (p. ej. al cargar un CSV)"""
+        self.clear()
+        self.append(*values)
+
+    def clear(self):
+        """Vacía el almacén y libera la memoria reservada"""
+        self._capacity = self.chunk_size
+        self._data = {name: np.empty(self._capacity, dtype=self.dtype) for name in self.columns}
+        self._size = 0
+
+    def index_range(self, t_start, t_end=None):
+        """Índices [inicio, fin) de las muestras con tiempo en [t_start, t_end)
+
+        Args:
+            t_start (float): tiempo inicial
+            t_end (float, optional): tiempo final; None = hasta el final
+
+        Returns:
+            tuple: (idx_start, idx_end)
+        """
+        t = self.column(self.time_column)
+        idx_start = int(np.searchsorted(t, t_start))
+        idx_end = self._size if t_end is None else int(np.searchsorted(t, t_end))
+        return idx_start, idx_end
+
+    def time_range(self, t_start, t_end=None, columns=None):
+        """Recorta las columnas por rango de tiempo
+
+        Args:
+            t_start (float): tiempo inicial
+            t_end (float, optional): tiempo final; None = hasta el final
+            columns (list[str], optional): columnas a devolver; None = todas
+
+        Returns:
+            tuple: vistas contiguas de cada columna, en orden
+        """
+        idx_start, idx_end = self.index_range(t_start, t_end)
+        return tuple(self._data[name][idx_start:idx_end] for name in (columns or self.columns))
+
+    def last_time(self):
+        """Tiempo de la última muestra, o None si está vacío"""
+        if self._size == 0:
+            return None
+        return float(self._data[self.time_column][self._size - 1])
@@ -0,0 +1,227 @@
+"""
+Códec compacto para canales enteros (cuentas del ADC) y tiempos.
+
+Cada bloque se codifica con diferencias (de orden 1 o 2), zig-zag para que
+las diferencias negativas pequeñas sean enteros sin signo pequeños y
+empaquetado de bits con el ancho justo para la mayor de ellas. Una señal PPG
+de un ADC de 12 bits queda en unos pocos bits por muestra en lugar de los 8
+bytes de un float64 o los ~10 caracteres de texto del CSV.
+
+Todo está vectorizado con NumPy (``np.packbits``/``np.unpackbits`` sobre la
+matriz de bits de cada valor); no hay bucles por muestra.
+
+Bloque de una grabación (little-endian)::
+
+    | bytes (u32) | muestras (u32) | t inicial µs (i64) | t final µs (i64) |
+    | tiempos: diferencias de orden 2 | raw: tipo (u8) + datos |
+
+El raw se guarda como diferencias si todos sus valores son enteros; si no
+(p. ej. un protocolo que ya envía valores escalados) se guarda en float32.
+"""
+import json
+import struct
+import numpy as np
+from config.settings import EXPORT_COLUMNS
+
+PACKED_MAGIC = b'PPGZ'
+PACKED_EXTENSION = '.ppgz'
+PACKED_VERSION = 1
+TIME_SCALE = 1000000  # tiempos en µs enteros (la misma resolución que el CSV)
+
+_STREAM_HEADER = struct.Struct('<qqBBI')  # primer valor, primera diferencia, orden, ancho de bits, cantidad
+_BLOCK_HEADER = struct.Struct('<IIqq')
+_FILE_HEADER = struct.Struct('<4sBI')  # magic, versión, largo de los metadatos
+RAW_DELTA = 0
+RAW_FLOAT32 = 1
+
+
+def zigzag_encode(values):
+    """Enteros con signo → sin signo intercalando positivos y negativos (0, -1, 1, -2…)"""
+    values = np.asarray(values, dtype=np.int64)
+    return ((values << 1) ^ (values >> 63)).view(np.uint64)
+
+
+def zigzag_decode(values):
+    """Inversa de ``zigzag_encode``"""
+    values = np.asarray(values, dtype=np.uint64)
+    return ((values >> np.uint64(1)) ^ (np.uint64(0) - (values & np.uint64(1)))).view(np.int64)
+
+
+def pack_bits(values, width):
+    """Empaqueta enteros sin signo con ``width`` bits cada uno
+
+    Args:
+        values (np.ndarray): enteros sin signo menores que ``2 ** width``
+        width (int): bits por valor (0 a 64)
+
+    Returns:
+        bytes: ``ceil(len(values) * width / 8)`` bytes
+    """
+    if width == 0 or len(values) == 0:
+        return b''
+    shifts = np.arange(width, dtype=np.uint64)
+    bits = ((np.asarray(values, dtype=np.uint64)[:, None] >> shifts) & np.uint64(1)).astype(np.uint8)
+    return np.packbits(bits.ravel(), bitorder='little').tobytes()
+
+
+def unpack_bits(data, width, count):
+    """Inversa de ``pack_bits``
+
+    Args:
+        data (bytes): datos empaquetados
+        width (int): bits por valor
+        count (int): cantidad de valores
+
+    Returns:
+        np.ndarray: valores uint64
+    """
+    if width == 0 or count == 0:
+        return np.zeros(count, dtype=np.uint64)
+    bits = np.unpackbits(np.frombuffer(data, dtype=np.uint8), count=count * width,
+                         bitorder='little').reshape(count, width)
+    shifts = np.arange(width, dtype=np.uint64)
+    return (bits.astype(np.uint64) << shifts).sum(axis=1, dtype=np.uint64)
+
+
+def encode_deltas(values, order=1):
+    """Codifica enteros como diferencias zig-zag empaquetadas
+
+    Args:
+        values (array-like): enteros (int64)
+        order (int, optional): 1 para señales, 2 para tiempos a tasa casi
+            constante (las diferencias de segundo orden quedan cerca de 0)
+
+    Returns:
+        bytes: encabezado y diferencias empaquetadas
+    """
+    values = np.asarray(values, dtype=np.int64)
+    if order not in (1, 2):
+        raise ValueError("El orden de las diferencias debe ser 1 o 2")
+    if len(values) == 0:
+        return _STREAM_HEADER.pack(0, 0, order, 0, 0)
+    deltas = np.diff(values)
+    # En orden 2 la primera diferencia va en el encabezado: si no, fijaría el
+    # ancho de bits de todo el bloque
+    seed = int(deltas[0]) if order == 2 and len(deltas) else 0
+    if order == 2:
+        deltas = np.diff(deltas)
+    encoded = zigzag_encode(deltas)
+    width = int(encoded.max()).bit_length() if len(encoded) else 0
+    return (_STREAM_HEADER.pack(int(values[0]), seed, order, width, len(values))
+            + pack_bits(encoded, width))
+
+
+def decode_deltas(data, offset=0):
+    """Decodifica un flujo de ``encode_deltas``
+
+    Args:
+        data (bytes): buffer que contiene el flujo
+        offset (int, optional): posición del flujo en el buffer
+
+    Returns:
+        tuple: (valores int64, posición siguiente al flujo)
+    """
+    first, seed, order, width, count = _STREAM_HEADER.unpack_from(data, offset)
+    offset += _STREAM_HEADER.size
+    stored = max(count - order, 0)
+    size = (stored * width + 7) // 8
+    deltas = zigzag_decode(unpack_bits(data[offset:offset + size], width, stored))
+    if order == 2 and count > 1:
+        deltas = np.concatenate(([seed], seed + np.cumsum(deltas, dtype=np.int64)))
+    values = np.empty(count, dtype=np.int64)
+    if count:
+        values[0] = first
+        np.cumsum(deltas, dtype=np.int64, out=values[1:])
+        values[1:] += first
+    return values, offset + size
+
+
+def is_integer_valued(values):
+    """Verifica que todos los valores sean enteros representables en int64"""
+    values = np.asarray(values)
+    if values.dtype.kind in 'iu':
+        return True
+    return bool(np.all(np.isfinite(values)) and np.all(values == np.round(values))
+                and np.all(np.abs(values) < 2 ** 53))
+
+
+def file_header(metadata=None):
+    """Encabezado de un archivo de grabación comprimida
+
+    Args:
+        metadata (dict, optional): datos adicionales (se guardan como JSON)
+
+    Returns:
+        bytes: encabezado
+    """
+    meta = json.dumps(dict(metadata or {}, columns=EXPORT_COLUMNS[:2],
+                           time_scale=TIME_SCALE)).encode()
+    return _FILE_HEADER.pack(PACKED_MAGIC, PACKED_VERSION, len(meta)) + meta
+
+
+def read_file_header(handle):
+    """Lee el encabezado de un archivo abierto en modo binario
+
+    Returns:
+        dict: metadatos (el archivo queda posicionado en el primer bloque)
+
+    Raises:
+        ValueError: si no es un archivo de grabación comprimida
+    """
+    head = handle.read(_FILE_HEADER.size)
+    if len(head) < _FILE_HEADER.size:
+        raise ValueError("Archivo de grabación comprimida incompleto")
+    magic, version, size = _FILE_HEADER.unpack(head)
+    if magic != PACKED_MAGIC:
+        raise ValueError("No es un archivo de grabación comprimida")
+    if version > PACKED_VERSION:
+        raise ValueError(f"Versión de archivo no soportada: {version}")
+    return json.loads(handle.read(size).decode())
+
+
+def encode_block(timestamps, values):
+    """Codifica un lote de muestras (tiempo en s y raw) como un bloque
+
+    Returns:
+        bytes: bloque con su encabezado
+    """
+    ticks = np.round(np.asarray(timestamps, dtype=np.float64) * TIME_SCALE).astype(np.int64)
+    payload = [encode_deltas(ticks, order=2)]
+    values = np.asarray(values)
+    if is_integer_valued(values):
+        payload += [bytes([RAW_DELTA]), encode_deltas(values.astype(np.int64), order=1)]
+    else:
+        payload += [bytes([RAW_FLOAT32]), values.astype('<f4').tobytes()]
+    payload = b''.join(payload)
+    first, last = (int(ticks[0]), int(ticks[-1])) if len(ticks) else (0, 0)
+    return _BLOCK_HEADER.pack(len(payload), len(ticks), first, last) + payload
+
+
+def read_block_header(handle):
+    """Lee el encabezado del bloque siguiente
+
+    Returns:
+        tuple: (bytes del contenido, muestras, t inicial s, t final s), o
+        None al final del archivo o en un bloque incompleto
+    """
+    head = handle.read(_BLOCK_HEADER.size)
+    if len(head) < _BLOCK_HEADER.size:
+        return None
+    size, samples, first, last = _BLOCK_HEADER.unpack(head)
+    return size, samples, first / TIME_SCALE, last / TIME_SCALE
+
+
+def decode_block(payload, samples):
+    """Decodifica el contenido de un bloque
+
+    Returns:
+        tuple: (tiempos float64 en s, raw float64)
+    """
+    ticks, offset = decode_deltas(payload)
+    kind = payload[offset]
+    if kind == RAW_DELTA:
+        values, _ = decode_deltas(payload, offset + 1)
+        values = values.astype(np.float64)
+    else:
+        values = np.frombuffer(payload, dtype='<f4', count=samples, offset=offset + 1).astype(np.float64)
+    return ticks / TIME_SCALE, values
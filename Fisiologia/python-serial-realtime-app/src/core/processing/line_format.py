@@ -0,0 +1,203 @@
+"""
+Detección del formato de línea y parseo por lotes especializado para cada formato.
+
+Formatos de texto aceptados:
+
+- ``raw``: ``Raw:<valor>``
+- ``triple``: ``Crudo:<valor>,Filtrado:<valor>,Normalizado:<valor>``
+- ``plain``: un número por línea
+
+Las expresiones regulares solo se usan para detectar el formato sobre las
+primeras líneas. Después, cada lote se convierte con un parser basado en
+``str.partition``/``str.split`` y una única conversión NumPy; las líneas
+inválidas solo se revisan una por una cuando el lote falla.
+"""
+from collections import Counter
+import numpy as np
+from config.constants import SERIAL_DATA_PATTERN, RAW_DATA_PATTERN
+
+LINE_FORMATS = ('raw', 'triple', 'plain')
+
+
+def classify_line(line):
+    """Identifica el formato de una sola línea
+
+    Args:
+        line (str): línea recibida, sin salto de línea
+
+    Returns:
+        str | None: 'triple', 'raw', 'plain' o None si no coincide con ninguno
+    """
+    if SERIAL_DATA_PATTERN.search(line):
+        return 'triple'
+    if RAW_DATA_PATTERN.search(line):
+        return 'raw'
+    try:
+        float(line)
+        return 'plain'
+    except ValueError:
+        return None
+
+
+def sniff_line_format(lines):
+    """Elige el formato más frecuente entre varias líneas
+
+    Args:
+        lines (list): líneas de muestra
+
+    Returns:
+        str | None: formato detectado, o None si ninguna línea es válida
+    """
+    counts = Counter(fmt for fmt in map(classify_line, lines) if fmt is not None)
+    if not counts:
+        return None
+    return counts.most_common(1)[0][0]
+
+
+def _raw_field(line):
+    """Valor de una línea 'Raw:<valor>'
+
+    Una línea con otra clave devuelve '' para que se cuente como inválida.
+    """
+    key, _, value = line.partition(':')
+    return value if key.strip().lower() == 'raw' else ''
+
+
+def _triple_field(line):
+    """Canal crudo de una línea 'Crudo:<v>,Filtrado:<v>,Normalizado:<v>'
+
+    Una línea sin los tres campos o con otra clave devuelve '' para que se
+    cuente como inválida.
+    """
+    fields = line.split(',')
+    if len(fields) != 3:
+        return ''
+    key, _, value = fields[0].partition(':')
+    return value if key.strip().lower() == 'crudo' else ''
+
+
+def _plain_field(line):
+    """Valor de una línea con un número simple"""
+    return line
+
+
+_FIELD_EXTRACTORS = {
+    'raw': _raw_field,
+    'triple': _triple_field,
+    'plain': _plain_field,
+}
+
+
+def parse_lines(lines, line_format):
+    """Convierte un lote de líneas de un formato conocido al canal raw
+
+    Args:
+        lines (list): líneas del mismo formato
+        line_format (str): 'raw', 'triple' o 'plain'
+
+    Returns:
+        tuple: (values, bad) - np.ndarray float64 con los valores válidos y
+        cantidad de líneas descartadas
+    """
+    extract = _FIELD_EXTRACTORS[line_format]
+    fields = [extract(line) for line in lines]
+    try:
+        return np.array(fields, dtype=np.float64), 0
+    except ValueError:
+        pass
+
+    # El lote tiene líneas inválidas: revisar una por una
+    values = []
+    for field in fields:
+        try:
+            values.append(float(field))
+        except ValueError:
+            continue
+    return np.array(values, dtype=np.float64), len(fields) - len(values)
+
+
+class LineFormatParser:
+    """Parser de líneas que detecta el formato y luego usa el parser especializado"""
+
+    def __init__(self, sniff_lines=20, max_failures=50, line_format=None):
+        """
+        Args:
+            sniff_lines (int, optional): líneas a observar antes de elegir el
+                formato. Defaults to 20.
+            max_failures (int, optional): líneas inválidas acumuladas sin un
+                lote limpio tras las cuales se vuelve a detectar el formato.
+                Defaults to 50.
+            line_format (str, optional): formato fijo; si se indica no se
+                detecta al inicio.
+        """
+        if line_format is not None and line_format not in LINE_FORMATS:
+            raise ValueError(f"Formato de línea desconocido: {line_format}")
+        self.sniff_lines = sniff_lines
+        self.max_failures = max_failures
+        self.line_format = line_format
+        self._initial_format = line_format
+        self._pending = []
+        self._consecutive_failures = 0
+
+        # Estadísticas
+        self.lines_ok = 0
+        self.lines_bad = 0
+        self.resniffs = 0
+
+    def parse(self, lines):
+        """Convierte un lote de líneas al canal raw
+
+        Mientras no se conoce el formato las líneas se retienen hasta reunir
+        ``sniff_lines``; luego se detecta el formato y se entregan todas juntas.
+
+        Args:
+            lines (list): líneas recibidas, sin salto de línea
+
+        Returns:
+            np.ndarray: valores raw float64 (puede estar vacío)
+        """
+        if self.line_format is None:
+            self._pending.extend(lines)
+            if len(self._pending) < self.sniff_lines:
+                return np.empty(0, dtype=np.float64)
+            self.line_format = sniff_line_format(self._pending)
+            lines, self._pending = self._pending, []
+            if self.line_format is None:
+                self.lines_bad += len(lines)
+                return np.empty(0, dtype=np.float64)
+
+        if not lines:
+            return np.empty(0, dtype=np.float64)
+
+        values, bad = parse_lines(lines, self.line_format)
+        self.lines_ok += len(values)
+        self.lines_bad += bad
+
+        if bad == 0:
+            self._consecutive_failures = 0
+        else:
+            self._consecutive_failures += bad
+            if self._consecutive_failures >= self.max_failures:
+                # Fallas repetidas: probablemente cambió el formato
+                self.line_format = None
+                self._consecutive_failures = 0
+                self.resniffs += 1
+        return values
+
+    def get_stats(self):
+        """Obtiene el formato actual y los contadores de líneas"""
+        return {
+            'line_format': self.line_format,
+            'lines_ok': self.lines_ok,
+            'lines_bad': self.lines_bad,
+            'resniffs': self.resniffs,
+        }
+
+    def reset(self):
+        """Olvida el formato detectado y reinicia contadores"""
+        self.line_format = self._initial_format
+        self._pending = []
+        self._consecutive_failures = 0
+        self.lines_ok = 0
+        self.lines_bad = 0
+        self.resniffs = 0
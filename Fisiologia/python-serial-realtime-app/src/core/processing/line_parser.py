@@ -0,0 +1,24 @@
+"""
+Parseo de las líneas de texto recibidas por el puerto serie.
+"""
+from config.constants import RAW_DATA_PATTERN
+
+
+def parse_raw_value(line):
+    """Extrae el valor del canal raw de una línea
+
+    Acepta el formato ``Raw:<valor>`` o un número simple.
+
+    Args:
+        line (str): línea recibida, sin salto de línea
+
+    Returns:
+        float | None: valor raw, o None si la línea no es válida
+    """
+    match = RAW_DATA_PATTERN.search(line)
+    if match:
+        return float(match.group(1))
+    try:
+        return float(line)
+    except ValueError:
+        return None
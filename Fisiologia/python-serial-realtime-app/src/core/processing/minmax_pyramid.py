@@ -0,0 +1,153 @@
+"""
+Pirámide de decimación mín/máx para graficar registros largos.
+
+El nivel 0 guarda la señal completa. El nivel k resume bloques de
+``factor**k`` muestras con dos puntos: el mínimo y el máximo del bloque, en
+el orden temporal en que ocurren. Así un pico nunca desaparece al alejar el
+zoom. Los niveles se actualizan en forma incremental a medida que llegan
+muestras (solo se procesan los bloques nuevos completos).
+
+Para dibujar, ``select`` elige el nivel más fino cuya cantidad de puntos en el
+rango visible no supera el presupuesto (≈ 2 × ancho en píxeles) y completa el
+borde derecho, aún sin bloque completo, con los niveles más finos.
+"""
+import numpy as np
+from .column_store import ColumnStore
+
+
+class MinMaxPyramid:
+    """Niveles ×factor, ×factor², ... de pares mín/máx sobre una señal creciente"""
+
+    def __init__(self, factor=4, chunk_size=4096):
+        """
+        Args:
+            factor (int, optional): muestras resumidas por bloque entre niveles
+                consecutivos. Defaults to 4.
+            chunk_size (int, optional): bloque de crecimiento de cada nivel
+
+        Raises:
+            ValueError: si el factor es menor que 2
+        """
+        if factor < 2:
+            raise ValueError("El factor de decimación debe ser al menos 2")
+        self.factor = int(factor)
+        self.chunk_size = chunk_size
+        self.levels = [ColumnStore(['time', 'value'], chunk_size)]
+
+    def __len__(self):
+        return len(self.levels[0])
+
+    def clear(self):
+        """Elimina la señal y todos los niveles"""
+        self.levels = [ColumnStore(['time', 'value'], self.chunk_size)]
+
+    def set_data(self, time_data, values):
+        """Reemplaza la señal completa y reconstruye los niveles"""
+        self.clear()
+        self.extend(time_data, values)
+
+    def extend(self, time_data, values):
+        """Agrega muestras (tiempo creciente) y actualiza los niveles
+
+        Args:
+            time_data (array-like): tiempos de las muestras
+            values (array-like): valores de las muestras
+        """
+        self.levels[0].append(time_data, values)
+        level = 1
+        while True:
+            if level == len(self.levels):
+                # Crear un nivel nuevo recién cuando el anterior tenga un bloque completo
+                if len(self.levels[level - 1]) < 2 * self._points_per_block(level):
+                    break
+                self.levels.append(ColumnStore(['time', 'value'], self.chunk_size))
+            self._update_level(level)
+            level += 1
+
+    def _points_per_block(self, level):
+        """Puntos del nivel anterior que forman un bloque de este nivel"""
+        # El nivel 0 tiene un punto por muestra; los demás, dos por bloque
+        return self.factor if level == 1 else 2 * self.factor
+
+    def _update_level(self, level):
+        """Resume en ``level`` los bloques completos nuevos del nivel anterior"""
+        source = self.levels[level - 1]
+        target = self.levels[level]
+        per_block = self._points_per_block(level)
+        done = len(target) // 2
+        available = len(source) // per_block
+        if available <= done:
+            return
+
+        start, stop = done * per_block, available * per_block
+        t = source['time'][start:stop].reshape(-1, per_block)
+        y = source['value'][start:stop].reshape(-1, per_block)
+        rows = np.arange(len(y))
+        idx_min = np.argmin(y, axis=1)
+        idx_max = np.argmax(y, axis=1)
+        first = np.minimum(idx_min, idx_max)
+        second = np.maximum(idx_min, idx_max)
+
+        # Intercalar (primero, segundo) por bloque respetando el orden temporal
+        times = np.column_stack((t[rows, first], t[rows, second])).ravel()
+        values = np.column_stack((y[rows, first], y[rows, second])).ravel()
+        target.append(times, values)
+
+    def level_for(self, n_samples, max_points):
+        """Nivel más fino que dibuja ``n_samples`` muestras con a lo sumo ``max_points``
+
+        Args:
+            n_samples (int): muestras originales en el rango visible
+            max_points (int): puntos que se quieren dibujar
+
+        Returns:
+            int: índice del nivel
+        """
+        level = 0
+        points = n_samples
+        while points > max_points and level + 1 < len(self.levels):
+            level += 1
+            points = 2 * n_samples / self.factor ** level
+        return level
+
+    def select(self, t_start=None, t_end=None, max_points=2000):
+        """Puntos a dibujar en el rango [t_start, t_end]
+
+        Args:
+            t_start (float, optional): tiempo inicial; None = desde el principio
+            t_end (float, optional): tiempo final; None = hasta el final
+            max_points (int, optional): presupuesto de puntos (≈ 2 × píxeles de ancho)
+
+        Returns:
+            tuple: (time_data, values, nivel usado) - np.ndarray float64
+        """
+        base = self.levels[0]
+        if len(base) == 0:
+            empty = np.empty(0, dtype=np.float64)
+            return empty, empty, 0
+        if t_start is None:
+            t_start = base['time'][0]
+        if t_end is None:
+            t_end = base['time'][-1]
+
+        idx_start, idx_end = base.index_range(t_start, np.nextafter(t_end, np.inf))
+        level = self.level_for(idx_end - idx_start, max_points)
+        if level == 0:
+            time_data, values = base.time_range(t_start, np.nextafter(t_end, np.inf))
+            return time_data, values, 0
+
+        # Nivel elegido y, en el borde derecho, lo que aún no forma un bloque completo
+        times, vals = [], []
+        covered = len(self.levels[level])
+        for current in range(level, -1, -1):
+            store = self.levels[current]
+            t = store['time'][covered:] if current < level else store['time']
+            y = store['value'][covered:] if current < level else store['value']
+            lo = np.searchsorted(t, t_start)
+            hi = np.searchsorted(t, t_end, side='right')
+            times.append(t[lo:hi])
+            vals.append(y[lo:hi])
+            if current > 0:
+                # Puntos del nivel siguiente más fino ya cubiertos por este nivel
+                covered = (len(store) // 2) * self._points_per_block(current)
+        return np.concatenate(times), np.concatenate(vals), level
@@ -0,0 +1,126 @@
+"""
+Buffer circular de capacidad fija sobre un arreglo NumPy preasignado.
+
+Cada muestra se escribe dos veces (en la posición ``i`` y en ``i + capacidad``),
+de modo que las últimas N muestras siempre ocupan un tramo contiguo del arreglo
+interno. Así ``last(n)`` devuelve una vista sin copia, incluso cuando el
+buffer ya dio la vuelta.
+"""
+import numpy as np
+
+
+class RingBuffer:
+    """Buffer circular numérico con vistas contiguas de las últimas muestras"""
+
+    def __init__(self, capacity, dtype=np.float64):
+        """
+        Args:
+            capacity (int): cantidad máxima de muestras almacenadas
+            dtype (np.dtype, optional): tipo de dato. Defaults to np.float64.
+
+        Raises:
+            ValueError: si la capacidad no es positiva
+        """
+        if capacity < 1:
+            raise ValueError("La capacidad del buffer debe ser al menos 1")
+
+        self.capacity = int(capacity)
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros(2 * self.capacity, dtype=self.dtype)
+        self._pos = 0      # próxima posición de escritura en [0, capacity)
+        self._size = 0     # muestras válidas
+
+    def __len__(self):
+        return self._size
+
+    def __iter__(self):
+        return iter(self.last())
+
+    def __getitem__(self, key):
+        return self.last()[key]
+
+    def __array__(self, dtype=None, copy=None):
+        data = self.last()
+        if dtype is not None and np.dtype(dtype) != self.dtype:
+            return data.astype(dtype)
+        return data.copy() if copy else data
+
+    @property
+    def is_full(self):
+        """Indica si el buffer alcanzó su capacidad"""
+        return self._size == self.capacity
+
+    def clear(self):
+        """Vacía el buffer sin liberar la memoria preasignada"""
+        self._pos = 0
+        self._size = 0
+
+    def append(self, value):
+        """Agrega una muestra, descartando la más antigua si está lleno"""
+        pos = self._pos
+        self._data[pos] = value
+        self._data[pos + self.capacity] = value
+        self._pos = (pos + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def append_many(self, values):
+        """Agrega un bloque de muestras con escrituras vectorizadas
+
+        Args:
+            values (array-like): muestras en orden cronológico
+        """
+        values = np.asarray(values, dtype=self.dtype).ravel()
+        n = len(values)
+        if n == 0:
+            return
+
+        cap = self.capacity
+        if n >= cap:
+            # Solo sobreviven las últimas 'cap' muestras
+            values = values[-cap:]
+            self._data[:cap] = values
+            self._data[cap:] = values
+            self._pos = 0
+            self._size = cap
+            return
+
+        pos = self._pos
+        first = min(n, cap - pos)
+        self._data[pos:pos + first] = values[:first]
+        self._data[pos + cap:pos + cap + first] = values[:first]
+        rest = n - first
+        if rest:
+            self._data[:rest] = values[first:]
+            self._data[cap:cap + rest] = values[first:]
+
+        self._pos = (pos + n) % cap
+        self._size = min(self._size + n, cap)
+
+    def last(self, n=None):
+        """Devuelve una vista de solo lectura con las últimas n muestras
+
+        La vista comparte memoria con el buffer: es válida hasta el próximo
+        append. Copiarla si se necesita conservar los valores.
+
+        Args:
+            n (int, optional): cantidad de muestras. Defaults to todas.
+
+        Returns:
+            np.ndarray: vista contigua en orden cronológico
+        """
+        if n is None or n > self._size:
+            n = self._size
+        n = max(int(n), 0)
+        end = self._pos + self.capacity
+        view = self._data[end - n:end]
+        view.flags.writeable = False
+        return view
+
+    def searchsorted(self, value, side='left'):
+        """Busca sobre el contenido (ordenado) del buffer, p. ej. el eje temporal
+
+        Returns:
+            int | np.ndarray: índice relativo a ``last()``
+        """
+        return np.searchsorted(self.last(), value, side=side)
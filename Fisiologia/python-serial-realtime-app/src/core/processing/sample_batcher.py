@@ -0,0 +1,49 @@
+"""
+Acumulador de muestras para entregarlas en lotes NumPy en lugar de una por una.
+"""
+import time
+import numpy as np
+
+
+class SampleBatcher:
+    """Acumula pares (timestamp, valor) y los entrega como arrays cada 'interval' segundos"""
+
+    def __init__(self, interval=0.02):
+        """
+        Args:
+            interval (float, optional): segundos entre lotes. Defaults to 0.02.
+        """
+        self.interval = interval
+        self._timestamps = []
+        self._values = []
+        self._last_flush = time.monotonic()
+
+    def __len__(self):
+        return len(self._values)
+
+    def add(self, timestamp, value):
+        """Agrega una muestra al lote en curso"""
+        self._timestamps.append(timestamp)
+        self._values.append(value)
+
+    def add_many(self, timestamps, values):
+        """Agrega un bloque de muestras (p. ej. tramas binarias decodificadas)"""
+        self._timestamps.extend(np.asarray(timestamps, dtype=np.float64).tolist())
+        self._values.extend(np.asarray(values, dtype=np.float64).tolist())
+
+    def is_due(self):
+        """Indica si pasó el intervalo y hay muestras pendientes"""
+        return bool(self._values) and time.monotonic() - self._last_flush >= self.interval
+
+    def flush(self):
+        """Entrega el lote en curso y empieza uno nuevo
+
+        Returns:
+            tuple: (timestamps, values) como np.ndarray float64
+        """
+        timestamps = np.array(self._timestamps, dtype=np.float64)
+        values = np.array(self._values, dtype=np.float64)
+        self._timestamps = []
+        self._values = []
+        self._last_flush = time.monotonic()
+        return timestamps, values
@@ -0,0 +1,195 @@
+"""
+Reloj de muestras: reconstruye los tiempos a partir de un contador de muestras.
+
+Sellar cada muestra con ``time.time()`` al procesarla convierte las demoras de
+colas e hilos en jitter falso de los intervalos RR. Aquí el tiempo de la
+muestra k es ``ancla + (k - k_ancla) * período``, con el ancla en la última
+muestra del lote anterior. El período parte de la fs nominal y se ajusta a la
+tasa real del dispositivo medida contra el reloj del host (muestras contadas
+sobre tiempo transcurrido): durante los primeros segundos se adopta
+directamente y luego se sigue con un lazo lento. El error de fase que queda se
+corrige con un paso acotado por lote para que los tiempos sigan siendo
+crecientes.
+
+Los huecos (muestras perdidas) se detectan por saltos en el número de
+secuencia del dispositivo cuando existe (tramas binarias) o porque el reloj
+del host salta más de un umbral dentro de un lote: una diferencia de tasa
+constante hace crecer el error de a poco y se absorbe en el período, nunca
+se registra como hueco. Las muestras faltantes avanzan el contador y cada
+hueco queda registrado como evento.
+"""
+import numpy as np
+
+
+class SampleClock:
+    """Asigna tiempos por índice de muestra siguiendo la tasa real y detectando huecos"""
+
+    def __init__(self, fs, drift_gain=0.01, gap_threshold=0.25, max_seq_gap=10.0,
+                 rate_gain=0.05, warmup=3.0, min_baseline=1.0):
+        """
+        Args:
+            fs (float): frecuencia de muestreo nominal (Hz)
+            drift_gain (float, optional): fracción del error de fase contra el
+                reloj del host que se corrige en cada lote. Defaults to 0.01.
+            gap_threshold (float, optional): salto del reloj del host (s) entre
+                un lote y el siguiente a partir del cual se declara un hueco.
+                Defaults to 0.25.
+            max_seq_gap (float, optional): saltos de secuencia más largos que
+                esto (s) se consideran un reinicio del dispositivo y no un
+                hueco. Defaults to 10.0.
+            rate_gain (float, optional): fracción de la diferencia entre el
+                período medido y el actual que se corrige en cada lote, pasado
+                el calentamiento. Defaults to 0.05.
+            warmup (float, optional): segundos desde el primer lote durante los
+                que el período medido se adopta directamente. Defaults to 3.0.
+            min_baseline (float, optional): segundos de reloj del host necesarios
+                antes de medir el período. Defaults to 1.0.
+        """
+        if fs <= 0:
+            raise ValueError("La frecuencia de muestreo debe ser positiva")
+        self.fs = float(fs)
+        self.nominal_period = 1.0 / self.fs
+        self.drift_gain = drift_gain
+        self.gap_threshold = gap_threshold
+        self.max_seq_gap = max_seq_gap
+        self.rate_gain = rate_gain
+        self.warmup = warmup
+        self.min_baseline = min_baseline
+        self.reset()
+
+    def reset(self):
+        """Reinicia el contador, el período, la referencia del host y los eventos"""
+        self.period = self.nominal_period
+        self._count = 0
+        self._anchor_idx = 0
+        self._anchor_time = 0.0
+        self._host_start = None
+        self._ref_host = None
+        self._ref_idx = 0
+        self._last_host = None
+        self._last_seq = None
+        self._last_error = 0.0
+        self._gaps = []
+        self.total_gaps = 0
+        self.lost_samples = 0
+
+    def stamp(self, n, host_time=None, seq=None):
+        """Asigna tiempos a un bloque de n muestras consecutivas
+
+        Args:
+            n (int): cantidad de muestras del bloque
+            host_time (float, optional): reloj del host (time.monotonic()) al
+                recibir la última muestra del bloque. Sin él no se mide la tasa
+                ni se detectan huecos por tiempo.
+            seq (array-like, optional): números de secuencia (uint16) de cada
+                muestra, si el dispositivo los envía.
+
+        Returns:
+            np.ndarray: tiempos float64 en segundos desde la primera muestra
+        """
+        if n <= 0:
+            return np.empty(0, dtype=np.float64)
+
+        if seq is not None:
+            idx = self._indices_from_seq(np.asarray(seq, dtype=np.int64))
+        else:
+            idx = self._count + np.arange(n, dtype=np.int64)
+
+        if host_time is not None:
+            if self._host_start is None:
+                # La última muestra del primer bloque llegó en host_time
+                self._host_start = host_time - self._time_of(idx[-1])
+                self._ref_host, self._ref_idx = host_time, int(idx[-1])
+            error = self._error(host_time, idx[-1])
+
+            # Un salto brusco del host (no el crecimiento lento de una tasa
+            # distinta a la nominal) son muestras que no llegaron
+            jump = error - self._last_error
+            if jump > self.gap_threshold:
+                missing = int(round(jump / self.period))
+                self._add_gap(idx[0], missing)
+                idx = idx + missing
+
+            self._update_period(host_time, int(idx[-1]))
+            error = self._error(host_time, idx[-1])
+
+            # Corrección de fase lenta y acotada: los tiempos nunca retroceden
+            correction = float(np.clip(self.drift_gain * error, -0.5 * self.period, 0.5 * self.period))
+            self._anchor_time += correction
+            self._last_error = error - correction
+            self._last_host = host_time
+
+        timestamps = self._anchor_time + (idx - self._anchor_idx) * self.period
+        self._anchor_idx = int(idx[-1])
+        self._anchor_time = float(timestamps[-1])
+        self._count = self._anchor_idx + 1
+        return timestamps
+
+    def _time_of(self, index):
+        """Tiempo del modelo para un índice de muestra"""
+        return self._anchor_time + (index - self._anchor_idx) * self.period
+
+    def _error(self, host_time, index):
+        """Adelanto (s) del reloj del host respecto del modelo en un índice"""
+        return float((host_time - self._host_start) - self._time_of(index))
+
+    def _update_period(self, host_time, last_idx):
+        """Ajusta el período a la tasa medida desde el primer lote"""
+        elapsed = host_time - self._ref_host
+        counted = last_idx - self._ref_idx
+        if elapsed < self.min_baseline or counted <= 0:
+            return
+        # Acotado para que un host muy trabado no deje un período absurdo
+        measured = float(np.clip(elapsed / counted, 0.5 * self.nominal_period,
+                                 2.0 * self.nominal_period))
+        if elapsed < self.warmup:
+            self.period = measured
+        else:
+            self.period += self.rate_gain * (measured - self.period)
+
+    def _indices_from_seq(self, seq):
+        """Índices de muestra según los saltos de secuencia (módulo 2^16)"""
+        steps = np.empty(len(seq), dtype=np.int64)
+        steps[0] = 1 if self._last_seq is None else (seq[0] - self._last_seq) & 0xFFFF
+        steps[1:] = np.diff(seq) & 0xFFFF
+        self._last_seq = int(seq[-1])
+
+        # Secuencia repetida o salto enorme: reinicio, no hueco
+        max_step = self.max_seq_gap * self.fs
+        steps[(steps == 0) | (steps > max_step)] = 1
+
+        idx = (self._count - 1) + np.cumsum(steps)
+        for pos in np.flatnonzero(steps > 1):
+            self._add_gap(idx[pos] - steps[pos] + 1, int(steps[pos] - 1))
+        return idx
+
+    def _add_gap(self, first_missing, missing):
+        """Registra un hueco que empieza en el índice first_missing"""
+        if missing <= 0:
+            return
+        self._gaps.append((float(self._time_of(first_missing + missing)), missing))
+        self.total_gaps += 1
+        self.lost_samples += missing
+
+    def pop_gaps(self):
+        """Devuelve y descarta los huecos detectados desde la última llamada
+
+        Returns:
+            list: tuplas (tiempo de la primera muestra tras el hueco, muestras perdidas)
+        """
+        gaps, self._gaps = self._gaps, []
+        return gaps
+
+    def estimated_fs(self):
+        """Frecuencia de muestreo efectiva que sigue el reloj (1 / período)"""
+        return 1.0 / self.period
+
+    def get_stats(self):
+        """Obtiene fs estimada, error de reloj y contadores de huecos"""
+        return {
+            'nominal_fs': self.fs,
+            'estimated_fs': self.estimated_fs(),
+            'clock_error_ms': self._last_error * 1000,
+            'gaps': self.total_gaps,
+            'lost_samples': self.lost_samples,
+        }
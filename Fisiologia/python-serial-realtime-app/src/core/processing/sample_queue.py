@@ -0,0 +1,198 @@
+"""
+Cola acotada de muestras entre un productor (hilo lector) y un consumidor.
+
+Las muestras se guardan en arreglos NumPy preasignados y se transfieren por
+lotes: el candado se toma una vez por lote, no por muestra. Cuando el
+consumidor se atrasa (p. ej. la interfaz bloqueada por un diálogo) la cola no
+crece: se aplica la política elegida, se cuentan las muestras descartadas y
+cada descarte queda registrado como hueco (``pop_drops``) para que el
+consumidor lo trate igual que una pérdida en el puerto.
+
+Políticas:
+
+- ``block``: el productor espera hasta que haya lugar (con timeout opcional;
+  al vencer se descarta lo que no entró)
+- ``drop_oldest``: se descartan las muestras más antiguas de la cola
+- ``drop_newest``: se descartan las muestras entrantes que no entran
+
+No hay política de decimación: los consumidores (filtros, FC/HRV) suponen la
+fs nominal, y una señal con tramos a la mitad de la tasa la violaría.
+"""
+import threading
+import numpy as np
+
+QUEUE_POLICIES = ('block', 'drop_oldest', 'drop_newest')
+
+
+class SampleQueue:
+    """Cola circular acotada de (tiempo, canales) con política de desborde y contadores"""
+
+    def __init__(self, capacity, n_channels=1, policy='drop_oldest', block_timeout=None):
+        """
+        Args:
+            capacity (int): muestras máximas en la cola
+            n_channels (int, optional): valores por muestra. Defaults to 1.
+            policy (str, optional): política de desborde. Defaults to 'drop_oldest'.
+            block_timeout (float, optional): espera máxima (s) de la política
+                'block'; None = esperar indefinidamente.
+
+        Raises:
+            ValueError: si la capacidad no es positiva o la política no existe
+        """
+        if capacity < 1:
+            raise ValueError("La capacidad de la cola debe ser al menos 1")
+        if policy not in QUEUE_POLICIES:
+            raise ValueError(f"Política desconocida: {policy}")
+
+        self.capacity = int(capacity)
+        self.n_channels = n_channels
+        self.policy = policy
+        self.block_timeout = block_timeout
+        self._times = np.empty(self.capacity, dtype=np.float64)
+        self._values = np.empty((self.capacity, n_channels), dtype=np.float64)
+        self._head = 0     # posición de la muestra más antigua
+        self._size = 0
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+
+        self._drops = []
+
+        # Estadísticas
+        self.enqueued = 0
+        self.dropped = 0
+        self.high_water = 0
+
+    def __len__(self):
+        return self._size
+
+    def put_many(self, timestamps, values):
+        """Encola un lote aplicando la política si no hay lugar
+
+        Args:
+            timestamps (array-like): tiempos de cada muestra
+            values (array-like): valores (n,) o (n x canales)
+
+        Returns:
+            int: muestras aceptadas
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64).reshape(len(timestamps), self.n_channels)
+        incoming = len(timestamps)
+        if incoming == 0:
+            return 0
+
+        with self._lock:
+            free = self.capacity - self._size
+            if incoming > free:
+                timestamps, values = self._make_room(timestamps, values)
+
+            self._write(timestamps, values)
+            accepted = len(timestamps)
+            self.enqueued += accepted
+            self.dropped += incoming - accepted
+            self.high_water = max(self.high_water, self._size)
+        return accepted
+
+    def _make_room(self, timestamps, values):
+        """Aplica la política de desborde (con el candado tomado)
+
+        Returns:
+            tuple: (timestamps, values) del lote entrante que finalmente se encola
+        """
+        if self.policy in ('block', 'drop_newest'):
+            if self.policy == 'block':
+                # Esperar a que el consumidor libere lugar; lo que no entre se descarta
+                needed = min(len(timestamps), self.capacity)
+                self._not_full.wait_for(lambda: self.capacity - self._size >= needed,
+                                        timeout=self.block_timeout)
+            free = self.capacity - self._size
+            if free < len(timestamps):
+                # La muestra que sigue todavía no llegó: el hueco se ubica en la
+                # última descartada
+                self._drops.append((float(timestamps[-1]), len(timestamps) - free))
+            return timestamps[:free], values[:free]
+
+        # drop_oldest
+        if len(timestamps) >= self.capacity:
+            missing = self._size + len(timestamps) - self.capacity
+            self._drops.append((float(timestamps[-self.capacity]), missing))
+            self.dropped += self._size
+            self._head = 0
+            self._size = 0
+            return timestamps[-self.capacity:], values[-self.capacity:]
+        excess = self._size + len(timestamps) - self.capacity
+        # Primera muestra que queda en la cola tras las descartadas
+        self._drops.append((float(self._times[(self._head + excess) % self.capacity]), excess))
+        self._head = (self._head + excess) % self.capacity
+        self._size -= excess
+        self.dropped += excess
+        return timestamps, values
+
+    def _write(self, timestamps, values):
+        """Copia un lote al final de la cola (hay lugar garantizado)"""
+        n = len(timestamps)
+        if n == 0:
+            return
+        start = (self._head + self._size) % self.capacity
+        first = min(n, self.capacity - start)
+        self._times[start:start + first] = timestamps[:first]
+        self._values[start:start + first] = values[:first]
+        if first < n:
+            self._times[:n - first] = timestamps[first:]
+            self._values[:n - first] = values[first:]
+        self._size += n
+
+    def _read(self, n):
+        """Copia las n muestras más antiguas sin quitarlas"""
+        idx = (self._head + np.arange(n)) % self.capacity
+        return self._times[idx], self._values[idx]
+
+    def get_all(self):
+        """Quita y devuelve todas las muestras en cola
+
+        Returns:
+            tuple: (timestamps, values) - np.ndarray float64; values es (n,)
+            con un canal o (n x canales) con varios
+        """
+        with self._lock:
+            timestamps, values = self._read(self._size)
+            self._head = 0
+            self._size = 0
+            self._not_full.notify_all()
+        if self.n_channels == 1:
+            values = values[:, 0]
+        return timestamps, values
+
+    def pop_drops(self):
+        """Devuelve y descarta los huecos por desborde desde la última llamada
+
+        Returns:
+            list: tuplas (tiempo de la primera muestra tras las descartadas, o
+            de la última descartada si las siguientes aún no llegaron,
+            muestras descartadas)
+        """
+        with self._lock:
+            drops, self._drops = self._drops, []
+        return drops
+
+    def clear(self):
+        """Vacía la cola, los huecos pendientes y los contadores"""
+        with self._lock:
+            self._head = 0
+            self._size = 0
+            self._drops = []
+            self.enqueued = 0
+            self.dropped = 0
+            self.high_water = 0
+            self._not_full.notify_all()
+
+    def get_stats(self):
+        """Obtiene ocupación, política y contadores de la cola"""
+        return {
+            'queue_policy': self.policy,
+            'queue_size': self._size,
+            'queue_capacity': self.capacity,
+            'queue_enqueued': self.enqueued,
+            'queue_dropped': self.dropped,
+            'queue_high_water': self.high_water,
+        }
@@ -0,0 +1,144 @@
+"""
+Anillo de muestras en memoria compartida entre procesos.
+
+Un único proceso escritor (la adquisición) agrega lotes de (tiempo, valor);
+los lectores de otros procesos mapean el mismo bloque por nombre y obtienen
+las muestras nuevas como vistas NumPy de solo lectura, sin copiarlas ni
+serializarlas.
+
+Disposición del bloque: una cabecera de 8 enteros int64 (total de muestras
+escritas, capacidad) seguida de ``capacity`` tiempos y ``capacity`` valores
+float64. El escritor copia los datos antes de actualizar el total, de modo
+que un lector nunca ve un lote a medio escribir.
+"""
+from multiprocessing import shared_memory
+import numpy as np
+
+_HEADER_SLOTS = 8
+_WRITTEN = 0
+_CAPACITY = 1
+
+
+class SharedSampleRing:
+    """Anillo de un escritor y varios lectores sobre multiprocessing.shared_memory
+
+    Uso::
+
+        ring = SharedSampleRing(60000)                         # proceso lector que lo crea
+        writer = SharedSampleRing(name=ring.name, writer=True)  # proceso escritor
+        writer.write(timestamps, values)
+        reader = SharedSampleRing(name=ring.name)              # otro lector
+        timestamps, values, cursor, lost = reader.read_since(cursor)
+    """
+
+    def __init__(self, capacity=None, name=None, writer=False):
+        """
+        Args:
+            capacity (int, optional): muestras del anillo; requerido al crearlo
+            name (str, optional): nombre de un bloque existente al que conectarse.
+                Sin nombre se crea un bloque nuevo.
+            writer (bool, optional): habilitar la escritura (proceso escritor).
+                Los demás, incluido el creador, ven arreglos de solo lectura.
+
+        Raises:
+            ValueError: si se crea un anillo sin capacidad positiva
+        """
+        self.owner = name is None
+        if self.owner:
+            if not capacity or capacity < 1:
+                raise ValueError("La capacidad del anillo debe ser al menos 1")
+            size = 8 * (_HEADER_SLOTS + 2 * capacity)
+            self.shm = shared_memory.SharedMemory(create=True, size=size)
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+
+        self._header = np.ndarray(_HEADER_SLOTS, dtype=np.int64, buffer=self.shm.buf)
+        if self.owner:
+            self._header[:] = 0
+            self._header[_CAPACITY] = capacity
+        self.capacity = int(self._header[_CAPACITY])
+
+        offset = 8 * _HEADER_SLOTS
+        self._times = np.ndarray(self.capacity, dtype=np.float64, buffer=self.shm.buf,
+                                 offset=offset)
+        self._values = np.ndarray(self.capacity, dtype=np.float64, buffer=self.shm.buf,
+                                  offset=offset + 8 * self.capacity)
+        if not writer:
+            # Los lectores no pueden modificar el anillo por error
+            self._times.flags.writeable = False
+            self._values.flags.writeable = False
+
+    @property
+    def name(self):
+        """Nombre del bloque para conectarse desde otro proceso"""
+        return self.shm.name
+
+    @property
+    def written(self):
+        """Total de muestras escritas desde la creación"""
+        return int(self._header[_WRITTEN])
+
+    def write(self, timestamps, values):
+        """Agrega un lote (solo el proceso escritor)
+
+        Args:
+            timestamps (np.ndarray): tiempos de cada muestra
+            values (np.ndarray): valores de cada muestra
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        values = np.asarray(values, dtype=np.float64)
+        n = len(timestamps)
+        if n == 0:
+            return
+        if n > self.capacity:
+            timestamps = timestamps[-self.capacity:]
+            values = values[-self.capacity:]
+
+        written = self.written
+        start = (written + n - len(timestamps)) % self.capacity
+        first = min(len(timestamps), self.capacity - start)
+        self._times[start:start + first] = timestamps[:first]
+        self._values[start:start + first] = values[:first]
+        rest = len(timestamps) - first
+        if rest:
+            self._times[:rest] = timestamps[first:]
+            self._values[:rest] = values[first:]
+        # Publicar el lote recién después de copiar los datos
+        self._header[_WRITTEN] = written + n
+
+    def read_since(self, cursor):
+        """Obtiene las muestras escritas después de ``cursor``
+
+        Args:
+            cursor (int): total de muestras ya leídas (0 al comenzar)
+
+        Returns:
+            tuple: (timestamps, values, nuevo cursor, muestras perdidas). Sin
+            vuelta del anillo los arreglos son vistas de solo lectura sobre la
+            memoria compartida; siguen siendo válidas hasta que el escritor
+            agregue ``capacity`` muestras más.
+        """
+        written = self.written
+        lost = 0
+        if written - cursor > self.capacity:
+            # El lector se atrasó más que la capacidad: lo más antiguo ya se sobrescribió
+            lost = written - self.capacity - cursor
+            cursor = written - self.capacity
+
+        n = written - cursor
+        start = cursor % self.capacity
+        if start + n <= self.capacity:
+            timestamps = self._times[start:start + n]
+            values = self._values[start:start + n]
+        else:
+            timestamps = np.concatenate((self._times[start:], self._times[:start + n - self.capacity]))
+            values = np.concatenate((self._values[start:], self._values[:start + n - self.capacity]))
+        return timestamps, values, written, lost
+
+    def close(self):
+        """Libera el mapeo; el creador además elimina el bloque"""
+        # Soltar las vistas antes de cerrar el mapeo
+        self._header = self._times = self._values = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
@@ -0,0 +1,236 @@
+"""
+Procesamiento en tiempo real de la señal PPG sin dependencia de Qt.
+
+Mantiene los buffers circulares, el reloj de muestras y los huecos, y calcula
+FC y HRV sobre la ventana más reciente. La interfaz gráfica lo envuelve en
+``ui.ppg_processor.PPGProcessor`` (señales y QTimer); el modo sin interfaz
+(``headless.py``) lo usa directamente.
+"""
+import numpy as np
+from scipy.signal import find_peaks
+from config.settings import (SAMPLE_CLOCK_DRIFT_GAIN, SAMPLE_GAP_THRESHOLD, SAMPLE_CLOCK_RATE_GAIN,
+                             SAMPLE_CLOCK_WARMUP)
+from .ring_buffer import RingBuffer
+from .sample_clock import SampleClock
+
+
+class PPGStreamProcessor:
+    """Buffers, reloj de muestras y análisis de FC/HRV de un canal raw"""
+
+    def __init__(self, sample_rate=100, buffer_size=7500, on_gap=None):
+        """
+        Args:
+            sample_rate (float, optional): frecuencia de muestreo nominal (Hz)
+            buffer_size (int, optional): muestras retenidas. Defaults to 7500.
+            on_gap (callable, optional): se llama con (tiempo relativo, muestras
+                perdidas) por cada hueco registrado.
+        """
+        self.sample_rate = sample_rate
+        self.buffer_size = buffer_size
+        self.on_gap = on_gap
+
+        # Buffers de datos preasignados (solo canal raw)
+        self.time_buffer = RingBuffer(buffer_size, dtype=np.float64)
+        self.raw_buffer = RingBuffer(buffer_size, dtype=np.float32)
+
+        # Tiempos por contador de muestras (no por reloj del consumidor)
+        self.sample_clock = SampleClock(sample_rate, SAMPLE_CLOCK_DRIFT_GAIN, SAMPLE_GAP_THRESHOLD,
+                                        rate_gain=SAMPLE_CLOCK_RATE_GAIN, warmup=SAMPLE_CLOCK_WARMUP)
+        self.gap_times = []
+        self.start_time = None
+
+        # Estadísticas en tiempo real
+        self.current_hr = 0
+        self.current_hrv = 0
+
+    def reset(self):
+        """Vacía los buffers y reinicia reloj, huecos y estadísticas"""
+        self.time_buffer.clear()
+        self.raw_buffer.clear()
+        self.sample_clock.reset()
+        self.gap_times = []
+        self.start_time = None
+        self.current_hr = 0
+        self.current_hrv = 0
+
+    def add_value(self, raw_value, host_time=None):
+        """Agrega una muestra suelta asignándole el tiempo del reloj de muestras
+
+        Args:
+            raw_value (float): valor raw
+            host_time (float, optional): time.monotonic() al recibirla, para
+                corregir la deriva y detectar huecos
+        """
+        timestamp = self.sample_clock.stamp(1, host_time)[0]
+        for gap_time, missing in self.sample_clock.pop_gaps():
+            self.mark_gap(gap_time, missing)
+        self.append_many(np.array([timestamp]), np.array([raw_value]))
+
+    def append_many(self, timestamps, values):
+        """Agrega un lote de muestras del canal raw
+
+        Args:
+            timestamps (np.ndarray): tiempos del reloj de muestras (s) de cada muestra
+            values (np.ndarray): valores raw
+
+        Returns:
+            int: cantidad de muestras agregadas
+        """
+        timestamps = np.asarray(timestamps, dtype=np.float64)
+        if len(timestamps) == 0:
+            return 0
+
+        if self.start_time is None:
+            self.start_time = timestamps[0]
+
+        self.time_buffer.append_many(timestamps - self.start_time)
+        self.raw_buffer.append_many(values)
+        return len(timestamps)
+
+    def mark_gap(self, gap_time, missing):
+        """Registra un hueco de muestras perdidas
+
+        Los intervalos RR que lo contienen se excluyen del cálculo de FC y HRV.
+
+        Args:
+            gap_time (float): tiempo (reloj de muestras) de la primera muestra tras el hueco
+            missing (int): cantidad de muestras perdidas
+
+        Returns:
+            float: tiempo del hueco relativo al inicio de la adquisición
+        """
+        relative_time = gap_time - (self.start_time or 0.0)
+        # Descartar huecos que ya salieron del buffer
+        oldest = self.time_buffer.last()[0] if len(self.time_buffer) else relative_time
+        self.gap_times = [t for t in self.gap_times if t >= oldest]
+        self.gap_times.append(relative_time)
+        if self.on_gap is not None:
+            self.on_gap(relative_time, missing)
+        return relative_time
+
+    def analyze_latest(self, seconds=5):
+        """Analiza los últimos segundos de señal y actualiza FC y HRV
+
+        Returns:
+            dict | None: resultados de analyze_segment, o None si no hay al
+            menos 2 segundos de datos
+        """
+        if len(self.raw_buffer) < self.sample_rate * 2:  # Necesitamos al menos 2 segundos
+            return None
+
+        segment_size = int(min(self.sample_rate * seconds, len(self.raw_buffer)))
+        results = self.analyze_segment(self.raw_buffer.last(segment_size),
+                                       self.time_buffer.last(segment_size))
+        if results:
+            self.current_hr = results.get('heart_rate', 0)
+            self.current_hrv = results.get('hrv', 0)
+        return results
+
+    def analyze_range(self, start_time, end_time):
+        """Analiza el tramo del buffer entre dos tiempos relativos
+
+        Returns:
+            dict | None: resultados de analyze_segment, o None si el tramo no
+            tiene datos suficientes
+        """
+        start_idx = self.time_buffer.searchsorted(start_time)
+        end_idx = self.time_buffer.searchsorted(end_time)
+
+        if start_idx >= end_idx or end_idx > len(self.raw_buffer):
+            return None
+
+        signal_segment = self.raw_buffer.last()[start_idx:end_idx]
+        time_segment = self.time_buffer.last()[start_idx:end_idx]
+        if len(signal_segment) <= 100:  # Mínimo de datos requerido
+            return None
+        return self.analyze_segment(signal_segment, time_segment)
+
+    def analyze_segment(self, signal, time_data):
+        """Analiza un segmento de señal PPG
+        Se obtiene parámetros como fc, hrv y calidad de señal
+        """
+        if len(signal) < 100:
+            return None
+
+        # Convertir a arrays numpy
+        signal = np.asarray(signal, dtype=np.float64)
+        time_data = np.asarray(time_data)
+
+        # Normalizar señal
+        signal_norm = (signal - np.mean(signal)) / np.std(signal)
+
+        # Detectar picos
+        # Distancia mínima entre picos: ~0.4s (150 BPM maximo)
+        min_distance = int(0.4 * self.sample_rate)
+        peaks, properties = find_peaks(signal_norm,
+                                       height=0.3,  # Altura minima
+                                       distance=min_distance)
+
+        results = {
+            'num_peaks': len(peaks),
+            'heart_rate': 0,
+            'hrv': 0,
+            'signal_quality': 'good'
+        }
+
+        if len(peaks) >= 2:
+            # Calcular intervalos RR (en segundos)
+            rr_intervals = np.diff(time_data[peaks])
+
+            # Excluir intervalos que contienen un hueco de muestras
+            if self.gap_times:
+                gaps_before = np.searchsorted(self.gap_times, time_data[peaks], side='right')
+                valid = np.diff(gaps_before) == 0
+            else:
+                valid = np.ones(len(rr_intervals), dtype=bool)
+            # Diferencias sucesivas solo entre intervalos válidos contiguos
+            rr_diff = np.diff(rr_intervals)[valid[:-1] & valid[1:]]
+            rr_intervals = rr_intervals[valid]
+            if len(rr_intervals) == 0:
+                return results
+
+            # Calcular frecuencia cardíaca
+            mean_rr = np.mean(rr_intervals)
+            heart_rate = 60.0 / mean_rr if mean_rr > 0 else 0
+
+            # Calcular HRV (RMSSD)
+            if len(rr_diff) > 0:
+                hrv = np.sqrt(np.mean(rr_diff**2)) * 1000  # en ms
+            else:
+                hrv = 0
+
+            results.update({
+                'heart_rate': heart_rate,
+                'hrv': hrv,
+                'rr_intervals': rr_intervals.tolist(),
+                'peak_times': time_data[peaks].tolist(),
+                'mean_rr': mean_rr
+            })
+
+            # Evaluar calidad de la señal
+            if heart_rate < 40 or heart_rate > 200:
+                results['signal_quality'] = 'poor'
+            elif len(peaks) < 3:
+                results['signal_quality'] = 'fair'
+
+        return results
+
+    def get_display_data(self, max_points=2500):
+        """Obtiene los datos para mostrar en un gráfico
+
+        Returns:
+            tuple: (time_data, raw_data) - Vistas de solo lectura (sin copia)
+            de los últimos max_points tiempos y valores raw. Son válidas
+            hasta el próximo dato agregado.
+        """
+        return (self.time_buffer.last(max_points),
+                self.raw_buffer.last(max_points))
+
+    def get_current_stats(self):
+        """Obtiene las estadísticas actuales"""
+        return {
+            'heart_rate': self.current_hr,
+            'hrv': self.current_hrv,
+            'data_points': len(self.time_buffer),
+            'duration': self.time_buffer[-1] if len(self.time_buffer) else 0
+        }
@@ -2,17 +2,48 @@
 Módulo data - Funciones para lectura y escritura de datos.
 
 Este módulo contiene:
-- Lectura de archivos CSV (read_data.py)
+- Lectura de archivos CSV o de sesión con un mismo criterio (read_data.py)
+- Detección de columnas y lectura rápida por bloques de CSV (csv_loader.py)
+- Índice tiempo → byte para leer ventanas de CSV grandes (range_index.py)
+- Lectura de Parquet y Feather con proyección y filtro por tiempo (arrow_file.py)
+- Archivos de sesión HDF5 con lectura perezosa por rango (session_file.py)
+- Grabaciones comprimidas .ppgz del canal raw (packed_recording.py)
+- Exportación por bloques en csv, xlsx, json, parquet y feather (write_data.py)
+- Catálogo de grabaciones con resúmenes en caché SQLite (catalog.py)
 - Gestión de datos de señales PPG
 """
 
-from .read_data import load_ppg_from_csv
-
-# TODO: Modularizar funcionalidad de escritura
-# from .write_data import save_ppg_to_csv, save_analysis_results
+from .read_data import load_ppg_from_csv, load_signal_file
+from .csv_loader import sniff_csv_schema, read_ppg_csv
+from .range_index import RangeIndex, build_range_index
+from .arrow_file import read_arrow_file, is_arrow_file
+from .session_file import SessionFile, save_session, is_session_file
+from .packed_recording import write_packed, read_packed, pack_csv, is_packed_file
+from .write_data import (save_ppg_to_csv, save_analysis_results, export_table,
+                         signal_columns, ExportCancelled)
+from .catalog import RecordingCatalog, summarize_recording
 
 __all__ = [
     'load_ppg_from_csv',
-    # 'save_ppg_to_csv',
-    # 'save_analysis_results',
+    'load_signal_file',
+    'sniff_csv_schema',
+    'read_ppg_csv',
+    'RangeIndex',
+    'build_range_index',
+    'read_arrow_file',
+    'is_arrow_file',
+    'SessionFile',
+    'save_session',
+    'is_session_file',
+    'write_packed',
+    'read_packed',
+    'pack_csv',
+    'is_packed_file',
+    'save_ppg_to_csv',
+    'save_analysis_results',
+    'export_table',
+    'signal_columns',
+    'ExportCancelled',
+    'RecordingCatalog',
+    'summarize_recording',
 ]
\ No newline at end of file
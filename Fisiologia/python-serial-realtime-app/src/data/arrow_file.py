@@ -0,0 +1,163 @@
+"""
+Lectura de señales desde archivos Arrow: Parquet y Feather (Arrow IPC).
+
+Las columnas se reconocen con los mismos nombres que en los CSV
+(``csv_loader.match_columns``) y se lee solo lo necesario:
+
+- Parquet: proyección de columnas y filtro por tiempo sobre las estadísticas
+  de cada row group; los grupos fuera de la ventana no se leen.
+- Feather: el archivo se abre con memory-map y se descartan los lotes
+  (record batches) fuera de la ventana mirando su primer y último tiempo;
+  las columnas no pedidas nunca se leen del disco.
+
+Los tipos se conservan: el tiempo se devuelve en float64 y las señales en
+float32, igual que ``read_ppg_csv``. Requiere ``pyarrow`` (dependencia
+opcional); sin él se informa con un ``ValueError``.
+"""
+import os
+import numpy as np
+from data.csv_loader import match_columns
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+PARQUET_EXTENSIONS = ('.parquet', '.pq')
+FEATHER_EXTENSIONS = ('.feather', '.arrow')
+ARROW_EXTENSIONS = PARQUET_EXTENSIONS + FEATHER_EXTENSIONS
+
+
+def is_arrow_file(path):
+    """Verifica por la extensión si la ruta es un archivo Parquet o Feather"""
+    return os.path.splitext(path)[1].lower() in ARROW_EXTENSIONS
+
+
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in PARQUET_EXTENSIONS
+
+
+def _require_pyarrow():
+    if pa is None:
+        raise ValueError("Los archivos Parquet/Feather requieren el paquete pyarrow")
+
+
+def arrow_schema(path):
+    """Ubica tiempo y canales de un archivo Arrow sin leer los datos
+
+    Returns:
+        dict: mismas claves que ``sniff_csv_schema`` (``delimiter`` es None)
+
+    Raises:
+        ValueError: si falta pyarrow
+    """
+    _require_pyarrow()
+    if _is_parquet(path):
+        names = pq.read_schema(path).names
+    else:
+        with pa.memory_map(path) as source:
+            names = pa.ipc.open_file(source).schema.names
+    time_column, channels = match_columns(names)
+    if time_column is None and not channels and names:
+        # Misma convención por posición que en los CSV
+        if len(names) >= 2:
+            time_column, channels = names[0], {'raw': names[1]}
+        else:
+            channels = {'raw': names[0]}
+    return {'delimiter': None, 'header': True, 'columns': names,
+            'time': time_column, 'channels': channels}
+
+
+def read_arrow_file(path, channels=None, t_start=None, t_end=None, fs=None,
+                    progress=None, schema=None):
+    """Lee tiempo y canales de un archivo Parquet o Feather
+
+    Args:
+        path (str): archivo ``.parquet`` o ``.feather``
+        channels (list[str], optional): canales lógicos a leer; None = todos
+        t_start (float, optional): tiempo inicial; None = desde el principio
+        t_end (float, optional): tiempo final (excluido); None = hasta el final
+        fs (float, optional): si no hay columna de tiempo, se genera como ``n / fs``
+        progress (callable, optional): recibe la fracción leída (0 a 1)
+        schema (dict, optional): esquema ya obtenido con ``arrow_schema``
+
+    Returns:
+        tuple: (time_data float64, dict canal → np.ndarray float32)
+
+    Raises:
+        ValueError: si falta pyarrow o un canal pedido
+    """
+    if schema is None:
+        schema = arrow_schema(path)
+    if channels is None:
+        channels = list(schema['channels'])
+    missing = [name for name in channels if name not in schema['channels']]
+    if missing:
+        raise ValueError(f"Columnas no encontradas en el archivo: {', '.join(missing)}")
+
+    time_column = schema['time']
+    wanted = {name: schema['channels'][name] for name in channels}
+    columns = ([time_column] if time_column is not None else []) + list(wanted.values())
+    ranged = time_column is not None and (t_start is not None or t_end is not None)
+
+    if _is_parquet(path):
+        filters = []
+        if ranged and t_start is not None:
+            filters.append((time_column, '>=', t_start))
+        if ranged and t_end is not None:
+            filters.append((time_column, '<', t_end))
+        table = pq.read_table(path, columns=columns, filters=filters or None)
+    else:
+        table = _read_feather(path, columns, time_column if ranged else None,
+                              t_start, t_end, progress)
+    if progress is not None:
+        progress(1.0)
+
+    n = table.num_rows
+    if time_column is not None:
+        time_data = _to_numpy(table.column(time_column), np.float64)
+    else:
+        time_data = np.arange(n, dtype=np.float64)
+        if fs:
+            time_data /= fs
+    data = {name: _to_numpy(table.column(column), np.float32) for name, column in wanted.items()}
+
+    keep = np.ones(n, dtype=bool)
+    if t_start is not None:
+        keep &= time_data >= t_start
+    if t_end is not None:
+        keep &= time_data < t_end
+    if not keep.all():
+        time_data = time_data[keep]
+        data = {name: values[keep] for name, values in data.items()}
+    return time_data, data
+
+
+def _read_feather(path, columns, time_column, t_start, t_end, progress):
+    """Lotes de un Feather con las columnas pedidas, salteando los que quedan fuera"""
+    with pa.memory_map(path) as source:
+        reader = pa.ipc.open_file(source)
+        count = reader.num_record_batches
+        batches = []
+        for i in range(count):
+            batch = reader.get_batch(i)
+            if time_column is not None and batch.num_rows:
+                t = batch.column(time_column)
+                if t_end is not None and t[0].as_py() >= t_end:
+                    break
+                if t_start is not None and t[len(t) - 1].as_py() < t_start:
+                    continue
+            batches.append(pa.Table.from_batches([batch]).select(columns))
+            if progress is not None:
+                progress((i + 1) / max(count, 1))
+        if not batches:
+            return pa.Table.from_batches([], reader.schema).select(columns)
+        # Copia dentro del with: los datos del memory-map no sobreviven al cierre
+        return pa.concat_tables(batches).combine_chunks()
+
+
+def _to_numpy(column, dtype):
+    """Columna Arrow → arreglo NumPy del tipo pedido (nulos como NaN)"""
+    return np.asarray(column.to_numpy(zero_copy_only=False), dtype=dtype)
@@ -0,0 +1,212 @@
+"""
+Catálogo de grabaciones con resumen por archivo guardado en SQLite.
+
+``RecordingCatalog.scan`` recorre una carpeta, compara cada grabación (CSV,
+Parquet/Feather, ``.ppgz`` o sesión ``.h5``) con la caché por ruta, fecha de modificación y tamaño, y
+calcula en un pool de procesos solo los archivos nuevos o modificados:
+duración, fs estimada, cantidad de muestras, FC media e índice de calidad.
+Las filas de archivos que ya no existen se eliminan de la caché.
+"""
+import multiprocessing as mp
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+import numpy as np
+from config.settings import CATALOG_DB, CATALOG_MIN_QUALITY, CATALOG_WORKERS, HIGHCUT, LOWCUT
+from data.arrow_file import ARROW_EXTENSIONS
+from data.packed_recording import PACKED_EXTENSION
+from data.read_data import load_signal_file
+from data.session_file import SESSION_EXTENSIONS
+
+CATALOG_EXTENSIONS = ('.csv', PACKED_EXTENSION) + ARROW_EXTENSIONS + SESSION_EXTENSIONS
+SUMMARY_FIELDS = ('duration', 'fs', 'samples', 'mean_hr', 'quality')
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS recordings (
+    path TEXT PRIMARY KEY,
+    mtime REAL NOT NULL,
+    size INTEGER NOT NULL,
+    duration REAL,
+    fs REAL,
+    samples INTEGER,
+    mean_hr REAL,
+    quality REAL,
+    error TEXT,
+    scanned REAL NOT NULL
+)
+"""
+
+
+def summarize_recording(path):
+    """Calcula el resumen de una grabación (se ejecuta en el pool de procesos)
+
+    El índice de calidad es la fracción de intervalos entre picos fisiológicos
+    (0.3 a 1.5 s) y a menos de un 20 % de la mediana: 1 = ritmo limpio. La FC
+    media queda en None si está fuera del rango fisiológico de
+    ``analyze_segment`` (señal 'poor') o si la calidad es menor que
+    ``CATALOG_MIN_QUALITY``: con picos espurios el promedio no es una FC.
+
+    Args:
+        path (str): archivo CSV o de sesión
+
+    Returns:
+        dict: ``duration``, ``fs``, ``samples``, ``mean_hr`` y ``quality``
+        (None si no se pudo calcular)
+    """
+    # Importaciones locales: el proceso hijo solo carga lo que usa
+    from core.filter import apply_filter
+    from core.processing.stream_processor import PPGStreamProcessor
+
+    time_data, data, fs = load_signal_file(path, prefer=('filtered', 'raw'))
+    signal = next(iter(data.values())).astype(np.float64)
+    samples = len(signal)
+    summary = {'duration': float(time_data[-1] - time_data[0]) if samples > 1 else 0.0,
+               'fs': float(fs) if fs else None,
+               'samples': samples,
+               'mean_hr': None,
+               'quality': None}
+    if not fs or samples < 100:
+        return summary
+
+    if fs > 2 * HIGHCUT:
+        signal = apply_filter(signal, LOWCUT, HIGHCUT, fs)
+    results = PPGStreamProcessor(sample_rate=fs).analyze_segment(signal, time_data)
+    rr = np.asarray((results or {}).get('rr_intervals', []))
+    if len(rr):
+        plausible = (rr >= 0.3) & (rr <= 1.5) & (np.abs(rr - np.median(rr)) <= 0.2 * np.median(rr))
+        summary['quality'] = float(np.mean(plausible))
+        if results['signal_quality'] != 'poor' and summary['quality'] >= CATALOG_MIN_QUALITY:
+            summary['mean_hr'] = float(results['heart_rate'])
+    return summary
+
+
+def _summarize_safe(path):
+    """``summarize_recording`` que devuelve el error en lugar de lanzarlo"""
+    try:
+        return path, summarize_recording(path), None
+    except Exception as e:
+        return path, None, str(e)
+
+
+class RecordingCatalog:
+    """Caché SQLite de resúmenes de grabaciones, actualizada en forma incremental"""
+
+    def __init__(self, db_path=CATALOG_DB, workers=CATALOG_WORKERS):
+        """
+        Args:
+            db_path (str, optional): base de datos SQLite de la caché
+            workers (int, optional): procesos del pool; None = uno por núcleo
+        """
+        self.db_path = db_path
+        self.workers = workers
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as db:
+            db.execute(_SCHEMA)
+            # Filas de versiones anteriores que guardaban cualquier FC media
+            db.execute("UPDATE recordings SET mean_hr = NULL WHERE mean_hr IS NOT NULL "
+                       "AND (mean_hr < 40 OR mean_hr > 200 OR quality IS NULL OR quality < ?)",
+                       (CATALOG_MIN_QUALITY,))
+
+    @contextmanager
+    def _connect(self):
+        """Conexión nueva en una transacción (cada hilo que escanea usa la suya)"""
+        db = sqlite3.connect(self.db_path)
+        db.row_factory = sqlite3.Row
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+
+    @staticmethod
+    def list_recordings(directory):
+        """Grabaciones de una carpeta (sin subcarpetas) con su fecha y tamaño
+
+        Returns:
+            dict: ruta absoluta → (mtime, size)
+        """
+        found = {}
+        for entry in os.scandir(directory):
+            if entry.is_file() and os.path.splitext(entry.name)[1].lower() in CATALOG_EXTENSIONS:
+                stat = entry.stat()
+                found[os.path.abspath(entry.path)] = (stat.st_mtime, stat.st_size)
+        return found
+
+    def scan(self, directory, progress=None, cancelled=None):
+        """Actualiza la caché de una carpeta y devuelve sus entradas
+
+        Args:
+            directory (str): carpeta a escanear
+            progress (callable, optional): recibe (procesados, a procesar)
+            cancelled (callable, optional): devuelve True para dejar de
+                esperar resultados (lo ya calculado queda guardado)
+
+        Returns:
+            list[dict]: entradas de la carpeta (ver ``entries``)
+        """
+        directory = os.path.abspath(directory)
+        found = self.list_recordings(directory)
+        with self._connect() as db:
+            cached = {row['path']: (row['mtime'], row['size'])
+                      for row in db.execute("SELECT path, mtime, size FROM recordings")
+                      if os.path.dirname(row['path']) == directory}
+            removed = [path for path in cached if path not in found]
+            db.executemany("DELETE FROM recordings WHERE path = ?", [(p,) for p in removed])
+
+        stale = [path for path, stamp in found.items() if cached.get(path) != stamp]
+        if progress is not None:
+            progress(0, len(stale))
+        if stale:
+            self._process(stale, found, progress, cancelled)
+        return self.entries(directory)
+
+    def _process(self, paths, stamps, progress, cancelled):
+        """Calcula los resúmenes en el pool y los guarda a medida que llegan"""
+        context = mp.get_context('spawn')
+        workers = min(self.workers or os.cpu_count() or 1, len(paths))
+        executor = ProcessPoolExecutor(max_workers=workers, mp_context=context)
+        try:
+            with self._connect() as db:
+                futures = [executor.submit(_summarize_safe, path) for path in paths]
+                for done, future in enumerate(as_completed(futures), start=1):
+                    path, summary, error = future.result()
+                    summary = summary or dict.fromkeys(SUMMARY_FIELDS)
+                    mtime, size = stamps[path]
+                    db.execute(
+                        "INSERT OR REPLACE INTO recordings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (path, mtime, size, *(summary[field] for field in SUMMARY_FIELDS),
+                         error, time.time()))
+                    # Guardar cada resultado: un escaneo interrumpido no se repite
+                    db.commit()
+                    if progress is not None:
+                        progress(done, len(paths))
+                    if cancelled is not None and cancelled():
+                        break
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def entries(self, directory=None):
+        """Entradas de la caché
+
+        Args:
+            directory (str, optional): solo las grabaciones de esta carpeta
+
+        Returns:
+            list[dict]: ``path``, ``mtime``, ``size``, los campos del resumen y
+            ``error`` (texto o None), ordenadas por ruta
+        """
+        with self._connect() as db:
+            rows = [dict(row) for row in db.execute("SELECT * FROM recordings ORDER BY path")]
+        if directory is not None:
+            directory = os.path.abspath(directory)
+            rows = [row for row in rows if os.path.dirname(row['path']) == directory]
+        return rows
+
+    def clear(self):
+        """Vacía la caché"""
+        with self._connect() as db:
+            db.execute("DELETE FROM recordings")
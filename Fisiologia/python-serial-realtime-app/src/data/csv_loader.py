@@ -0,0 +1,247 @@
+"""
+Cargador único de CSV de señales PPG.
+
+Detecta el esquema a partir del encabezado (separador, columna de tiempo y
+canales ``raw``/``filtered``/``normalized`` por sus nombres conocidos) y lee
+solo las columnas necesarias con tipos explícitos: el tiempo en float64 (en
+float32 se pierde resolución en registros de horas) y las señales en float32.
+
+Sin recorte ni progreso el archivo se lee de una vez con el motor más rápido
+disponible (``pyarrow`` si está instalado, si no el motor C de pandas). Un
+recorte por tiempo usa el índice tiempo → byte (``range_index.py``) y parsea
+solo el bloque de la ventana; sin columna de tiempo, o con progreso, se lee por
+bloques de ``CSV_LOAD_CHUNK_ROWS`` filas y la lectura termina apenas se pasa
+``t_end``.
+"""
+import csv
+import io
+import os
+import numpy as np
+import pandas as pd
+from config.settings import CSV_LOAD_CHUNK_ROWS
+from data.range_index import RangeIndex
+
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+# Nombres de columna reconocidos (sin distinguir mayúsculas)
+TIME_COLUMNS = ('tiempo_s', 'tiempo_relativo_s', 'timestamp', 'time', 'tiempo')
+CHANNEL_COLUMNS = {
+    'raw': ('valor_raw', 'crudo', 'valor_crudo', 'raw_signal', 'raw'),
+    'filtered': ('valor_filt', 'filtrado', 'filtered_signal', 'filtered'),
+    'normalized': ('normalizado', 'normalized_signal', 'normalized'),
+}
+
+
+def match_columns(names):
+    """Ubica la columna de tiempo y los canales entre nombres de columna conocidos
+
+    Args:
+        names (list[str]): nombres de columna del archivo
+
+    Returns:
+        tuple: (columna de tiempo o None, dict canal → columna)
+    """
+    lowered = {str(name).lower(): name for name in names}
+    time_column = next((lowered[alias] for alias in TIME_COLUMNS if alias in lowered), None)
+    channels = {}
+    for channel, aliases in CHANNEL_COLUMNS.items():
+        match = next((lowered[alias] for alias in aliases if alias in lowered), None)
+        if match is not None:
+            channels[channel] = match
+    return time_column, channels
+
+
+def sniff_csv_schema(path):
+    """Detecta separador, encabezado y ubicación de tiempo y canales
+
+    Si el encabezado no tiene nombres conocidos (o no hay encabezado) se
+    asume la convención por posición: primera columna tiempo y segunda señal
+    (una sola columna = solo señal).
+
+    Args:
+        path (str): archivo CSV
+
+    Returns:
+        dict: ``delimiter``, ``header`` (bool), ``columns`` (nombres o
+        posiciones), ``time`` (columna o None) y ``channels`` (canal → columna)
+
+    Raises:
+        ValueError: si el archivo está vacío
+    """
+    with open(path, newline='', encoding='utf-8', errors='replace') as handle:
+        first_line = handle.readline()
+    if not first_line.strip():
+        raise ValueError(f"El archivo '{path}' está vacío")
+    try:
+        delimiter = csv.Sniffer().sniff(first_line, delimiters=',;\t').delimiter
+    except csv.Error:
+        delimiter = ','
+
+    fields = [field.strip() for field in next(csv.reader([first_line], delimiter=delimiter))]
+    try:
+        [float(field) for field in fields]
+        header = False
+    except ValueError:
+        header = True
+
+    if header:
+        time_column, channels = match_columns(fields)
+        columns = fields
+    else:
+        time_column, channels = None, {}
+        columns = list(range(len(fields)))
+
+    if time_column is None and not channels:
+        # Convención por posición
+        if len(columns) >= 2:
+            time_column, channels = columns[0], {'raw': columns[1]}
+        else:
+            channels = {'raw': columns[0]}
+
+    return {'delimiter': delimiter, 'header': header, 'columns': columns,
+            'time': time_column, 'channels': channels}
+
+
+def pick_channel(schema, *preferred):
+    """Primer canal de ``preferred`` presente en el esquema, o el primero detectado
+
+    Raises:
+        ValueError: si no se detectó ninguna columna de señal
+    """
+    if not schema['channels']:
+        raise ValueError("No se encontró ninguna columna de señal")
+    for name in preferred:
+        if name in schema['channels']:
+            return name
+    return next(iter(schema['channels']))
+
+
+def read_ppg_csv(path, channels=None, t_start=None, t_end=None, fs=None,
+                 progress=None, schema=None, use_index=True, dtype=np.float32):
+    """Lee tiempo y canales de un CSV de señal PPG
+
+    Args:
+        path (str): archivo CSV
+        channels (list[str], optional): canales lógicos a leer (``raw``,
+            ``filtered``, ``normalized``); None = todos los detectados
+        t_start (float, optional): tiempo inicial; None = desde el principio
+        t_end (float, optional): tiempo final (excluido); None = hasta el final
+        fs (float, optional): si el archivo no tiene columna de tiempo, se
+            genera como ``n / fs`` (o el índice de muestra si se omite)
+        progress (callable, optional): recibe la fracción leída (0 a 1)
+        schema (dict, optional): esquema ya detectado con ``sniff_csv_schema``
+        use_index (bool, optional): recortar con el índice tiempo → byte
+            (se construye y guarda junto al CSV la primera vez)
+        dtype (np.dtype, optional): tipo de los canales; float32 basta para
+            graficar y analizar, float64 conserva los valores exactos
+
+    Returns:
+        tuple: (time_data float64, dict canal → np.ndarray de ``dtype``)
+
+    Raises:
+        ValueError: si falta un canal pedido
+    """
+    if schema is None:
+        schema = sniff_csv_schema(path)
+    if channels is None:
+        channels = list(schema['channels'])
+    missing = [name for name in channels if name not in schema['channels']]
+    if missing:
+        raise ValueError(f"Columnas no encontradas en el CSV: {', '.join(missing)}")
+
+    time_column = schema['time']
+    wanted = {name: schema['channels'][name] for name in channels}
+    usecols = ([time_column] if time_column is not None else []) + list(wanted.values())
+    column_types = {column: dtype for column in wanted.values()}
+    if time_column is not None:
+        column_types[time_column] = np.float64
+    options = {
+        'sep': schema['delimiter'],
+        'header': 0 if schema['header'] else None,
+        'usecols': usecols,
+        'dtype': column_types,
+    }
+
+    ranged = t_start is not None or t_end is not None
+    if ranged and use_index and time_column is not None:
+        df = _read_indexed(path, options, schema, t_start, t_end)
+        if progress is not None:
+            progress(1.0)
+    elif ranged or progress is not None:
+        df = _read_chunks(path, options, time_column, t_start, t_end, progress)
+    else:
+        engine = 'pyarrow' if PYARROW_AVAILABLE else 'c'
+        df = pd.read_csv(path, engine=engine, **options)
+
+    n = len(df)
+    if time_column is not None:
+        time_data = df[time_column].to_numpy(dtype=np.float64)
+    else:
+        time_data = np.arange(n, dtype=np.float64)
+        if fs:
+            time_data /= fs
+        if t_start is not None or t_end is not None:
+            keep = np.ones(n, dtype=bool)
+            if t_start is not None:
+                keep &= time_data >= t_start
+            if t_end is not None:
+                keep &= time_data < t_end
+            df, time_data = df[keep], time_data[keep]
+
+    data = {name: df[column].to_numpy(dtype=dtype) for name, column in wanted.items()}
+    return time_data, data
+
+
+def _read_indexed(path, options, schema, t_start, t_end):
+    """Parsea solo el bloque de bytes que contiene la ventana según el índice"""
+    time_column = schema['time']
+    index = RangeIndex.for_file(path, schema['columns'].index(time_column),
+                                schema['delimiter'], schema['header'])
+    start, end = index.byte_range(t_start, t_end)
+    with open(path, 'rb') as handle:
+        handle.seek(start)
+        block = handle.read(end - start)
+    df = pd.read_csv(io.BytesIO(block), engine='c', names=schema['columns'],
+                     **dict(options, header=None))
+    # El bloque empieza y termina en filas indexadas: recortar al rango exacto
+    t = df[time_column].to_numpy()
+    keep = np.ones(len(t), dtype=bool)
+    if t_start is not None:
+        keep &= t >= t_start
+    if t_end is not None:
+        keep &= t < t_end
+    return df[keep]
+
+
+def _read_chunks(path, options, time_column, t_start, t_end, progress):
+    """Lectura por bloques con recorte por tiempo y avance por bytes leídos"""
+    size = max(os.path.getsize(path), 1)
+    parts = []
+    with open(path, 'rb') as handle:
+        reader = pd.read_csv(handle, engine='c', chunksize=CSV_LOAD_CHUNK_ROWS, **options)
+        for chunk in reader:
+            if time_column is not None:
+                t = chunk[time_column].to_numpy()
+                if t_start is not None:
+                    chunk = chunk[t >= t_start]
+                    t = t[t >= t_start]
+                done = t_end is not None and len(t) and t[-1] >= t_end
+                if t_end is not None:
+                    chunk = chunk[t < t_end]
+            else:
+                done = False
+            parts.append(chunk)
+            if progress is not None:
+                progress(min(handle.tell() / size, 1.0))
+            if done:
+                break
+    if progress is not None:
+        progress(1.0)
+    if not parts:
+        return pd.DataFrame({column: pd.Series(dtype=options['dtype'][column])
+                             for column in options['usecols']})
+    return pd.concat(parts, ignore_index=True)
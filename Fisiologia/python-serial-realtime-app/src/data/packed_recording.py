@@ -0,0 +1,131 @@
+"""
+Grabaciones comprimidas (``.ppgz``) para archivar el canal raw.
+
+El archivo es un encabezado (magic ``PPGZ``, versión y metadatos JSON)
+seguido de bloques independientes de ``delta_codec``: cada bloque guarda su
+tiempo inicial y final en el encabezado, de modo que leer una ventana salta
+los bloques de afuera sin decodificarlos. El formato es de solo agregado, por
+eso ``SessionRecorder`` puede grabar directamente en él bloque a bloque.
+
+Con cuentas enteras del ADC ocupa alrededor de 1 byte por muestra (tiempo y
+valor) frente a ~17 del CSV; ``pack_csv`` convierte grabaciones existentes.
+"""
+import os
+import numpy as np
+from config.settings import PACKED_BLOCK_SAMPLES
+from core.processing.delta_codec import (PACKED_EXTENSION, decode_block, encode_block,
+                                         file_header, read_block_header, read_file_header)
+from data.csv_loader import read_ppg_csv, sniff_csv_schema
+
+
+def is_packed_file(path):
+    """Verifica por la extensión si la ruta es una grabación comprimida"""
+    return os.path.splitext(path)[1].lower() == PACKED_EXTENSION
+
+
+def write_packed(path, time_data, raw, block_samples=PACKED_BLOCK_SAMPLES, metadata=None):
+    """Guarda tiempo y canal raw como grabación comprimida
+
+    El archivo se escribe en ``path + '.tmp'`` y se renombra al terminar.
+
+    Args:
+        path (str): archivo de destino (``.ppgz``)
+        time_data (array-like): tiempos (s)
+        raw (array-like): valores raw (enteros para la mejor compresión)
+        block_samples (int, optional): muestras por bloque
+        metadata (dict, optional): datos adicionales para el encabezado
+
+    Returns:
+        str: ruta del archivo guardado
+    """
+    time_data = np.asarray(time_data, dtype=np.float64)
+    raw = np.asarray(raw)
+    if len(time_data) != len(raw):
+        raise ValueError("El tiempo y la señal deben tener el mismo largo")
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as handle:
+            handle.write(file_header(metadata))
+            for start in range(0, len(raw), block_samples):
+                stop = start + block_samples
+                handle.write(encode_block(time_data[start:stop], raw[start:stop]))
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return path
+
+
+def read_packed(path, t_start=None, t_end=None, progress=None):
+    """Lee una grabación comprimida, completa o una ventana de tiempo
+
+    Un bloque final incompleto (grabación interrumpida) se ignora.
+
+    Args:
+        path (str): archivo ``.ppgz``
+        t_start (float, optional): tiempo inicial; None = desde el principio
+        t_end (float, optional): tiempo final (excluido); None = hasta el final
+        progress (callable, optional): recibe la fracción leída (0 a 1)
+
+    Returns:
+        tuple: (time_data float64, raw float64 con los valores exactos grabados)
+
+    Raises:
+        ValueError: si el archivo no es una grabación comprimida
+    """
+    size = max(os.path.getsize(path), 1)
+    times, values = [], []
+    with open(path, 'rb') as handle:
+        read_file_header(handle)
+        while True:
+            header = read_block_header(handle)
+            if header is None:
+                break
+            length, samples, first, last = header
+            if t_end is not None and first >= t_end:
+                break
+            if t_start is not None and last < t_start:
+                handle.seek(length, os.SEEK_CUR)
+                continue
+            payload = handle.read(length)
+            if len(payload) < length:
+                break
+            block_time, block_values = decode_block(payload, samples)
+            times.append(block_time)
+            values.append(block_values)
+            if progress is not None:
+                progress(min(handle.tell() / size, 1.0))
+    if progress is not None:
+        progress(1.0)
+
+    time_data = np.concatenate(times) if times else np.empty(0, dtype=np.float64)
+    raw = np.concatenate(values) if values else np.empty(0, dtype=np.float64)
+    keep = np.ones(len(time_data), dtype=bool)
+    if t_start is not None:
+        keep &= time_data >= t_start
+    if t_end is not None:
+        keep &= time_data < t_end
+    return time_data[keep], raw[keep]
+
+
+def pack_csv(csv_path, out_path=None):
+    """Convierte una grabación CSV (tiempo y raw) en ``.ppgz``
+
+    Args:
+        csv_path (str): CSV de origen
+        out_path (str, optional): destino; por defecto el mismo nombre con
+            extensión ``.ppgz``
+
+    Returns:
+        str: ruta del archivo comprimido
+    """
+    schema = sniff_csv_schema(csv_path)
+    if 'raw' not in schema['channels']:
+        raise ValueError(f"El CSV '{csv_path}' no tiene canal raw")
+    # float64: las cuentas de más de 24 bits no entran exactas en float32
+    time_data, data = read_ppg_csv(csv_path, ['raw'], schema=schema, dtype=np.float64)
+    if out_path is None:
+        out_path = os.path.splitext(csv_path)[0] + PACKED_EXTENSION
+    return write_packed(out_path, time_data, data['raw'],
+                        metadata={'source': os.path.basename(csv_path)})
@@ -0,0 +1,184 @@
+"""
+Índice disperso tiempo → byte para leer ventanas de CSV grandes.
+
+Cada ``RANGE_INDEX_STRIDE`` filas se anota el tiempo de la fila, su
+desplazamiento en bytes y su número. Para leer ``[t_start, t_end)`` se busca en
+el índice el bloque de bytes que contiene la ventana y solo ese bloque se
+parsea: una ventana de 10 s de un registro de horas lee unas pocas filas de
+más en lugar del archivo completo.
+
+El índice se guarda junto al CSV (``<archivo>.tidx.npz``) con el tamaño y la
+fecha de modificación del CSV; si el CSV cambia se reconstruye. Construirlo
+solo busca saltos de línea por bloques con NumPy y convierte el tiempo de una
+fila de cada ``RANGE_INDEX_STRIDE``.
+"""
+import os
+import numpy as np
+from config.settings import RANGE_INDEX_STRIDE
+
+INDEX_SUFFIX = '.tidx.npz'
+_BLOCK_SIZE = 8 * 1024 * 1024
+
+
+class RangeIndex:
+    """Tiempos, desplazamientos y filas de una de cada ``stride`` filas de un CSV"""
+
+    def __init__(self, times, offsets, rows, data_end, source_size, source_mtime):
+        """
+        Args:
+            times (np.ndarray): tiempo de cada fila indexada (creciente)
+            offsets (np.ndarray): byte donde empieza cada fila indexada
+            rows (np.ndarray): número de fila de datos (sin encabezado)
+            data_end (int): byte donde terminan los datos
+            source_size (int): tamaño del CSV al construir el índice
+            source_mtime (int): fecha de modificación del CSV (ns)
+        """
+        self.times = times
+        self.offsets = offsets
+        self.rows = rows
+        self.data_end = data_end
+        self.source_size = source_size
+        self.source_mtime = source_mtime
+
+    def __len__(self):
+        return len(self.times)
+
+    @staticmethod
+    def index_path(path):
+        """Ruta del índice de un CSV"""
+        return path + INDEX_SUFFIX
+
+    @classmethod
+    def build(cls, path, time_position=0, delimiter=',', header=True,
+              stride=RANGE_INDEX_STRIDE):
+        """Recorre el CSV y construye su índice
+
+        Args:
+            path (str): archivo CSV
+            time_position (int): posición de la columna de tiempo
+            delimiter (str, optional): separador de columnas
+            header (bool, optional): si la primera línea es el encabezado
+            stride (int, optional): filas entre entradas del índice
+
+        Returns:
+            RangeIndex: índice construido (sin guardar)
+        """
+        stat = os.stat(path)
+        starts = []
+        with open(path, 'rb') as handle:
+            base = len(handle.readline()) if header else 0
+            starts.append(np.array([base], dtype=np.int64))
+            rows_seen = 0
+            while True:
+                block = handle.read(_BLOCK_SIZE)
+                if not block:
+                    break
+                # Cada salto de línea abre la fila siguiente
+                next_rows = np.flatnonzero(np.frombuffer(block, dtype=np.uint8) == 10) + base + 1
+                first = (-(rows_seen + 1)) % stride
+                starts.append(next_rows[first::stride])
+                rows_seen += len(next_rows)
+                base += len(block)
+
+            offsets = np.concatenate(starts)
+            offsets = offsets[offsets < stat.st_size]
+            times, kept, rows = [], [], []
+            separator = delimiter.encode()
+            for number, offset in enumerate(offsets):
+                handle.seek(offset)
+                fields = handle.readline().split(separator)
+                try:
+                    times.append(float(fields[time_position]))
+                except (IndexError, ValueError):
+                    continue  # Línea vacía o incompleta
+                kept.append(offset)
+                rows.append(number * stride)
+
+        return cls(np.asarray(times, dtype=np.float64), np.asarray(kept, dtype=np.int64),
+                   np.asarray(rows, dtype=np.int64), stat.st_size, stat.st_size, stat.st_mtime_ns)
+
+    def save(self, path):
+        """Guarda el índice junto al CSV"""
+        with open(self.index_path(path), 'wb') as handle:
+            np.savez(handle, times=self.times, offsets=self.offsets, rows=self.rows,
+                     meta=np.array([self.data_end, self.source_size, self.source_mtime],
+                                   dtype=np.int64))
+
+    @classmethod
+    def load(cls, path):
+        """Carga el índice guardado de un CSV
+
+        Returns:
+            RangeIndex: índice, o None si no existe o el CSV cambió desde entonces
+        """
+        index_path = cls.index_path(path)
+        if not os.path.exists(index_path):
+            return None
+        try:
+            with np.load(index_path) as saved:
+                data_end, size, mtime = (int(v) for v in saved['meta'])
+                index = cls(saved['times'], saved['offsets'], saved['rows'], data_end, size, mtime)
+        except (OSError, ValueError, KeyError):
+            return None
+        stat = os.stat(path)
+        if (stat.st_size, stat.st_mtime_ns) != (index.source_size, index.source_mtime):
+            return None
+        return index
+
+    @classmethod
+    def for_file(cls, path, time_position=0, delimiter=',', header=True):
+        """Índice guardado del CSV, o uno nuevo que se guarda si la carpeta lo permite"""
+        index = cls.load(path)
+        if index is None:
+            index = cls.build(path, time_position, delimiter, header)
+            try:
+                index.save(path)
+            except OSError:
+                pass  # Carpeta de solo lectura: el índice se usa solo en memoria
+        return index
+
+    def byte_range(self, t_start=None, t_end=None):
+        """Bytes [inicio, fin) que contienen todas las filas con tiempo en [t_start, t_end)
+
+        Returns:
+            tuple: (byte_start, byte_end)
+        """
+        if len(self.times) == 0:
+            return 0, 0
+        start = self.offsets[0]
+        if t_start is not None:
+            # Última fila indexada con tiempo < t_start: con tiempos repetidos,
+            # las filas sin indexar antes de una entrada igual a t_start también cuentan
+            i = max(int(np.searchsorted(self.times, t_start, side='left')) - 1, 0)
+            start = self.offsets[i]
+        end = self.data_end
+        if t_end is not None:
+            # Primera fila indexada con tiempo >= t_end: de ahí en adelante no se lee
+            i = int(np.searchsorted(self.times, t_end, side='left'))
+            if i < len(self.offsets):
+                end = self.offsets[i]
+        return int(start), int(max(start, end))
+
+
+def build_range_index(path, schema=None):
+    """Construye y guarda el índice de un CSV (p. ej. al terminar de grabarlo)
+
+    Args:
+        path (str): archivo CSV
+        schema (dict, optional): esquema de ``sniff_csv_schema``; se detecta si se omite
+
+    Returns:
+        str: ruta del índice guardado
+
+    Raises:
+        ValueError: si el CSV no tiene columna de tiempo
+    """
+    from data.csv_loader import sniff_csv_schema
+    if schema is None:
+        schema = sniff_csv_schema(path)
+    if schema['time'] is None:
+        raise ValueError("El CSV no tiene columna de tiempo para indexar")
+    index = RangeIndex.build(path, schema['columns'].index(schema['time']),
+                             schema['delimiter'], schema['header'])
+    index.save(path)
+    return RangeIndex.index_path(path)
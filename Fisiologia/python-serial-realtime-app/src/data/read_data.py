@@ -1,25 +1,75 @@
 """
-Funciones para cargar datos desde archivos CSV
+Funciones para cargar datos desde archivos CSV, Parquet/Feather, sesiones HDF5
+o grabaciones comprimidas ``.ppgz``
 """
-import pandas as pd
-import numpy as np
+from data.arrow_file import arrow_schema, is_arrow_file, read_arrow_file
+from data.csv_loader import pick_channel, read_ppg_csv, sniff_csv_schema
+from data.packed_recording import is_packed_file, read_packed
+from data.session_file import SessionFile, is_session_file
+
+
+def load_signal_file(filepath, channels=None, prefer=None, t_start=None, t_end=None,
+                     fs=None, progress=None):
+    """
+    Carga tiempo y canales de un CSV, un Parquet/Feather, una sesión ``.h5``
+    o una grabación ``.ppgz`` (solo canal raw) con el mismo criterio
+
+    Args:
+        filepath (str): archivo CSV, Parquet/Feather, de sesión o comprimido
+        channels (list[str], optional): canales a leer (``raw``, ``filtered``,
+            ``normalized``); None = todos los disponibles
+        prefer (tuple, optional): si se indica, lee solo el primer canal
+            disponible de esta lista (o el primero del archivo)
+        t_start (float, optional): tiempo inicial; None = desde el principio
+        t_end (float, optional): tiempo final (excluido); None = hasta el final
+        fs (float, optional): frecuencia para generar el tiempo si el CSV (o
+            el Parquet/Feather) no tiene esa columna
+        progress (callable, optional): recibe la fracción leída (0 a 1)
+
+    Returns:
+        tuple: (time_data, dict canal → np.ndarray, fs)
+    """
+    if is_session_file(filepath):
+        with SessionFile(filepath) as session:
+            if prefer is not None:
+                channels = [session.pick_channel(*prefer)]
+            names = session.channels if channels is None else list(channels)
+            time_data, *values = session.time_range(t_start, t_end, names)
+            file_fs = session.fs
+        if progress is not None:
+            progress(1.0)
+        return time_data, dict(zip(names, values)), file_fs
+
+    if is_packed_file(filepath):
+        if prefer is None and channels is not None and any(name != 'raw' for name in channels):
+            raise ValueError("Las grabaciones comprimidas solo tienen el canal raw")
+        time_data, raw = read_packed(filepath, t_start, t_end, progress)
+        data, has_time = {'raw': raw}, True
+    else:
+        # CSV y Arrow comparten la detección de columnas por nombre
+        arrow = is_arrow_file(filepath)
+        schema = arrow_schema(filepath) if arrow else sniff_csv_schema(filepath)
+        if prefer is not None:
+            channels = [pick_channel(schema, *prefer)]
+        read = read_arrow_file if arrow else read_ppg_csv
+        time_data, data = read(filepath, channels, t_start, t_end, fs, progress, schema)
+        has_time = schema['time'] is not None
+    if has_time and len(time_data) > 1 and time_data[-1] > time_data[0]:
+        # Equivale a 1 / mean(diff(t)) sin recorrer la columna
+        fs = float((len(time_data) - 1) / (time_data[-1] - time_data[0]))
+    return time_data, data, fs
+
 
 def load_ppg_from_csv(filepath):
     """
-    Carga una señal PPG desde el formato CSV 
+    Carga una señal PPG desde el formato CSV o desde un archivo de sesión
+    ``.h5`` (canal filtrado si existe)
     """
     try:
-        df = pd.read_csv(
-            filepath, 
-            usecols=["tiempo_s", "valor_filt"]
-            #tiempo_s	valor_filt
-
-        )
-        signal = df["valor_filt"].to_numpy()
-        avg_sample_period = np.mean(np.diff(df["tiempo_s"]))
-        fs = 1.0 / avg_sample_period
+        _, data, fs = load_signal_file(filepath, prefer=('filtered', 'raw'))
+        channel, signal = next(iter(data.items()))
         
-        print(f"Archivo CSV cargado exitosamente. fs calculado: {fs:.2f} Hz")
+        print(f"Archivo cargado exitosamente (canal '{channel}'). fs: {fs:.2f} Hz")
         return signal, fs
         
     except FileNotFoundError:
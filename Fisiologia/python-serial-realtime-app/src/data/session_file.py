@@ -0,0 +1,276 @@
+"""
+Archivo de sesión HDF5 (``.h5``) con canales, metadatos y resultados.
+
+Estructura del archivo::
+
+    /                  atributos: format, version, fs, device (JSON), created
+    /time              tiempos (s), float64
+    /channels/<nombre> un dataset por canal (raw, filtered, ...), mismo largo que /time
+    /tables/beats      un dataset por columna (onset_idx, sys_time, ...)
+    /tables/fiducials  un dataset por columna (foot, systolic_peak, ...)
+    /parameters        parámetros del análisis como atributos (JSON)
+
+Los datasets de señal se guardan por bloques de ``SESSION_FILE_CHUNK``
+muestras comprimidos con gzip + shuffle. ``SessionFile`` abre el archivo sin
+leer los datos: los canales se recortan por tiempo con una búsqueda binaria
+sobre ``/time`` y solo se descomprimen los bloques del rango pedido.
+"""
+import json
+import os
+from datetime import datetime
+import h5py
+import numpy as np
+from config.settings import SESSION_FILE_CHUNK, SESSION_FILE_COMPRESSION
+
+SESSION_FORMAT = 'ppg-session'
+SESSION_VERSION = 1
+SESSION_EXTENSIONS = ('.h5', '.hdf5')
+
+
+def is_session_file(path):
+    """Verifica por la extensión si la ruta es un archivo de sesión HDF5"""
+    return os.path.splitext(path)[1].lower() in SESSION_EXTENSIONS
+
+
+def _json_default(value):
+    """Convierte escalares y arreglos NumPy para ``json.dumps``"""
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    raise TypeError(f"Tipo no serializable: {type(value).__name__}")
+
+
+def _table_columns(table):
+    """Normaliza una tabla (lista de filas dict o dict de columnas) a columnas"""
+    if isinstance(table, dict):
+        return {name: np.asarray(values) for name, values in table.items()}
+    rows = list(table)
+    if not rows:
+        return {}
+    return {name: np.asarray([row[name] for row in rows]) for name in rows[0]}
+
+
+def save_session(path, time_data, channels, fs=None, device=None,
+                 beats=None, fiducials=None, parameters=None):
+    """Guarda una sesión completa en un archivo HDF5
+
+    El archivo se escribe en ``path + '.tmp'`` y se renombra al terminar, de
+    modo que nunca queda una sesión a medio escribir con el nombre final.
+
+    Args:
+        path (str): archivo de destino (``.h5``)
+        time_data (array-like): tiempos (s) de las muestras
+        channels (dict): nombre del canal → arreglo del mismo largo que ``time_data``
+        fs (float, optional): frecuencia de muestreo; si se omite se estima
+            de los tiempos
+        device (dict, optional): metadatos del equipo (puerto, baudios, formato...)
+        beats (list[dict] | dict, optional): tabla de latidos
+        fiducials (dict, optional): tabla de puntos fiduciales
+        parameters (dict, optional): parámetros calculados en el análisis
+
+    Returns:
+        str: ruta del archivo creado
+
+    Raises:
+        ValueError: si algún canal no tiene el largo de ``time_data``
+    """
+    time_data = np.asarray(time_data, dtype=np.float64)
+    n = len(time_data)
+    for name, values in channels.items():
+        if len(values) != n:
+            raise ValueError(f"El canal '{name}' no tiene el largo de la columna de tiempo")
+    if fs is None:
+        fs = 1.0 / np.mean(np.diff(time_data)) if n > 1 else 0.0
+
+    options = {'chunks': (max(min(SESSION_FILE_CHUNK, n), 1),),
+               'compression': 'gzip',
+               'compression_opts': SESSION_FILE_COMPRESSION,
+               'shuffle': True}
+
+    tmp_path = path + '.tmp'
+    with h5py.File(tmp_path, 'w') as h5:
+        h5.attrs['format'] = SESSION_FORMAT
+        h5.attrs['version'] = SESSION_VERSION
+        h5.attrs['fs'] = float(fs)
+        h5.attrs['device'] = json.dumps(device or {}, default=_json_default)
+        h5.attrs['created'] = datetime.now().isoformat(timespec='seconds')
+
+        h5.create_dataset('time', data=time_data, **options)
+        group = h5.create_group('channels')
+        for name, values in channels.items():
+            group.create_dataset(name, data=np.asarray(values, dtype=np.float64), **options)
+
+        tables = h5.create_group('tables')
+        for name, table in (('beats', beats), ('fiducials', fiducials)):
+            if table is None:
+                continue
+            table_group = tables.create_group(name)
+            for column, values in _table_columns(table).items():
+                table_group.create_dataset(column, data=values)
+
+        param_group = h5.create_group('parameters')
+        for name, value in (parameters or {}).items():
+            param_group.attrs[name] = json.dumps(value, default=_json_default)
+    os.replace(tmp_path, path)
+    return path
+
+
+class SessionFile:
+    """Lectura perezosa de un archivo de sesión HDF5
+
+    Se usa como gestor de contexto::
+
+        with SessionFile('registro.h5') as session:
+            t, raw = session.time_range(60.0, 120.0, ['raw'])
+    """
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): archivo de sesión
+
+        Raises:
+            ValueError: si el archivo no es una sesión de esta aplicación
+        """
+        self.path = path
+        self._file = h5py.File(path, 'r')
+        if self._file.attrs.get('format') != SESSION_FORMAT:
+            self._file.close()
+            raise ValueError(f"'{path}' no es un archivo de sesión PPG")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __len__(self):
+        return self._file['time'].shape[0]
+
+    def close(self):
+        """Cierra el archivo"""
+        self._file.close()
+
+    @property
+    def fs(self):
+        """Frecuencia de muestreo guardada (Hz)"""
+        return float(self._file.attrs['fs'])
+
+    @property
+    def device(self):
+        """Metadatos del equipo de adquisición"""
+        return json.loads(self._file.attrs.get('device', '{}'))
+
+    @property
+    def created(self):
+        """Fecha de creación (ISO 8601)"""
+        return self._file.attrs.get('created', '')
+
+    @property
+    def channels(self):
+        """Nombres de los canales guardados"""
+        return list(self._file['channels'].keys())
+
+    @property
+    def time(self):
+        """Dataset de tiempos (sin leer)"""
+        return self._file['time']
+
+    @property
+    def duration(self):
+        """Duración del registro (s), leyendo solo la primera y la última muestra"""
+        n = len(self)
+        if n < 2:
+            return 0.0
+        return float(self.time[n - 1] - self.time[0])
+
+    @property
+    def parameters(self):
+        """Parámetros del análisis guardados con la sesión"""
+        attrs = self._file['parameters'].attrs
+        return {name: json.loads(attrs[name]) for name in attrs}
+
+    def channel(self, name):
+        """Dataset de un canal (sin leer); se puede recortar con índices
+
+        Raises:
+            KeyError: si el canal no existe
+        """
+        return self._file['channels'][name]
+
+    def pick_channel(self, *preferred):
+        """Primer canal existente de ``preferred``, o el primero guardado
+
+        Raises:
+            ValueError: si la sesión no tiene canales
+        """
+        names = self.channels
+        if not names:
+            raise ValueError("La sesión no contiene canales")
+        for name in preferred:
+            if name in names:
+                return name
+        return names[0]
+
+    def _search(self, value):
+        """Primer índice con tiempo >= value (búsqueda binaria sobre el dataset)"""
+        time = self.time
+        lo, hi = 0, len(self)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if time[mid] < value:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def index_range(self, t_start=None, t_end=None):
+        """Índices [inicio, fin) de las muestras con tiempo en [t_start, t_end)
+
+        Args:
+            t_start (float, optional): tiempo inicial; None = desde el principio
+            t_end (float, optional): tiempo final; None = hasta el final
+
+        Returns:
+            tuple: (idx_start, idx_end)
+        """
+        idx_start = 0 if t_start is None else self._search(t_start)
+        idx_end = len(self) if t_end is None else self._search(t_end)
+        return idx_start, max(idx_start, idx_end)
+
+    def time_range(self, t_start=None, t_end=None, channels=None):
+        """Lee solo las muestras de un rango de tiempo
+
+        Args:
+            t_start (float, optional): tiempo inicial; None = desde el principio
+            t_end (float, optional): tiempo final; None = hasta el final
+            channels (list[str], optional): canales a leer; None = todos
+
+        Returns:
+            tuple: (time_data, canal1, canal2, ...) - np.ndarray float64
+        """
+        idx_start, idx_end = self.index_range(t_start, t_end)
+        names = self.channels if channels is None else channels
+        return (self.time[idx_start:idx_end],
+                *(self.channel(name)[idx_start:idx_end] for name in names))
+
+    def read_table(self, name):
+        """Lee una tabla de resultados (``beats`` o ``fiducials``)
+
+        Returns:
+            dict: columna → np.ndarray; vacío si la tabla no se guardó
+        """
+        tables = self._file['tables']
+        if name not in tables:
+            return {}
+        return {column: dataset[()] for column, dataset in tables[name].items()}
+
+    def table_rows(self, name):
+        """Tabla de resultados como lista de filas dict (formato de ``beats``)"""
+        columns = self.read_table(name)
+        if not columns:
+            return []
+        n = len(next(iter(columns.values())))
+        return [{column: values[i].item() for column, values in columns.items()}
+                for i in range(n)]
@@ -0,0 +1,304 @@
+"""
+Exportación de señales y tablas de resultados en los formatos de ``EXPORT_FORMATS``.
+
+Los escritores trabajan por bloques de ``EXPORT_CHUNK_ROWS`` filas: nunca se
+arma un DataFrame con la sesión completa y entre bloques se informa el avance
+y se consulta si la exportación fue cancelada. Cada archivo se escribe en
+``path + '.tmp'`` y se renombra al terminar; una exportación cancelada o
+fallida no deja archivos a medio escribir.
+
+- csv: encabezado y filas agregadas bloque a bloque
+- json: arreglo de registros ``[{"columna": valor, ...}, ...]`` escrito por partes
+- xlsx: libro de solo escritura de openpyxl (una hoja cada 1.048.575 filas)
+- parquet: un row group por bloque, comprimido con zstd (pyarrow)
+- feather: Arrow IPC sin comprimir, un lote por bloque (se lee con memory-map)
+
+En parquet y feather las señales de ``EXPORT_COLUMNS`` se guardan en float32
+y el tiempo en float64; las tablas conservan sus tipos (enteros, float).
+"""
+import os
+import numpy as np
+import pandas as pd
+from config.settings import (DEFAULT_EXPORT_FORMAT, EXPORT_CHUNK_ROWS, EXPORT_COLUMNS,
+                             EXPORT_FORMATS)
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc  # noqa: F401
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = pq = None
+
+# Filas de datos por hoja de Excel (el límite es 1.048.576 con el encabezado)
+XLSX_MAX_ROWS = 1048575
+
+
+class ExportCancelled(Exception):
+    """La exportación se canceló antes de terminar"""
+
+
+def signal_columns(time_data, raw=None, filtered=None, normalized=None):
+    """Columnas de una exportación de señales con los nombres de ``EXPORT_COLUMNS``
+
+    Los argumentos siguen el orden de ``EXPORT_COLUMNS`` (tiempo, crudo,
+    filtrado, normalizado); los canales omitidos no se exportan.
+
+    Returns:
+        dict: nombre de columna → arreglo, en el orden de ``EXPORT_COLUMNS``
+    """
+    values = (time_data, raw, filtered, normalized)
+    return {name: value for name, value in zip(EXPORT_COLUMNS, values) if value is not None}
+
+
+def table_columns(rows, columns=None):
+    """Convierte una lista de filas dict (o pares clave/valor) en columnas
+
+    Args:
+        rows (list[dict] | dict): filas, o un dict de parámetros que se
+            exporta como dos columnas ``Parametro``/``Valor``
+        columns (list[str], optional): orden de las columnas
+
+    Returns:
+        dict: nombre de columna → lista de valores
+    """
+    if isinstance(rows, dict):
+        return {'Parametro': list(rows.keys()), 'Valor': list(rows.values())}
+    rows = list(rows)
+    if columns is None:
+        columns = list(rows[0]) if rows else []
+    return {name: [row[name] for row in rows] for name in columns}
+
+
+def export_path(base_path, fmt):
+    """Ruta de exportación con la extensión del formato"""
+    return f"{base_path}.{fmt}"
+
+
+def export_table(path, columns, fmt=None, progress=None, cancelled=None,
+                 chunk_rows=EXPORT_CHUNK_ROWS):
+    """Escribe columnas de igual largo en CSV, JSON, XLSX, Parquet o Feather por bloques
+
+    Args:
+        path (str): archivo de destino
+        columns (dict): nombre de columna → arreglo o lista
+        fmt (str, optional): formato; None = según la extensión de ``path``
+            (o ``DEFAULT_EXPORT_FORMAT``)
+        progress (callable, optional): recibe la fracción escrita (0 a 1)
+        cancelled (callable, optional): devuelve True para abortar
+        chunk_rows (int, optional): filas por bloque
+
+    Returns:
+        str: ruta del archivo creado
+
+    Raises:
+        ValueError: si el formato no está en ``EXPORT_FORMATS`` o las
+            columnas tienen largos distintos
+        ExportCancelled: si ``cancelled()`` devolvió True
+    """
+    if fmt is None:
+        fmt = os.path.splitext(path)[1].lstrip('.').lower() or DEFAULT_EXPORT_FORMAT
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportación no soportado: {fmt}")
+    names = list(columns)
+    n = len(columns[names[0]]) if names else 0
+    if any(len(columns[name]) != n for name in names):
+        raise ValueError("Las columnas a exportar tienen largos distintos")
+
+    writer = {'csv': _CsvWriter, 'json': _JsonWriter, 'xlsx': _XlsxWriter,
+              'parquet': _ParquetWriter, 'feather': _FeatherWriter}[fmt]
+    tmp_path = path + '.tmp'
+    try:
+        with writer(tmp_path, names) as out:
+            for start in range(0, n, chunk_rows):
+                if cancelled is not None and cancelled():
+                    raise ExportCancelled(path)
+                stop = min(start + chunk_rows, n)
+                out.write(pd.DataFrame({name: columns[name][start:stop] for name in names}))
+                if progress is not None:
+                    progress(stop / n)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    if progress is not None:
+        progress(1.0)
+    return path
+
+
+class _CsvWriter:
+    """CSV con encabezado; cada bloque se agrega al final"""
+
+    def __init__(self, path, names):
+        self._file = open(path, 'w', newline='', encoding='utf-8')
+        self._file.write(','.join(names) + '\n')
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+    def write(self, chunk):
+        chunk.to_csv(self._file, header=False, index=False)
+
+
+class _JsonWriter:
+    """Arreglo JSON de registros escrito bloque a bloque"""
+
+    def __init__(self, path, names):
+        self._file = open(path, 'w', encoding='utf-8')
+        self._file.write('[')
+        self._first = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self._file.write(']\n')
+        self._file.close()
+
+    def write(self, chunk):
+        records = chunk.to_json(orient='records', double_precision=10)[1:-1]
+        if not records:
+            return
+        if not self._first:
+            self._file.write(',')
+        self._file.write(records)
+        self._first = False
+
+
+class _XlsxWriter:
+    """Libro de openpyxl en modo de solo escritura (no retiene las filas en memoria)"""
+
+    def __init__(self, path, names):
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise ValueError("La exportación a xlsx requiere el paquete openpyxl") from None
+        self.path = path
+        self.names = names
+        self._book = Workbook(write_only=True)
+        self._sheet = None
+        self._rows = XLSX_MAX_ROWS
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, *exc):
+        if self._sheet is None:
+            self._new_sheet()
+        if exc_type is None:
+            self._book.save(self.path)
+        else:
+            self._book.close()
+
+    def _new_sheet(self):
+        self._sheet = self._book.create_sheet(f"datos_{len(self._book.worksheets) + 1}")
+        self._sheet.append(self.names)
+        self._rows = 0
+
+    def write(self, chunk):
+        for row in chunk.itertuples(index=False):
+            if self._rows >= XLSX_MAX_ROWS:
+                self._new_sheet()
+            # Valores nativos de Python: openpyxl no acepta escalares NumPy
+            self._sheet.append([value.item() if isinstance(value, np.generic) else value
+                                for value in row])
+            self._rows += 1
+
+
+def _arrow_table(chunk):
+    """Bloque → tabla Arrow: señales en float32, columnas mixtas como texto"""
+    arrays = []
+    for name in chunk.columns:
+        column = chunk[name]
+        if name in EXPORT_COLUMNS[1:]:
+            arrays.append(pa.array(column.to_numpy(dtype=np.float32)))
+            continue
+        try:
+            arrays.append(pa.array(column, from_pandas=True))
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            arrays.append(pa.array(column.astype(str)))
+    return pa.Table.from_arrays(arrays, names=list(chunk.columns))
+
+
+class _ArrowWriter:
+    """Base de Parquet y Feather: el esquema lo fija el primer bloque"""
+
+    def __init__(self, path, names):
+        if pa is None:
+            raise ValueError("La exportación a Parquet/Feather requiere el paquete pyarrow")
+        self.path = path
+        self.names = names
+        self._schema = None
+        self._writer = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if self._writer is None:
+            # Sin filas: archivo válido con las columnas
+            self.write(pd.DataFrame({name: pd.Series(dtype=np.float64) for name in self.names}))
+        self._close()
+
+    def write(self, chunk):
+        table = _arrow_table(chunk)
+        if self._writer is None:
+            self._schema = table.schema
+            self._open()
+        elif table.schema != self._schema:
+            table = table.cast(self._schema)
+        if table.num_rows:
+            self._write(table)
+
+
+class _ParquetWriter(_ArrowWriter):
+    """Parquet con un row group por bloque (la lectura por tiempo salta grupos)"""
+
+    def _open(self):
+        self._writer = pq.ParquetWriter(self.path, self._schema, compression='zstd')
+
+    def _write(self, table):
+        self._writer.write_table(table, row_group_size=table.num_rows)
+
+    def _close(self):
+        self._writer.close()
+
+
+class _FeatherWriter(_ArrowWriter):
+    """Feather (Arrow IPC) sin comprimir para leerlo con memory-map"""
+
+    def _open(self):
+        self._sink = pa.OSFile(self.path, 'wb')
+        self._writer = pa.ipc.new_file(self._sink, self._schema)
+
+    def _write(self, table):
+        self._writer.write_table(table)
+
+    def _close(self):
+        self._writer.close()
+        self._sink.close()
+
+
+def save_analysis_results(base_path, parameters=None, beats=None, fmt=DEFAULT_EXPORT_FORMAT):
+    """Guarda parámetros y tabla de latidos (``<base>_parametros``, ``<base>_fiduciales``)
+
+    Returns:
+        list[str]: archivos creados
+    """
+    saved = []
+    if parameters:
+        saved.append(export_table(export_path(f"{base_path}_parametros", fmt),
+                                  table_columns(parameters), fmt))
+    if beats:
+        saved.append(export_table(export_path(f"{base_path}_fiduciales", fmt),
+                                  table_columns(beats), fmt))
+    return saved
+
+
+def save_ppg_to_csv(path, time_data, raw=None, filtered=None, normalized=None):
+    """Guarda señales en CSV con las columnas de ``EXPORT_COLUMNS``"""
+    return export_table(path, signal_columns(time_data, raw, filtered, normalized), 'csv')
+
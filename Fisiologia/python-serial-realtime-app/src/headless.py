@@ -0,0 +1,302 @@
+"""
+Adquisición sin interfaz gráfica para equipos de registro desatendidos.
+
+No importa PyQt5: usa el núcleo ``SerialSession`` + ``PPGStreamProcessor``,
+analiza la señal periódicamente y graba las muestras con ``SessionRecorder``
+en un CSV con las mismas columnas que las exportaciones de la aplicación
+gráfica (``timestamp``, ``raw_signal``) o, si la salida termina en ``.ppgz``, comprimidas. Mientras
+dura la adquisición se graba en ``<salida>.part`` con fsync periódico; ante un
+corte, ``SessionRecorder.recover`` conserva todo salvo el último bloque.
+
+Con ``--backend asyncio`` un solo bucle de eventos atiende todos los puertos
+indicados (``loop.add_reader`` por puerto, sin un hilo por dispositivo).
+
+Uso::
+
+    python src/headless.py /dev/ttyUSB0 --output sesion.csv --duration 600
+    python src/headless.py /dev/ttyUSB0 /dev/ttyUSB1 --backend asyncio -o sesion.csv
+"""
+import argparse
+import asyncio
+import os
+import queue
+import signal
+import sys
+import time
+
+# Agregar el directorio src al path para importaciones
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+# Sin pantalla: evitar que matplotlib (vía heartpy) elija un backend Qt
+os.environ.setdefault('MPLBACKEND', 'Agg')
+
+import numpy as np
+import serial
+from config.settings import (DEFAULT_PORT, DEFAULT_BAUD, SERIAL_BATCH_INTERVAL,
+                             SERIAL_PROTOCOL, SAMPLING_FREQUENCY)
+from core.acquisition.async_reader import AsyncSerialReader
+from core.acquisition.serial_session import SerialSession
+from core.acquisition.session_recorder import SessionRecorder, format_for_path
+from core.processing.stream_processor import PPGStreamProcessor
+
+
+def run_headless(port, baudrate=DEFAULT_BAUD, protocol=SERIAL_PROTOCOL,
+                 sample_rate=SAMPLING_FREQUENCY, output=None, duration=None,
+                 analysis_interval=5.0):
+    """Adquiere, analiza y graba hasta cumplir la duración o recibir SIGINT/SIGTERM
+
+    Args:
+        port (str): puerto o URL de pyserial (p. ej. '/dev/ttyUSB0', 'socket://host:puerto')
+        baudrate (int, optional): velocidad del puerto
+        protocol (str, optional): 'text' o 'binary'
+        sample_rate (float, optional): frecuencia de muestreo nominal (Hz)
+        output (str, optional): CSV o ``.ppgz`` de salida; sin él no se graba
+        duration (float, optional): segundos de adquisición; None = sin límite
+        analysis_interval (float, optional): segundos entre análisis de FC/HRV
+
+    Returns:
+        int: muestras recibidas
+    """
+    events = queue.Queue()
+    session = SerialSession(
+        SERIAL_BATCH_INTERVAL, protocol, sample_rate,
+        on_batch=lambda timestamps, values: events.put(('batch', timestamps, values)),
+        on_gap=lambda gap_time, missing: events.put(('gap', gap_time, missing)),
+        on_error=lambda message: events.put(('error', message, None)),
+    )
+    processor = PPGStreamProcessor(sample_rate,
+                                   on_gap=lambda t, missing: print(
+                                       f"Hueco de {missing} muestras perdidas en t = {t:.2f} s",
+                                       flush=True))
+
+    # Detener limpiamente ante Ctrl+C o SIGTERM (systemd, docker stop)
+    stop_requested = []
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop_requested.append(signum))
+
+    # Primero el puerto: si no abre, no queda una grabación vacía
+    serial_port = serial.serial_for_url(port, baudrate, timeout=1)
+    writer = None
+    received = 0
+    try:
+        if output:
+            writer = _start_recorder(output, lambda message: events.put(
+                ('recorder_error', message, None)))
+        print(f"Adquiriendo de {port} @ {baudrate} ({protocol})", flush=True)
+        session.start(serial_port)
+
+        start = time.monotonic()
+        next_analysis = start + analysis_interval
+        while not stop_requested and session.is_reading():
+            now = time.monotonic()
+            if duration is not None and now - start >= duration:
+                break
+
+            try:
+                kind, first, second = events.get(timeout=0.1)
+            except queue.Empty:
+                kind = None
+
+            if kind == 'batch':
+                received += _consume_batch(processor, writer, first, second)
+            elif kind == 'gap':
+                processor.mark_gap(first, second)
+            elif kind == 'error':
+                print(f"Error serie: {first}", flush=True)
+                break
+            elif kind == 'recorder_error':
+                print(f"Error de grabación: {first}", flush=True)
+                break
+
+            if now >= next_analysis:
+                next_analysis = now + analysis_interval
+                _report(processor, session)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        session.stop()
+        # Entregar lo que quedó en la cola al detener la lectura
+        while not events.empty():
+            kind, first, second = events.get_nowait()
+            if kind == 'batch':
+                received += _consume_batch(processor, writer, first, second)
+        if serial_port.is_open:
+            serial_port.close()
+        if writer is not None:
+            writer.finalize(output)
+            print(f"{writer.samples} muestras guardadas en {output}", flush=True)
+
+    return received
+
+
+def _start_recorder(output, on_error):
+    """Inicia la grabación en ``<output>.part`` con el formato de la extensión"""
+    recorder = SessionRecorder(output + '.part', fmt=format_for_path(output), on_error=on_error)
+    recorder.start()
+    return recorder
+
+
+def _output_path(output, port):
+    """CSV de un puerto cuando se graban varios: sesion.csv -> sesion_ttyUSB0.csv"""
+    base, ext = os.path.splitext(output)
+    name = ''.join(c if c.isalnum() else '_' for c in os.path.basename(port))
+    return f"{base}_{name}{ext or '.csv'}"
+
+
+class _AsyncChannel:
+    """Puerto atendido por el bucle asyncio con su procesador y su grabación"""
+
+    def __init__(self, port, serial_port):
+        self.port = port
+        self.serial_port = serial_port
+        self.reader = None
+        self.processor = None
+        self.writer = None
+        self.output = None
+        self.received = 0
+
+
+async def run_headless_async(ports, baudrate=DEFAULT_BAUD, protocol=SERIAL_PROTOCOL,
+                             sample_rate=SAMPLING_FREQUENCY, output=None, duration=None,
+                             analysis_interval=5.0):
+    """Adquiere de varios puertos en un solo bucle de eventos
+
+    Los argumentos son los de run_headless; con más de un puerto, output se
+    usa como prefijo y se graba un archivo por puerto.
+
+    Returns:
+        dict: muestras recibidas por puerto
+    """
+    loop = asyncio.get_running_loop()
+    stop_requested = asyncio.Event()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signum, stop_requested.set)
+
+    ports = list(dict.fromkeys(ports))  # un puerto repetido pisaría su propia grabación
+    channels = []
+    try:
+        # Primero todos los puertos: si alguno no abre, no queda ninguna grabación vacía
+        for port in ports:
+            channels.append(_AsyncChannel(port, serial.serial_for_url(port, baudrate, timeout=0)))
+
+        for channel in channels:
+            port = channel.port
+            channel.reader = AsyncSerialReader(channel.serial_port, protocol, sample_rate)
+            channel.processor = PPGStreamProcessor(
+                sample_rate,
+                on_gap=lambda t, missing, port=port: print(
+                    f"[{port}] Hueco de {missing} muestras perdidas en t = {t:.2f} s", flush=True))
+            if output:
+                channel.output = output if len(ports) == 1 else _output_path(output, port)
+                channel.writer = _start_recorder(
+                    channel.output,
+                    lambda message, port=port: loop.call_soon_threadsafe(
+                        _recorder_failed, port, message, stop_requested))
+            print(f"Adquiriendo de {port} @ {baudrate} ({protocol}, asyncio)", flush=True)
+
+        for channel in channels:
+            channel.reader.start(loop)
+
+        async def consume(channel):
+            try:
+                async for timestamps, values, gaps in channel.reader:
+                    channel.received += _consume_batch(channel.processor, channel.writer,
+                                                       timestamps, values)
+                    for gap_time, missing in gaps:
+                        channel.processor.mark_gap(gap_time, missing)
+            except Exception as e:
+                print(f"[{channel.port}] Error serie: {e}", flush=True)
+
+        async def report():
+            while True:
+                await asyncio.sleep(analysis_interval)
+                for channel in channels:
+                    _report(channel.processor, channel.reader, label=channel.port)
+
+        consumers = asyncio.gather(*(consume(channel) for channel in channels))
+        reporter = asyncio.create_task(report())
+        stopper = asyncio.create_task(stop_requested.wait())
+        # Termina al cumplir la duración, ante una señal o si todos los puertos fallan
+        await asyncio.wait({consumers, stopper}, timeout=duration,
+                           return_when=asyncio.FIRST_COMPLETED)
+        reporter.cancel()
+        stopper.cancel()
+
+        for channel in channels:
+            channel.reader.stop()
+        await consumers
+    finally:
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            loop.remove_signal_handler(signum)
+        for channel in channels:
+            if channel.serial_port.is_open:
+                channel.serial_port.close()
+            if channel.writer is not None:
+                channel.writer.finalize(channel.output)
+                print(f"{channel.writer.samples} muestras guardadas en {channel.output}",
+                      flush=True)
+
+    return {channel.port: channel.received for channel in channels}
+
+
+def _recorder_failed(port, message, stop_requested):
+    """Informa un error de grabación (desde el bucle) y detiene la adquisición"""
+    print(f"[{port}] Error de grabación: {message}", flush=True)
+    stop_requested.set()
+
+
+def _consume_batch(processor, writer, timestamps, values):
+    """Agrega un lote al procesador y lo graba con tiempos relativos"""
+    count = processor.append_many(timestamps, values)
+    if writer is not None and count:
+        writer.write(np.asarray(timestamps) - processor.start_time, values)
+    return count
+
+
+def _report(processor, session, label=None):
+    """Analiza la última ventana e imprime FC, HRV y estado del lector"""
+    results = processor.analyze_latest()
+    stats = session.get_stats() or {}
+    hr = f"{results['heart_rate']:.1f} BPM" if results and results['heart_rate'] else "-- BPM"
+    hrv = f"{results['hrv']:.1f} ms" if results and results['hrv'] else "-- ms"
+    prefix = f"[{label}] " if label else ""
+    print(f"{prefix}FC: {hr} · HRV: {hrv} · "
+          f"{stats.get('samples_per_s', 0):.0f} muestras/s · "
+          f"{stats.get('lost_samples', 0)} perdidas", flush=True)
+
+
+def main(argv=None):
+    """Punto de entrada de la línea de comandos"""
+    parser = argparse.ArgumentParser(description="Adquisición PPG sin interfaz gráfica")
+    parser.add_argument('ports', nargs='*', default=[DEFAULT_PORT],
+                        help=f"puertos serie o URLs de pyserial (por defecto {DEFAULT_PORT})")
+    parser.add_argument('--baud', type=int, default=DEFAULT_BAUD, help="velocidad del puerto")
+    parser.add_argument('--protocol', choices=('text', 'binary'), default=SERIAL_PROTOCOL,
+                        help="formato de los datos del dispositivo")
+    parser.add_argument('--fs', type=float, default=SAMPLING_FREQUENCY,
+                        help="frecuencia de muestreo nominal (Hz)")
+    parser.add_argument('--backend', choices=('thread', 'asyncio'), default='thread',
+                        help="un hilo lector (un puerto) o un bucle asyncio (varios puertos)")
+    parser.add_argument('-o', '--output',
+                        help="CSV o .ppgz donde grabar las muestras (prefijo si hay varios puertos)")
+    parser.add_argument('--duration', type=float, help="segundos de adquisición (sin límite si se omite)")
+    parser.add_argument('--analysis-interval', type=float, default=5.0,
+                        help="segundos entre análisis de FC/HRV")
+    args = parser.parse_args(argv)
+    if args.backend == 'thread' and len(args.ports) > 1:
+        parser.error("varios puertos requieren --backend asyncio")
+
+    try:
+        if args.backend == 'asyncio':
+            asyncio.run(run_headless_async(args.ports, args.baud, args.protocol, args.fs,
+                                           args.output, args.duration, args.analysis_interval))
+        else:
+            run_headless(args.ports[0], args.baud, args.protocol, args.fs, args.output,
+                         args.duration, args.analysis_interval)
+    except serial.SerialException as e:
+        print(f"Error de conexión: {e}", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
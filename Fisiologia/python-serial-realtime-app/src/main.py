@@ -3,6 +3,7 @@ Archivo principal de la aplicación PPG Analyzer
 """
 import sys
 import os
+import multiprocessing
 
 # Agregar el directorio src al path para importaciones
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -24,4 +25,6 @@ def main():
     sys.exit(app.exec_())
 
 if __name__ == '__main__':
+    # Necesario para los procesos hijos (catálogo, adquisición) en el ejecutable de PyInstaller
+    multiprocessing.freeze_support()
     main()
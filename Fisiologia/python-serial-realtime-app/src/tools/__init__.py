@@ -0,0 +1,7 @@
+"""
+Módulo tools - Herramientas de prueba y diagnóstico.
+
+Este módulo contiene:
+- Puerto serie virtual que reproduce grabaciones (virtual_serial.py)
+- Compresión de grabaciones CSV a .ppgz para archivarlas (pack_recordings.py)
+"""
@@ -0,0 +1,85 @@
+"""
+Convierte grabaciones CSV a grabaciones comprimidas ``.ppgz`` para archivarlas.
+
+Cada CSV con columna de tiempo y canal raw se guarda junto al original con
+extensión ``.ppgz`` (ver ``data/packed_recording.py``); los CSV originales no
+se borran. Se informa el tamaño antes y después de cada archivo.
+
+Uso::
+
+    python src/tools/pack_recordings.py ~/ppg_recordings
+    python src/tools/pack_recordings.py grabacion1.csv grabacion2.csv --check
+"""
+import argparse
+import os
+import sys
+
+import numpy as np
+
+# Agregar el directorio src al path para importaciones
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.processing.delta_codec import is_integer_valued
+from data.csv_loader import read_ppg_csv
+from data.packed_recording import PACKED_EXTENSION, pack_csv, read_packed
+
+
+def find_csv(paths):
+    """CSV de la lista, expandiendo carpetas (sin subcarpetas)"""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found += sorted(os.path.join(path, name) for name in os.listdir(path)
+                            if name.lower().endswith('.csv'))
+        else:
+            found.append(path)
+    return found
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Comprime grabaciones CSV a .ppgz")
+    parser.add_argument('paths', nargs='+', help="archivos CSV o carpetas")
+    parser.add_argument('--check', action='store_true',
+                        help="releer cada archivo comprimido y compararlo con el CSV")
+    parser.add_argument('--overwrite', action='store_true',
+                        help="rehacer los .ppgz que ya existen")
+    args = parser.parse_args(argv)
+
+    total_before = total_after = 0
+    failed = 0
+    for csv_path in find_csv(args.paths):
+        out_path = os.path.splitext(csv_path)[0] + PACKED_EXTENSION
+        if os.path.exists(out_path) and not args.overwrite:
+            print(f"{csv_path}: ya existe {out_path}, se omite")
+            continue
+        try:
+            pack_csv(csv_path, out_path)
+            if args.check:
+                time_data, data = read_ppg_csv(csv_path, ['raw'], dtype=np.float64)
+                packed_time, packed_raw = read_packed(out_path)
+                # Las cuentas enteras se guardan exactas; los valores con decimales, en float32
+                expected = data['raw']
+                if not is_integer_valued(expected):
+                    expected = expected.astype(np.float32).astype(np.float64)
+                if not (np.allclose(time_data, packed_time, rtol=0, atol=1e-6)
+                        and np.array_equal(expected, packed_raw)):
+                    raise ValueError("el archivo comprimido no coincide con el CSV")
+        except (OSError, ValueError) as e:
+            print(f"{csv_path}: error: {e}")
+            failed += 1
+            continue
+        before, after = os.path.getsize(csv_path), os.path.getsize(out_path)
+        total_before += before
+        total_after += after
+        print(f"{csv_path}: {before / 1024:.1f} kB → {after / 1024:.1f} kB "
+              f"({before / max(after, 1):.1f}x)")
+
+    if total_after:
+        print(f"Total: {total_before / 1024 ** 2:.1f} MB → {total_after / 1024 ** 2:.1f} MB "
+              f"({total_before / total_after:.1f}x)")
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+Dispositivo serie virtual (pty) que reproduce grabaciones CSV.
+
+Crea un pseudo-terminal y escribe en él las muestras de una grabación en
+cualquiera de los formatos que acepta la aplicación, para probar
+SerialReader → PPGProcessor → AcquisitionTab sin hardware. La aplicación se
+conecta al puerto que se imprime al iniciar (p. ej. ``/dev/pts/5``).
+
+Uso::
+
+    python src/tools/virtual_serial.py src/data/datos_crudos_naza1.csv --format raw --speed 1
+    python src/tools/virtual_serial.py grabacion.csv --format triple --speed 0   # lo más rápido posible
+    python src/tools/virtual_serial.py grabacion.csv --ramp --jitter 2 --drop 0.01 --garbage 0.001
+
+Con ``--ramp`` la velocidad se multiplica periódicamente hasta que las
+escrituras se atrasan (el pty se llena porque la aplicación no lee a ese
+ritmo) y se informa la última tasa sostenida.
+
+Solo funciona en sistemas con pty (Linux, macOS).
+"""
+import argparse
+import os
+import sys
+import time
+import tty
+
+import numpy as np
+import pandas as pd
+
+# Agregar el directorio src al path para importaciones
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from core.processing.binary_protocol import encode_frames
+from config.settings import BINARY_FRAME_DTYPE
+
+#: Formatos de salida soportados
+FORMATS = ('raw', 'triple', 'plain', 'binary')
+
+#: Muestras por escritura con --speed 0 (sin reloj que marque el bloque)
+FAST_BLOCK_SIZE = 256
+
+
+def load_recording(filepath):
+    """Carga una grabación CSV (tiempo + uno a tres canales)
+
+    Acepta los CSV que genera la aplicación: ``tiempo_s,valor_raw``,
+    ``tiempo_s,valor_filt``, ``tiempo_relativo_s,Crudo,Filtrado,Normalizado``.
+
+    Returns:
+        tuple: (channels, fs) - matriz (muestras x 3) con crudo, filtrado y
+        normalizado, y frecuencia de muestreo estimada
+    """
+    df = pd.read_csv(filepath).dropna()
+    if df.shape[1] < 2:
+        raise ValueError("La grabación debe tener una columna de tiempo y al menos un canal")
+
+    t = df.iloc[:, 0].to_numpy(dtype=np.float64)
+    values = df.iloc[:, 1:4].to_numpy(dtype=np.float64)
+
+    # Completar los canales faltantes a partir del primero
+    if values.shape[1] < 2:
+        values = np.column_stack([values[:, 0], values[:, 0]])
+    if values.shape[1] < 3:
+        std = np.std(values[:, 1]) or 1.0
+        values = np.column_stack([values, (values[:, 1] - np.mean(values[:, 1])) / std])
+
+    # Los tiempos grabados por el host vienen en ráfagas: se usa la tasa media
+    duration = t[-1] - t[0]
+    fs = (len(t) - 1) / duration if len(t) > 1 and duration > 0 else 100.0
+    return values, fs
+
+
+def fits_int16(values):
+    """Verifica que los valores redondeados entren en int16"""
+    rounded = np.round(values)
+    return bool(np.all((rounded >= -32768) & (rounded <= 32767)))
+
+
+def binary_frame_dtype(values, requested=BINARY_FRAME_DTYPE):
+    """Tipo de los canales de las tramas binarias para una grabación
+
+    Args:
+        values (np.ndarray): matriz (muestras x 3) de toda la grabación
+        requested (str, optional): 'int16' o 'float32'
+
+    Returns:
+        str: ``requested``, o 'float32' si se pidió int16 y algún valor no
+        entra (recortarlo enviaría una señal saturada)
+    """
+    if np.dtype(requested) == np.int16 and not fits_int16(values):
+        return 'float32'
+    return requested
+
+
+def encode_samples(values, fmt, start_seq=0, binary_dtype=BINARY_FRAME_DTYPE):
+    """Codifica un bloque de muestras en el formato de salida
+
+    Args:
+        values (np.ndarray): matriz (muestras x 3)
+        fmt (str): 'raw', 'triple', 'plain' o 'binary'
+        binary_dtype (str, optional): tipo de los canales en modo binario
+
+    Returns:
+        list: un elemento bytes por muestra
+
+    Raises:
+        ValueError: si el formato es desconocido o, en int16, un valor no entra
+    """
+    if fmt == 'binary':
+        if np.dtype(binary_dtype) == np.int16:
+            if not fits_int16(values):
+                raise ValueError("Valores fuera del rango de int16: use binary_dtype='float32'")
+            values = np.round(values)
+        data = encode_frames(values, start_seq=start_seq, channel_dtype=binary_dtype)
+        size = len(data) // len(values)
+        return [data[i:i + size] for i in range(0, len(data), size)]
+    if fmt == 'raw':
+        return [f"Raw:{v:.4f}\n".encode() for v in values[:, 0]]
+    if fmt == 'triple':
+        return [f"Crudo:{c:.4f},Filtrado:{f:.4f},Normalizado:{n:.4f}\n".encode()
+                for c, f, n in values]
+    if fmt == 'plain':
+        return [f"{v:.4f}\n".encode() for v in values[:, 0]]
+    raise ValueError(f"Formato desconocido: {fmt}")
+
+
+class VirtualSerialDevice:
+    """Reproduce una grabación por un pty con velocidad y fallas configurables"""
+
+    def __init__(self, values, fs, fmt='raw', speed=1.0, jitter_ms=0.0,
+                 drop_prob=0.0, garbage_prob=0.0, loop=True, seed=None,
+                 binary_dtype=BINARY_FRAME_DTYPE):
+        """
+        Args:
+            values (np.ndarray): matriz (muestras x 3)
+            fs (float): frecuencia de muestreo nominal, a la que se emiten las muestras
+            fmt (str, optional): formato de salida. Defaults to 'raw'.
+            speed (float, optional): factor de velocidad; 0 = lo más rápido posible
+            jitter_ms (float, optional): desvío estándar del retardo agregado a cada envío
+            drop_prob (float, optional): probabilidad de descartar una muestra
+            garbage_prob (float, optional): probabilidad de insertar bytes basura
+            loop (bool, optional): repetir la grabación al terminar
+            seed (int, optional): semilla para las fallas aleatorias
+            binary_dtype (str, optional): tipo de los canales en modo binario;
+                si se pide int16 y la grabación no entra se usa float32
+                (ver ``binary_frame_dtype``)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Formato desconocido: {fmt}")
+        self.time_data = np.arange(len(values)) / fs
+        self.values = values
+        self.fs = fs
+        self.fmt = fmt
+        self.binary_dtype = binary_frame_dtype(values, binary_dtype) if fmt == 'binary' else binary_dtype
+        self.speed = speed
+        self.jitter_ms = jitter_ms
+        self.drop_prob = drop_prob
+        self.garbage_prob = garbage_prob
+        self.loop = loop
+        self.rng = np.random.default_rng(seed)
+
+        self.master_fd = None
+        self.slave_fd = None
+        self.port_name = None
+
+        # Estadísticas
+        self.samples_sent = 0
+        self.samples_dropped = 0
+        self.bytes_sent = 0
+        self.max_lag = 0.0
+
+    def open(self):
+        """Crea el pty y devuelve el nombre del puerto para la aplicación"""
+        self.master_fd, self.slave_fd = os.openpty()
+        tty.setraw(self.slave_fd)
+        self.port_name = os.ttyname(self.slave_fd)
+        return self.port_name
+
+    def close(self):
+        """Cierra el pty"""
+        for fd in (self.master_fd, self.slave_fd):
+            if fd is not None:
+                os.close(fd)
+        self.master_fd = self.slave_fd = None
+
+    def _write(self, data):
+        """Escritura completa (bloqueante) en el lado maestro del pty"""
+        view = memoryview(data)
+        while view:
+            written = os.write(self.master_fd, view)
+            view = view[written:]
+        self.bytes_sent += len(data)
+
+    def _build_block(self, start, stop, seq):
+        """Codifica las muestras [start, stop) aplicando descartes y basura"""
+        encoded = encode_samples(self.values[start:stop], self.fmt, start_seq=seq,
+                                 binary_dtype=self.binary_dtype)
+        if self.drop_prob > 0:
+            keep = self.rng.random(len(encoded)) >= self.drop_prob
+            self.samples_dropped += int(np.sum(~keep))
+            encoded = [e for e, k in zip(encoded, keep) if k]
+        if self.garbage_prob > 0:
+            for i in np.flatnonzero(self.rng.random(len(encoded)) < self.garbage_prob):
+                garbage = self.rng.integers(0, 256, int(self.rng.integers(1, 16)), dtype=np.uint8)
+                encoded[i] = garbage.tobytes() + encoded[i]
+        self.samples_sent += len(encoded)
+        return b''.join(encoded)
+
+    def run(self, duration=None, ramp_factor=None, ramp_step_s=5.0, max_lag_s=0.5,
+            report_interval_s=2.0):
+        """Reproduce la grabación hasta 'duration' segundos o Ctrl+C
+
+        Args:
+            duration (float, optional): duración de la prueba en segundos
+            ramp_factor (float, optional): si se indica, multiplica la velocidad
+                cada 'ramp_step_s' segundos hasta que la aplicación se atrasa
+            max_lag_s (float, optional): atraso a partir del cual se considera
+                que la aplicación no sostiene la tasa
+
+        Returns:
+            float | None: última tasa sostenida (muestras/s) en modo rampa
+        """
+        n = len(self.values)
+        idx = 0
+        seq = 0
+        offset = 0.0             # tiempo de grabación de las vueltas previas
+        t0 = time.monotonic()
+        t_ref, rec_ref = t0, 0.0  # referencia de reloj para la velocidad actual
+        last_report = last_ramp = t0
+        sent_at_report = 0
+        sustained_rate = None
+
+        while duration is None or time.monotonic() - t0 < duration:
+            if self.speed > 0:
+                block = max(1, int(self.fs * 0.005 * max(self.speed, 1)))  # ~5 ms de datos
+            else:
+                block = FAST_BLOCK_SIZE
+            stop = min(idx + block, n)
+            if self.speed > 0:
+                # Esperar al instante programado de la primera muestra del bloque
+                scheduled = t_ref + (offset + self.time_data[idx] - rec_ref) / self.speed
+                if self.jitter_ms > 0:
+                    scheduled += abs(self.rng.normal(0, self.jitter_ms / 1000.0))
+                delay = scheduled - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+
+            self._write(self._build_block(idx, stop, seq))
+            seq += stop - idx
+            rec_last = offset + self.time_data[stop - 1]
+
+            now = time.monotonic()
+            if self.speed > 0:
+                lag = now - (t_ref + (rec_last - rec_ref) / self.speed)
+                self.max_lag = max(self.max_lag, lag)
+                if ramp_factor and lag > max_lag_s:
+                    print(f"La aplicación se atrasa a {self.fs * self.speed:.0f} muestras/s "
+                          f"(atraso {lag:.2f} s)")
+                    return sustained_rate
+
+            if now - last_report >= report_interval_s:
+                rate = (self.samples_sent - sent_at_report) / (now - last_report)
+                print(f"[{now - t0:7.1f} s] {rate:9.1f} muestras/s · "
+                      f"{self.bytes_sent / 1024:9.1f} kB · atraso máx {self.max_lag * 1000:.0f} ms")
+                last_report = now
+                sent_at_report = self.samples_sent
+
+            if ramp_factor and self.speed > 0 and now - last_ramp >= ramp_step_s:
+                # El escalón terminó sin atraso: subir la velocidad
+                sustained_rate = self.fs * self.speed
+                self.speed *= ramp_factor
+                t_ref, rec_ref = now, rec_last
+                last_ramp = now
+                self.max_lag = 0.0
+                print(f"Velocidad x{self.speed:.2f} ({self.fs * self.speed:.0f} muestras/s)")
+
+            idx = stop
+            if idx >= n:
+                if not self.loop:
+                    break
+                offset += self.time_data[-1] + 1.0 / self.fs
+                idx = 0
+
+        return sustained_rate
+
+
+def main(argv=None):
+    """Punto de entrada de línea de comandos"""
+    parser = argparse.ArgumentParser(description="Puerto serie virtual que reproduce grabaciones PPG")
+    parser.add_argument('recording', help="archivo CSV de la grabación")
+    parser.add_argument('--format', choices=FORMATS, default='raw', help="formato de las líneas")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="factor de velocidad (1 = tiempo real, 0 = lo más rápido posible)")
+    parser.add_argument('--jitter', type=float, default=0.0, help="jitter agregado (ms)")
+    parser.add_argument('--drop', type=float, default=0.0, help="probabilidad de descartar una muestra")
+    parser.add_argument('--garbage', type=float, default=0.0, help="probabilidad de insertar basura")
+    parser.add_argument('--duration', type=float, default=None, help="duración de la prueba (s)")
+    parser.add_argument('--no-loop', action='store_true', help="no repetir la grabación")
+    parser.add_argument('--ramp', type=float, nargs='?', const=1.5, default=None,
+                        help="multiplicar la velocidad por este factor hasta que la aplicación se atrase")
+    parser.add_argument('--ramp-step', type=float, default=5.0, help="segundos por escalón de rampa")
+    parser.add_argument('--max-lag', type=float, default=0.5, help="atraso tolerado (s) en la rampa")
+    parser.add_argument('--seed', type=int, default=None, help="semilla de las fallas aleatorias")
+    parser.add_argument('--binary-dtype', choices=('int16', 'float32'), default=BINARY_FRAME_DTYPE,
+                        help="tipo de los canales en formato binario")
+    args = parser.parse_args(argv)
+
+    values, fs = load_recording(args.recording)
+    device = VirtualSerialDevice(
+        values, fs, fmt=args.format, speed=args.speed,
+        jitter_ms=args.jitter, drop_prob=args.drop, garbage_prob=args.garbage,
+        loop=not args.no_loop, seed=args.seed, binary_dtype=args.binary_dtype
+    )
+    if args.format == 'binary' and device.binary_dtype != args.binary_dtype:
+        print(f"Aviso: la grabación no entra en {args.binary_dtype}; se envían tramas "
+              f"{device.binary_dtype} (configure BINARY_FRAME_DTYPE = '{device.binary_dtype}' "
+              f"en la aplicación)", file=sys.stderr)
+    port = device.open()
+    print(f"Puerto virtual: {port}  ({len(values)} muestras, fs={fs:.1f} Hz, formato {args.format})")
+    print("Conecte la aplicación a ese puerto. Ctrl+C para terminar.")
+
+    try:
+        sustained = device.run(duration=args.duration, ramp_factor=args.ramp,
+                               ramp_step_s=args.ramp_step, max_lag_s=args.max_lag)
+        if args.ramp:
+            if sustained:
+                print(f"Tasa máxima sostenida: {sustained:.0f} muestras/s")
+            else:
+                print("La aplicación no sostuvo ni la velocidad inicial")
+    except KeyboardInterrupt:
+        pass
+    finally:
+        print(f"Enviadas {device.samples_sent} muestras ({device.samples_dropped} descartadas), "
+              f"{device.bytes_sent / 1024:.1f} kB")
+        device.close()
+
+
+if __name__ == '__main__':
+    main()
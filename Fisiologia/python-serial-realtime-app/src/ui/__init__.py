@@ -6,6 +6,12 @@ Este módulo contiene:
 - Pestaña de adquisición (acquisition_tab.py)
 - Pestaña de análisis (analysis_tab.py)
 - Pestaña de puntos fiduciales desde CSV (fiducial_tab.py)
+- Pestaña de catálogo de grabaciones (catalog_tab.py)
+- Pestaña de adquisición simultánea de varios sujetos (devices_tab.py)
+- Adquisición de varios puertos en paralelo (acquisition_manager.py)
+- Lectura en un proceso hijo con memoria compartida (process_reader.py)
+- Carga de archivos en segundo plano con progreso (file_loader.py)
+- Exportación en segundo plano con avance y cancelación (exporter.py)
 - Widgets personalizados (widgets/)
 """
 
@@ -27,6 +33,36 @@ try:
 except ImportError as e:
     print(f"Warning: No se pudo importar FiducialTab: {e}")
 
+try:
+    from .catalog_tab import CatalogTab
+except ImportError as e:
+    print(f"Warning: No se pudo importar CatalogTab: {e}")
+
+try:
+    from .devices_tab import DevicesTab
+except ImportError as e:
+    print(f"Warning: No se pudo importar DevicesTab: {e}")
+
+try:
+    from .acquisition_manager import AcquisitionManager
+except ImportError as e:
+    print(f"Warning: No se pudo importar AcquisitionManager: {e}")
+
+try:
+    from .process_reader import ProcessSerialReader
+except ImportError as e:
+    print(f"Warning: No se pudo importar ProcessSerialReader: {e}")
+
+try:
+    from .file_loader import FileLoadTask
+except ImportError as e:
+    print(f"Warning: No se pudo importar FileLoadTask: {e}")
+
+try:
+    from .exporter import ExportTask
+except ImportError as e:
+    print(f"Warning: No se pudo importar ExportTask: {e}")
+
 # Importar widgets personalizados
 try:
     from .widgets.acquisition_controls import AcquisitionControls
@@ -40,6 +76,13 @@ __all__ = [
     'AcquisitionTab',
     'AnalysisTab',
     'FiducialTab',
+    'CatalogTab',
+    'DevicesTab',
+    # Adquisición
+    'AcquisitionManager',
+    'ProcessSerialReader',
+    'FileLoadTask',
+    'ExportTask',
     # Widgets
     'AcquisitionControls',
 ]
\ No newline at end of file
@@ -0,0 +1,207 @@
+"""
+Módulo para adquirir de varios puertos serie a la vez en una sola aplicación
+
+Lo usa la pestaña "Varios Sujetos" (``devices_tab.py``) de la ventana principal.
+"""
+from concurrent.futures import ThreadPoolExecutor
+import serial
+from PyQt5.QtCore import QObject, pyqtSignal
+from config.settings import (DEFAULT_BAUD, SERIAL_BATCH_INTERVAL, SERIAL_PROTOCOL,
+                             SAMPLING_FREQUENCY)
+from .serial_reader import SerialReader
+from .ppg_processor import PPGProcessor
+
+
+class AcquisitionDevice:
+    """Puerto abierto con su lector (un hilo propio) y su procesador independiente"""
+
+    def __init__(self, port, serial_port, reader, processor):
+        self.port = port
+        self.serial_port = serial_port
+        self.reader = reader
+        self.processor = processor
+        self.errors = 0
+
+    def is_reading(self):
+        """Verifica si el lector del dispositivo está activo"""
+        return self.reader.is_reading()
+
+
+class AcquisitionManager(QObject):
+    """Abre N puertos en paralelo, cada uno con su SerialReader y su PPGProcessor
+
+    Todos los dispositivos comparten la misma instancia de Qt, SciPy y NumPy,
+    en lugar de una aplicación completa por sujeto.
+    """
+
+    #: Señal emitida al agregar un dispositivo. Parámetro: puerto (str)
+    device_added = pyqtSignal(str)
+    #: Señal emitida al quitar un dispositivo. Parámetro: puerto (str)
+    device_removed = pyqtSignal(str)
+    #: Señal emitida ante un error de un dispositivo.
+    #: Parámetros: puerto (str), mensaje de error (str)
+    device_error = pyqtSignal(str, str)
+
+    def __init__(self, batch_interval=SERIAL_BATCH_INTERVAL, protocol=SERIAL_PROTOCOL):
+        """
+        :param batch_interval: segundos entre lotes de cada lector.
+        :param protocol: 'text' o 'binary', común a todos los dispositivos.
+        """
+        super().__init__()
+        self.batch_interval = batch_interval
+        self.protocol = protocol
+        self.devices = {}
+
+    def add_device(self, port, baudrate=DEFAULT_BAUD, sample_rate=SAMPLING_FREQUENCY,
+                   buffer_size=7500):
+        """Abre un puerto y crea su lector y su procesador
+
+        :param port: nombre del puerto (p. ej. '/dev/ttyUSB0' o 'COM3')
+        :param baudrate: velocidad del puerto
+        :param sample_rate: frecuencia de muestreo nominal del dispositivo (Hz)
+        :param buffer_size: muestras retenidas por el procesador
+        :return: AcquisitionDevice creado
+        :raises ValueError: si el puerto ya fue agregado
+        """
+        if port in self.devices:
+            raise ValueError(f"El puerto {port} ya está en uso")
+        return self._attach(port, serial.Serial(port, baudrate, timeout=1), sample_rate, buffer_size)
+
+    def add_devices(self, ports, baudrate=DEFAULT_BAUD, sample_rate=SAMPLING_FREQUENCY,
+                    buffer_size=7500):
+        """Abre varios puertos en paralelo y crea el lector y el procesador de cada uno
+
+        Abrir un puerto puede tardar (p. ej. el reinicio de una placa por DTR
+        o un enlace Bluetooth): el tiempo total queda acotado por la apertura
+        más lenta y no por la suma. Un puerto que falla no impide los demás.
+
+        :param ports: nombres de los puertos
+        :param baudrate: velocidad común a todos los puertos
+        :param sample_rate: frecuencia de muestreo nominal (Hz)
+        :param buffer_size: muestras retenidas por cada procesador
+        :return: tupla (dispositivos creados, dict puerto → mensaje de error)
+        """
+        ports = list(dict.fromkeys(ports))
+        errors = {port: "El puerto ya está en uso" for port in ports if port in self.devices}
+        pending = [port for port in ports if port not in errors]
+        if not pending:
+            return [], errors
+
+        def open_port(port):
+            try:
+                return serial.Serial(port, baudrate, timeout=1), None
+            except (serial.SerialException, OSError, ValueError) as e:
+                return None, str(e)
+
+        with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+            opened = list(executor.map(open_port, pending))
+
+        # Lectores y procesadores son QObject: se crean en el hilo de la interfaz
+        devices = []
+        for port, (serial_port, error) in zip(pending, opened):
+            if serial_port is None:
+                errors[port] = error
+                self.device_error.emit(port, error)
+            else:
+                devices.append(self._attach(port, serial_port, sample_rate, buffer_size))
+        return devices, errors
+
+    def _attach(self, port, serial_port, sample_rate, buffer_size):
+        """Crea lector y procesador de un puerto ya abierto y lo registra"""
+        reader = SerialReader(batch_interval=self.batch_interval, protocol=self.protocol,
+                              sample_rate=sample_rate)
+        processor = PPGProcessor(sample_rate=sample_rate, buffer_size=buffer_size)
+        device = AcquisitionDevice(port, serial_port, reader, processor)
+
+        reader.batch_received.connect(processor.append_many)
+        reader.gap_detected.connect(processor.mark_gap)
+        reader.error_occurred.connect(lambda msg, dev=device: self._on_reader_error(dev, msg))
+
+        self.devices[port] = device
+        self.device_added.emit(port)
+        return device
+
+    def remove_device(self, port):
+        """Detiene y cierra un dispositivo"""
+        device = self.devices.pop(port, None)
+        if device is None:
+            return
+        self._stop_device(device)
+        if device.serial_port.is_open:
+            device.serial_port.close()
+        self.device_removed.emit(port)
+
+    def start_all(self):
+        """Inicia la lectura y el análisis de todos los dispositivos"""
+        for device in self.devices.values():
+            if not device.is_reading() and device.serial_port.is_open:
+                device.reader.start_reading(device.serial_port)
+                device.processor.start_processing()
+
+    def stop_all(self):
+        """Detiene la lectura de todos los dispositivos sin cerrar los puertos"""
+        for device in self.devices.values():
+            self._stop_device(device)
+
+    def close_all(self):
+        """Detiene y cierra todos los dispositivos"""
+        for port in list(self.devices):
+            self.remove_device(port)
+
+    def get_processor(self, port):
+        """Obtiene el procesador asociado a un puerto"""
+        return self.devices[port].processor
+
+    def ports(self):
+        """Lista de puertos administrados"""
+        return list(self.devices)
+
+    def get_stats(self):
+        """Obtiene estadísticas por dispositivo y totales
+
+        Las tasas se miden desde la consulta anterior de cada lector.
+
+        :return: dict con 'devices' (por puerto) y los totales de bytes/s,
+            muestras/s, muestras retenidas, muestras perdidas, descartadas en
+            la cola de la interfaz y errores
+        """
+        per_device = {}
+        totals = {
+            'bytes_per_s': 0.0,
+            'samples_per_s': 0.0,
+            'data_points': 0,
+            'lost_samples': 0,
+            'queue_dropped': 0,
+            'crc_errors': 0,
+            'errors': 0,
+        }
+        for port, device in self.devices.items():
+            stats = {
+                'reading': device.is_reading(),
+                'data_points': len(device.processor.time_buffer),
+                'errors': device.errors,
+            }
+            reader_stats = device.reader.get_stats()
+            if reader_stats:
+                stats.update(reader_stats)
+                totals['bytes_per_s'] += reader_stats['bytes_per_s']
+                totals['samples_per_s'] += reader_stats['samples_per_s']
+                totals['lost_samples'] += reader_stats['lost_samples']
+                totals['queue_dropped'] += reader_stats.get('queue_dropped', 0)
+                totals['crc_errors'] += reader_stats.get('crc_errors', 0)
+            totals['data_points'] += stats['data_points']
+            totals['errors'] += device.errors
+            per_device[port] = stats
+
+        totals['devices'] = per_device
+        return totals
+
+    def _stop_device(self, device):
+        """Detiene lector y procesador de un dispositivo"""
+        device.reader.stop_reading()
+        device.processor.stop_processing()
+
+    def _on_reader_error(self, device, error_msg):
+        """Cuenta el error y lo informa sin afectar a los demás dispositivos"""
+        device.errors += 1
+        self.device_error.emit(device.port, error_msg)
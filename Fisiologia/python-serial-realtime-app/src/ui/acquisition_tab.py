@@ -8,6 +8,7 @@ import pyqtgraph as pg
 import numpy as np
 from datetime import datetime
 from .widgets.acquisition_controls import AcquisitionControls
+from .widgets.decimated_curve import DecimatedCurve
 
 class AcquisitionTab(QWidget):
     """Pestaña principal para la adquisición y visualización en tiempo real"""
@@ -131,6 +132,9 @@ class AcquisitionTab(QWidget):
         self.raw_plot.setLabel('bottom', 'Tiempo (s)')
         self.raw_plot.showGrid(x=True, y=True)
         self.raw_curve = self.raw_plot.plot(pen=pg.mkPen('#FF6B6B', width=2))
+        # Toda la sesión queda navegable: la curva se alimenta de la pirámide del procesador
+        self.raw_display = DecimatedCurve(self.raw_plot, self.raw_curve,
+                                          self.ppg_processor.display_pyramid)
         self.raw_plot.setYRange(-1000, 4000)  # Rango inicial
         plots_layout.addWidget(self.raw_plot)
         
@@ -147,19 +151,18 @@ class AcquisitionTab(QWidget):
     def update_plots(self):
         """Actualiza los gráficos con nuevos datos"""
         try:
-            time_data, raw_data = self.ppg_processor.get_display_data(2500)
+            time_data, raw_data = self.ppg_processor.get_display_data(1)
             
             if len(time_data) > 0:
-                # Actualizar curva
-                self.raw_curve.setData(time_data, raw_data)
-                
                 # Auto-scroll en el eje X (mostrar últimos 30 segundos)
-                if time_data:
-                    latest_time = time_data[-1]
-                    window_size = 30  # segundos
-                    start_time = max(0, latest_time - window_size)
-                    
-                    self.raw_plot.setXRange(start_time, latest_time)
+                latest_time = time_data[-1]
+                window_size = 30  # segundos
+                start_time = max(0, latest_time - window_size)
+                
+                self.raw_plot.setXRange(start_time, latest_time)
+                
+                # Actualizar curva con el nivel de la pirámide acorde al ancho visible
+                self.raw_display.refresh()
                 
         except Exception as e:
             self.log_message(f"Error actualizando gráficos: {e}")
@@ -3,7 +3,6 @@ Este archivo implementa la pestaña de adquisición de datos
 en tiempo real utilizando PyQt5 y PyQtGraph.
 
 """
-import pandas as pd
 import numpy as np
 import pyqtgraph as pg
 from PyQt5.QtWidgets import (
@@ -20,6 +19,11 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from core.filter import apply_filter, linebase_removal
+from data.session_file import save_session, is_session_file
+from data.write_data import export_path, signal_columns, table_columns
+from .file_loader import FileLoadTask
+from .exporter import SESSION_FORMAT, ExportTask, ask_export_format, start_export
+from .widgets.decimated_curve import DecimatedCurve
 
 class AnalysisTab(QWidget):
     """Pestaña para el análisis de datos"""
@@ -34,6 +38,7 @@ class AnalysisTab(QWidget):
         super().__init__()
         self.ppg_processor = ppg_processor
         self.current_data = None  # Datos cargados o transferidos
+        self._load_task = None  # Lectura de archivo en curso
         self.filtered_data = None  # Datos filtrados
         self.baseline_removed = False
         self.fiducials = None
@@ -108,6 +113,27 @@ class AnalysisTab(QWidget):
         """)
         data_layout.addWidget(self.use_acquisition_btn)
         
+        # Ventana de tiempo: en registros largos se lee solo ese tramo
+        window_layout = QGridLayout()
+        self.window_checkbox = QCheckBox("Cargar solo una ventana")
+        window_layout.addWidget(self.window_checkbox, 0, 0, 1, 2)
+        window_layout.addWidget(QLabel("Desde (s):"), 1, 0)
+        self.window_start_spin = QDoubleSpinBox()
+        self.window_start_spin.setRange(0.0, 1e6)
+        self.window_start_spin.setDecimals(1)
+        window_layout.addWidget(self.window_start_spin, 1, 1)
+        window_layout.addWidget(QLabel("Duración (s):"), 2, 0)
+        self.window_length_spin = QDoubleSpinBox()
+        self.window_length_spin.setRange(1.0, 1e5)
+        self.window_length_spin.setValue(10.0)
+        self.window_length_spin.setDecimals(1)
+        window_layout.addWidget(self.window_length_spin, 2, 1)
+        self.window_start_spin.setEnabled(False)
+        self.window_length_spin.setEnabled(False)
+        self.window_checkbox.toggled.connect(self.window_start_spin.setEnabled)
+        self.window_checkbox.toggled.connect(self.window_length_spin.setEnabled)
+        data_layout.addLayout(window_layout)
+        
         # Información de los datos cargados
         self.data_info_label = QLabel("No hay datos cargados")
         self.data_info_label.setStyleSheet("color: #7F8C8D; font-size: 11px;")
@@ -291,6 +317,8 @@ class AnalysisTab(QWidget):
         self.original_plot.setLabel('bottom', 'Tiempo (s)')
         self.original_plot.showGrid(x=True, y=True)
         self.original_curve = self.original_plot.plot(pen=pg.mkPen('#FF6B6B', width=2))
+        # Registros largos: se dibuja el nivel de la pirámide mín/máx acorde al zoom
+        self.original_display = DecimatedCurve(self.original_plot, self.original_curve)
         plots_layout.addWidget(self.original_plot)
         
         # Gráfico de señal filtrada
@@ -299,6 +327,7 @@ class AnalysisTab(QWidget):
         self.filtered_plot.setLabel('bottom', 'Tiempo (s)')
         self.filtered_plot.showGrid(x=True, y=True)
         self.filtered_curve = self.filtered_plot.plot(pen=pg.mkPen('#4ECDC4', width=2))
+        self.filtered_display = DecimatedCurve(self.filtered_plot, self.filtered_curve)
         self.fiducial_scatter = pg.ScatterPlotItem(symbol='o', size=9, pen=pg.mkPen(None), brush=pg.mkBrush('#EF4444'))
         self.filtered_plot.addItem(self.fiducial_scatter)
         plots_layout.addWidget(self.filtered_plot)
@@ -307,44 +336,77 @@ class AnalysisTab(QWidget):
         return plots_widget
         
     def load_csv_file(self):
-        """Carga los datos desde archivo CSV"""
+        """Carga los datos desde archivo CSV o desde una sesión HDF5"""
         file_dialog = QFileDialog()
         file_path, _ = file_dialog.getOpenFileName(
-            self, "Seleccionar archivo CSV", "", "Archivos CSV (*.csv)"
+            self, "Seleccionar archivo CSV", "",
+            "Archivos CSV (*.csv);;Parquet / Feather (*.parquet *.feather *.arrow);;"
+            "Sesiones HDF5 (*.h5 *.hdf5);;Grabaciones comprimidas (*.ppgz)"
         )
         
         if file_path:
-            try:
-                # Intentar cargar el CSV
-                df = pd.read_csv(file_path)
-                
-                # Asumir que la primera columna es tiempo y la segunda es la señal
-                if df.shape[1] >= 2:
-                    self.current_data = df.iloc[:, 1].values  # Segunda columna como señal
-                    self.time_data = df.iloc[:, 0].values     # Primera columna como tiempo
-                elif df.shape[1] == 1:
-                    self.current_data = df.iloc[:, 0].values  # Una sola columna
-                    self.time_data = np.arange(len(self.current_data))  # Crear tiempo
-                else:
-                    raise ValueError("El archivo debe tener al menos una columna de datos")
-                
-                # Actualizar UI
-                self.data_info_label.setText(f"CSV cargado: {len(self.current_data)} puntos")
-                self.apply_filter_btn.setEnabled(True)
-                self.detect_fiducials_btn.setEnabled(True)
-                self.reset_btn.setEnabled(True)
-                self.clear_fiducials()
+            self.load_file(file_path)
                 
-                # Mostrar datos originales
-                self.update_original_plot()
-                
-                # Log
-                self.log_message(f"Archivo CSV cargado: {file_path}")
-                self.log_message(f"Datos: {len(self.current_data)} puntos")
-                
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Error cargando archivo CSV:\n{e}")
-                self.log_message(f"Error cargando CSV: {e}")
+    def load_file(self, file_path, t_start=None, t_end=None):
+        """Carga un CSV o una sesión HDF5 en segundo plano (p. ej. desde el catálogo)
+        
+        :param t_start: inicio de la ventana a leer (s); None = la ventana
+                        elegida en el panel, o el archivo completo
+        :param t_end: fin de la ventana a leer (s)
+        """
+        if t_start is None and t_end is None and self.window_checkbox.isChecked():
+            t_start = self.window_start_spin.value()
+            t_end = t_start + self.window_length_spin.value()
+        # Lectura en un hilo del pool; se prefiere el canal original
+        # porque la pestaña aplica su propio filtro. Con ventana solo se
+        # parsea ese tramo (índice tiempo → byte en CSV, lectura parcial en .h5)
+        self.load_csv_btn.setEnabled(False)
+        self.data_info_label.setText("Cargando archivo... 0%")
+        self._load_task = FileLoadTask(file_path, prefer=('raw', 'filtered'),
+                                       t_start=t_start, t_end=t_end)
+        self._load_task.signals.progress.connect(
+            lambda percent: self.data_info_label.setText(f"Cargando archivo... {percent}%"))
+        self._load_task.signals.loaded.connect(self._on_file_loaded)
+        self._load_task.signals.failed.connect(self._on_file_load_failed)
+        self._load_task.start()
+        
+    def _on_file_loaded(self, file_path, time_data, data, fs):
+        """Recibe el archivo leído por FileLoadTask y actualiza la pestaña"""
+        self._load_task = None
+        self.load_csv_btn.setEnabled(True)
+        if len(time_data) == 0:
+            self._on_file_load_failed(file_path, "La ventana elegida no tiene muestras")
+            return
+        try:
+            self.time_data = time_data
+            self.current_data = next(iter(data.values()))
+            if is_session_file(file_path) and fs:
+                self.fs_spin.setValue(int(round(fs)))
+            
+            # Actualizar UI
+            self.data_info_label.setText(f"CSV cargado: {len(self.current_data)} puntos")
+            self.apply_filter_btn.setEnabled(True)
+            self.detect_fiducials_btn.setEnabled(True)
+            self.reset_btn.setEnabled(True)
+            self.clear_fiducials()
+            
+            # Mostrar datos originales
+            self.update_original_plot()
+            
+            # Log
+            self.log_message(f"Archivo CSV cargado: {file_path}")
+            self.log_message(f"Datos: {len(self.current_data)} puntos")
+            
+        except Exception as e:
+            self._on_file_load_failed(file_path, str(e))
+            
+    def _on_file_load_failed(self, file_path, message):
+        """Informa un error de lectura de FileLoadTask"""
+        self._load_task = None
+        self.load_csv_btn.setEnabled(True)
+        self.data_info_label.setText("No se pudo cargar el archivo")
+        QMessageBox.critical(self, "Error", f"Error cargando archivo CSV:\n{message}")
+        self.log_message(f"Error cargando CSV: {message}")
                 
     def load_acquisition_data(self):
         """Carga de datos de la adquisición en tiempo real"""
@@ -433,12 +495,12 @@ class AnalysisTab(QWidget):
     def update_original_plot(self): 
         """Actualiza el gráfico de señal original""" 
         if self.current_data is not None:
-            self.original_curve.setData(self.time_data, self.current_data)
+            self.original_display.set_data(self.time_data, self.current_data)
             
     def update_filtered_plot(self):
         """Actualizar gráfico de señal filtrada"""
         if self.filtered_data is not None:
-            self.filtered_curve.setData(self.time_data, self.filtered_data)
+            self.filtered_display.set_data(self.time_data, self.filtered_data)
             
     def log_message(self, message):
         """Agrega el mensaje al log de análisis"""
@@ -451,7 +513,8 @@ class AnalysisTab(QWidget):
         scrollbar.setValue(scrollbar.maximum())
         
     def save_filtered_data(self):
-        """Guarda los datos filtrados y parámetros en archivos CSV"""
+        """Exporta los datos filtrados y parámetros (en segundo plano) como tablas o
+        como una sesión HDF5, según el formato elegido"""
         try:
             # Verificar que haya datos filtrados
             if self.filtered_data is None:
@@ -473,63 +536,59 @@ class AnalysisTab(QWidget):
             if not ok or not base_name:
                 return
             
-            saved_files = []
+            fmt = ask_export_format(self, session=True)
+            if fmt is None:
+                return
             
-            # 1. Guardar datos filtrados
-            df_filtered = pd.DataFrame({
-                'tiempo_s': self.time_data,
-                'valor_filt': self.filtered_data
-            })
-            filtered_path = os.path.join(directory, f"{base_name}_filtrado.csv")
-            df_filtered.to_csv(filtered_path, index=False)
-            saved_files.append(f"• {base_name}_filtrado.csv ({len(self.filtered_data)} puntos)")
+            base_path = os.path.join(directory, base_name)
+            task = ExportTask()
+            analysis, parameters = None, {}
             
-            # 2. Guardar parámetros calculados (si hay análisis disponible)
-            # Intentar realizar un análisis para obtener parámetros
+            # Parámetros y latidos (si se puede analizar la señal)
             try:
                 analysis, parameters = self.ppg_processor.analyze_segment(
                     self.time_data, self.filtered_data
                 )
+            except Exception as e:
+                self.log_message(f"No se pudieron calcular parámetros: {e}")
+            beat_rows = analysis.get('beats', []) if analysis else []
+            
+            if fmt == SESSION_FORMAT:
+                # Sesión HDF5: señales, latidos, fiduciales y parámetros en un archivo
+                session_path = f"{base_path}_sesion.h5"
+                time_data, raw_data, filtered_data = self.time_data, self.current_data, self.filtered_data
+                fs = self.fs_spin.value()
+                task.add_job(session_path, lambda: save_session(
+                    session_path,
+                    time_data,
+                    {'raw': raw_data, 'filtered': filtered_data},
+                    fs=fs,
+                    beats=beat_rows or None,
+                    fiducials=analysis.get('fiducials') if analysis else None,
+                    parameters=parameters,
+                ))
+            else:
+                # 1. Datos filtrados (columnas de EXPORT_COLUMNS)
+                task.add_table(export_path(f"{base_path}_filtrado", fmt),
+                               signal_columns(self.time_data, filtered=self.filtered_data), fmt)
                 
+                # 2. Parámetros calculados
                 if parameters:
-                    df_params = pd.DataFrame(
-                        list(parameters.items()), 
-                        columns=['Parametro', 'Valor']
-                    )
-                    params_path = os.path.join(directory, f"{base_name}_parametros.csv")
-                    df_params.to_csv(params_path, index=False)
-                    saved_files.append(f"• {base_name}_parametros.csv")
-
-                beat_rows = analysis.get('beats', []) if analysis else []
+                    task.add_table(export_path(f"{base_path}_parametros", fmt),
+                                   table_columns(parameters), fmt)
+                
+                # 3. Puntos fiduciales por latido
                 if beat_rows:
-                    rows = []
-                    for i, row in enumerate(beat_rows, start=1):
-                        rows.append({
-                            'latido': i,
-                            'onset_idx': row['onset_idx'],
-                            'onset_time': row['onset_time'],
-                            'onset_amp': row['onset_amp'],
-                            'sys_idx': row['sys_idx'],
-                            'sys_time': row['sys_time'],
-                            'sys_amp': row['sys_amp'],
-                        })
-
-                    df_fid = pd.DataFrame(
-                        rows,
-                        columns=['latido', 'onset_idx', 'onset_time', 'onset_amp', 'sys_idx', 'sys_time', 'sys_amp']
+                    rows = [dict(row, latido=i) for i, row in enumerate(beat_rows, start=1)]
+                    task.add_table(
+                        export_path(f"{base_path}_fiduciales", fmt),
+                        table_columns(rows, ['latido', 'onset_idx', 'onset_time', 'onset_amp',
+                                             'sys_idx', 'sys_time', 'sys_amp']),
+                        fmt
                     )
-                    fid_path = os.path.join(directory, f"{base_name}_fiduciales.csv")
-                    df_fid.to_csv(fid_path, index=False)
-                    saved_files.append(f"• {base_name}_fiduciales.csv ({len(df_fid)} latidos)")
-            except Exception as e:
-                self.log_message(f"No se pudieron calcular parámetros: {e}")
             
-            # Mensaje de éxito
-            files_list = "\n".join(saved_files)
-            self.log_message(f"Datos guardados en: {directory}")
-            QMessageBox.information(self, "Guardado Exitoso", 
-                                  f"Datos guardados exitosamente en:\n{directory}\n\n"
-                                  f"Archivos creados:\n{files_list}")
+            # Escritura en un hilo del pool con avance y cancelación
+            start_export(self, task, self.log_message)
             
         except Exception as e:
             error_msg = f"Error guardando datos: {e}"
@@ -545,8 +604,8 @@ class AnalysisTab(QWidget):
         self.baseline_removed = False
         
         # Limpia los gráficos
-        self.original_curve.setData([], [])
-        self.filtered_curve.setData([], [])
+        self.original_display.clear()
+        self.filtered_display.clear()
         
         # Actualizar UI
         self.data_info_label.setText("No hay datos cargados")
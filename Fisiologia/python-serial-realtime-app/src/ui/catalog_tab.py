@@ -0,0 +1,224 @@
+"""
+Pestaña de catálogo: tabla de grabaciones de una carpeta con su resumen.
+
+Flujo de uso:
+  1. Elegir la carpeta de grabaciones (CSV, Parquet/Feather, .ppgz o sesiones .h5).
+  2. Pulsar "Escanear" → se calculan en segundo plano solo los archivos
+     nuevos o modificados; el resto sale de la caché SQLite.
+  3. Ordenar por columna para encontrar la grabación buscada y abrirla con
+     doble clic en la pestaña de análisis.
+"""
+
+import os
+import threading
+import traceback
+from datetime import datetime
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QFileDialog,
+    QTableWidget, QTableWidgetItem, QHeaderView, QProgressBar, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QObject, QRunnable, QThreadPool, pyqtSignal
+from config.settings import RECORDING_DIR
+from data.catalog import RecordingCatalog
+
+COLUMNS = ['Archivo', 'Duración (s)', 'Fs (Hz)', 'Muestras', 'FC media (LPM)',
+           'Calidad', 'Modificado']
+
+
+class CatalogScanSignals(QObject):
+    """Señales de ``CatalogScanTask``"""
+
+    #: Avance. Parámetros: procesados (int), a procesar (int)
+    progress = pyqtSignal(int, int)
+    #: Escaneo terminado. Parámetro: entradas de la carpeta (list)
+    finished = pyqtSignal(list)
+    #: Error. Parámetro: mensaje (str)
+    failed = pyqtSignal(str)
+
+
+class CatalogScanTask(QRunnable):
+    """Escanea una carpeta con ``RecordingCatalog.scan`` fuera del hilo de la interfaz"""
+
+    def __init__(self, catalog, directory):
+        super().__init__()
+        self.catalog = catalog
+        self.directory = directory
+        self.signals = CatalogScanSignals()
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        """Deja de esperar resúmenes pendientes (lo calculado queda en la caché)"""
+        self._cancel.set()
+
+    def run(self):
+        try:
+            entries = self.catalog.scan(self.directory, self.signals.progress.emit,
+                                        self._cancel.is_set)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(entries)
+
+
+class _NumericItem(QTableWidgetItem):
+    """Celda que ordena por su valor numérico (las vacías quedan al final)"""
+
+    def __init__(self, value, text):
+        super().__init__(text)
+        self.value = value
+
+    def __lt__(self, other):
+        if not isinstance(other, _NumericItem):
+            return super().__lt__(other)
+        if self.value is None:
+            return False
+        if other.value is None:
+            return True
+        return self.value < other.value
+
+
+class CatalogTab(QWidget):
+    """Pestaña para explorar y abrir grabaciones desde el catálogo"""
+
+    #: Señal emitida al abrir una grabación (doble clic). Parámetro: ruta (str)
+    recording_selected = pyqtSignal(str)
+
+    def __init__(self, catalog=None):
+        """
+        :param catalog: RecordingCatalog a usar; si se omite se crea uno
+                        con la base de datos de ``CATALOG_DB``.
+        """
+        super().__init__()
+        self.catalog = catalog if catalog is not None else RecordingCatalog()
+        self.directory = RECORDING_DIR
+        self._scan_task = None
+
+        self.setup_ui()
+        if os.path.isdir(self.directory):
+            self.show_entries(self.catalog.entries(self.directory))
+
+    def setup_ui(self):
+        """Barra de carpeta y escaneo sobre la tabla de grabaciones"""
+        layout = QVBoxLayout()
+
+        controls = QHBoxLayout()
+        self.directory_label = QLabel(self.directory)
+        self.directory_label.setStyleSheet("color: #2C3E50; font-weight: bold;")
+        controls.addWidget(self.directory_label, 1)
+
+        self.choose_btn = QPushButton("Elegir carpeta…")
+        self.choose_btn.clicked.connect(self.choose_directory)
+        controls.addWidget(self.choose_btn)
+
+        self.scan_btn = QPushButton("Escanear")
+        self.scan_btn.clicked.connect(self.toggle_scan)
+        controls.addWidget(self.scan_btn)
+        layout.addLayout(controls)
+
+        self.progress_bar = QProgressBar()
+        self.progress_bar.setVisible(False)
+        layout.addWidget(self.progress_bar)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSortingEnabled(True)
+        self.table.cellDoubleClicked.connect(self._open_row)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("Doble clic en una grabación para abrirla en Análisis")
+        self.status_label.setStyleSheet("color: #7F8C8D; font-size: 11px;")
+        layout.addWidget(self.status_label)
+
+        self.setLayout(layout)
+
+    def choose_directory(self):
+        """Elige la carpeta a catalogar y muestra lo que ya está en caché"""
+        directory = QFileDialog.getExistingDirectory(self, "Carpeta de grabaciones", self.directory)
+        if not directory:
+            return
+        self.directory = directory
+        self.directory_label.setText(directory)
+        self.show_entries(self.catalog.entries(directory))
+
+    def toggle_scan(self):
+        """Inicia un escaneo, o cancela el que está en curso"""
+        if self._scan_task is not None:
+            self._scan_task.cancel()
+            self.scan_btn.setEnabled(False)
+            return
+        if not os.path.isdir(self.directory):
+            self.status_label.setText(f"La carpeta no existe: {self.directory}")
+            return
+
+        self._scan_task = CatalogScanTask(self.catalog, self.directory)
+        self._scan_task.signals.progress.connect(self._on_progress)
+        self._scan_task.signals.finished.connect(self._on_scan_finished)
+        self._scan_task.signals.failed.connect(self._on_scan_failed)
+        self.scan_btn.setText("Cancelar")
+        self.choose_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+        self.progress_bar.setVisible(True)
+        QThreadPool.globalInstance().start(self._scan_task)
+
+    def _on_progress(self, done, total):
+        self.progress_bar.setMaximum(max(total, 1))
+        self.progress_bar.setValue(done)
+        self.status_label.setText(f"Procesando grabaciones nuevas o modificadas: {done}/{total}")
+
+    def _scan_done(self):
+        self._scan_task = None
+        self.scan_btn.setText("Escanear")
+        self.scan_btn.setEnabled(True)
+        self.choose_btn.setEnabled(True)
+        self.progress_bar.setVisible(False)
+
+    def _on_scan_finished(self, entries):
+        self._scan_done()
+        self.show_entries(entries)
+
+    def _on_scan_failed(self, message):
+        self._scan_done()
+        self.status_label.setText(f"Error escaneando la carpeta: {message}")
+
+    def show_entries(self, entries):
+        """Llena la tabla con las entradas del catálogo"""
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(len(entries))
+        for row, entry in enumerate(entries):
+            name_item = QTableWidgetItem(os.path.basename(entry['path']))
+            name_item.setData(Qt.UserRole, entry['path'])
+            if entry['error']:
+                name_item.setToolTip(entry['error'])
+                name_item.setForeground(Qt.red)
+            self.table.setItem(row, 0, name_item)
+
+            cells = [
+                (entry['duration'], '{:.1f}'),
+                (entry['fs'], '{:.1f}'),
+                (entry['samples'], '{:d}'),
+                (entry['mean_hr'], '{:.1f}'),
+                (entry['quality'], '{:.0%}'),
+            ]
+            for column, (value, fmt) in enumerate(cells, start=1):
+                text = fmt.format(value) if value is not None else '—'
+                self.table.setItem(row, column, _NumericItem(value, text))
+
+            modified = datetime.fromtimestamp(entry['mtime']).strftime('%Y-%m-%d %H:%M')
+            self.table.setItem(row, len(COLUMNS) - 1, _NumericItem(entry['mtime'], modified))
+        self.table.setSortingEnabled(True)
+
+        errors = sum(1 for entry in entries if entry['error'])
+        text = f"{len(entries)} grabaciones"
+        if errors:
+            text += f" · {errors} con error (ver tooltip)"
+        self.status_label.setText(text + " · doble clic para abrir en Análisis")
+
+    def _open_row(self, row, _column):
+        path = self.table.item(row, 0).data(Qt.UserRole)
+        if path:
+            self.recording_selected.emit(path)
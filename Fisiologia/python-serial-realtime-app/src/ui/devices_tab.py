@@ -0,0 +1,154 @@
+"""
+Pestaña de varios sujetos: adquisición simultánea de varios puertos serie.
+
+Flujo de uso:
+  1. Marcar los puertos de los dispositivos (uno por sujeto) y pulsar
+     "Conectar" → se abren en paralelo con ``AcquisitionManager``.
+  2. "Iniciar" / "Detener" controla la lectura y el análisis de todos.
+  3. La tabla muestra por puerto la FC, la HRV, las muestras/s, las
+     pérdidas y los errores; la barra inferior, los totales.
+
+Cada puerto tiene su hilo lector y su procesador; la ventana, Qt y SciPy se
+comparten en lugar de abrir una aplicación por sujeto.
+"""
+
+from PyQt5.QtWidgets import (
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QListWidget,
+    QListWidgetItem, QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QTimer
+from config.serial_config import SerialConfig
+from config.settings import DEFAULT_BAUD
+from .acquisition_manager import AcquisitionManager
+
+COLUMNS = ['Puerto', 'Estado', 'FC (LPM)', 'HRV (ms)', 'Muestras/s', 'Perdidas', 'Errores']
+
+
+class DevicesTab(QWidget):
+    """Pestaña para adquirir de varios puertos a la vez"""
+
+    def __init__(self, manager=None, baudrate=DEFAULT_BAUD):
+        """
+        :param manager: AcquisitionManager a usar; si se omite se crea uno.
+        :param baudrate: velocidad común de los puertos.
+        """
+        super().__init__()
+        self.manager = manager if manager is not None else AcquisitionManager()
+        self.baudrate = baudrate
+        self.manager.device_error.connect(self._on_device_error)
+
+        self.setup_ui()
+        self.refresh_ports()
+
+        # Las estadísticas de los lectores se miden entre consultas
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self.update_table)
+        self.stats_timer.start(1000)
+
+    def setup_ui(self):
+        """Lista de puertos y botones sobre la tabla de dispositivos"""
+        layout = QVBoxLayout()
+
+        ports_layout = QHBoxLayout()
+        self.port_list = QListWidget()
+        self.port_list.setMaximumHeight(120)
+        ports_layout.addWidget(self.port_list, 1)
+
+        buttons = QVBoxLayout()
+        self.refresh_btn = QPushButton("Actualizar puertos")
+        self.refresh_btn.clicked.connect(self.refresh_ports)
+        buttons.addWidget(self.refresh_btn)
+        self.connect_btn = QPushButton("Conectar")
+        self.connect_btn.clicked.connect(self.connect_selected)
+        buttons.addWidget(self.connect_btn)
+        self.start_btn = QPushButton("Iniciar")
+        self.start_btn.clicked.connect(self.toggle_acquisition)
+        buttons.addWidget(self.start_btn)
+        self.close_btn = QPushButton("Desconectar todos")
+        self.close_btn.clicked.connect(self.close_all)
+        buttons.addWidget(self.close_btn)
+        ports_layout.addLayout(buttons)
+        layout.addLayout(ports_layout)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.Stretch)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        layout.addWidget(self.table)
+
+        self.status_label = QLabel("Marque los puertos de cada sujeto y pulse Conectar")
+        self.status_label.setStyleSheet("color: #7F8C8D; font-size: 11px;")
+        layout.addWidget(self.status_label)
+
+        self.setLayout(layout)
+
+    def refresh_ports(self):
+        """Lista los puertos del sistema que no están conectados en esta pestaña"""
+        self.port_list.clear()
+        for port in SerialConfig.get_available_ports():
+            if port in self.manager.devices:
+                continue
+            item = QListWidgetItem(port)
+            item.setFlags(item.flags() | Qt.ItemIsUserCheckable)
+            item.setCheckState(Qt.Unchecked)
+            self.port_list.addItem(item)
+
+    def connect_selected(self):
+        """Abre en paralelo los puertos marcados"""
+        ports = [self.port_list.item(i).text() for i in range(self.port_list.count())
+                 if self.port_list.item(i).checkState() == Qt.Checked]
+        if not ports:
+            self.status_label.setText("No hay puertos marcados")
+            return
+        devices, errors = self.manager.add_devices(ports, self.baudrate)
+        text = f"{len(devices)} dispositivos conectados"
+        if errors:
+            text += " · error en " + ", ".join(f"{port}: {error}" for port, error in errors.items())
+        self.status_label.setText(text)
+        self.refresh_ports()
+        self.update_table()
+
+    def toggle_acquisition(self):
+        """Inicia o detiene la lectura de todos los dispositivos"""
+        if any(device.is_reading() for device in self.manager.devices.values()):
+            self.manager.stop_all()
+            self.start_btn.setText("Iniciar")
+        else:
+            self.manager.start_all()
+            self.start_btn.setText("Detener")
+        self.update_table()
+
+    def close_all(self):
+        """Detiene y cierra todos los dispositivos"""
+        self.manager.close_all()
+        self.start_btn.setText("Iniciar")
+        self.refresh_ports()
+        self.update_table()
+
+    def update_table(self):
+        """Actualiza la tabla por dispositivo y los totales"""
+        stats = self.manager.get_stats()
+        devices = stats['devices']
+        self.table.setRowCount(len(devices))
+        for row, (port, device_stats) in enumerate(devices.items()):
+            processor = self.manager.get_processor(port)
+            cells = [
+                port,
+                "Leyendo" if device_stats['reading'] else "Detenido",
+                f"{processor.current_hr:.1f}" if processor.current_hr else '—',
+                f"{processor.current_hrv:.1f}" if processor.current_hrv else '—',
+                f"{device_stats.get('samples_per_s', 0):.0f}",
+                f"{device_stats.get('lost_samples', 0)}",
+                f"{device_stats['errors']}",
+            ]
+            for column, text in enumerate(cells):
+                self.table.setItem(row, column, QTableWidgetItem(text))
+        if devices:
+            self.status_label.setText(
+                f"{len(devices)} dispositivos · {stats['samples_per_s']:.0f} muestras/s · "
+                f"{stats['lost_samples']} perdidas · {stats['queue_dropped']} descartadas · "
+                f"{stats['errors']} errores")
+
+    def _on_device_error(self, port, error_msg):
+        self.status_label.setText(f"Error en {port}: {error_msg}")
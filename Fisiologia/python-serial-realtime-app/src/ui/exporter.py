@@ -0,0 +1,172 @@
+"""
+Exportación de archivos en un hilo del pool de Qt, con avance y cancelación
+"""
+import os
+import threading
+import traceback
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, Qt, pyqtSignal
+from PyQt5.QtWidgets import QInputDialog, QMessageBox, QProgressDialog
+from config.settings import DEFAULT_EXPORT_FORMAT, EXPORT_FORMATS
+from data.write_data import ExportCancelled, export_table
+
+#: Opción de ``ask_export_format`` para guardar una sesión HDF5 (señales y
+#: resultados en un solo archivo) en lugar de tablas sueltas
+SESSION_FORMAT = 'h5'
+
+
+class ExportSignals(QObject):
+    """Señales de ``ExportTask`` (un ``QRunnable`` no puede emitirlas)"""
+
+    #: Avance total. Parámetro: porcentaje (int)
+    progress = pyqtSignal(int)
+    #: Exportación terminada. Parámetro: rutas creadas (list)
+    finished = pyqtSignal(list)
+    #: Exportación cancelada. Parámetro: rutas creadas antes de cancelar (list)
+    cancelled = pyqtSignal(list)
+    #: Error. Parámetro: mensaje (str)
+    failed = pyqtSignal(str)
+
+
+class ExportTask(QRunnable):
+    """Lista de archivos a escribir fuera del hilo de la interfaz
+
+    Las tablas se escriben por bloques con ``export_table``; entre bloques se
+    informa el avance y se atiende ``cancel()``. Los trabajos agregados con
+    ``add_job`` (p. ej. una sesión HDF5) se ejecutan completos.
+    """
+
+    def __init__(self, existing=None):
+        """
+        :param existing: archivos ya escritos antes de la tarea (p. ej. una
+            grabación finalizada) que se incluyen en el resumen final.
+        """
+        super().__init__()
+        self.signals = ExportSignals()
+        self.existing = list(existing or [])
+        self._jobs = []
+        self._cancel = threading.Event()
+        self._last_percent = -1
+
+    def add_table(self, path, columns, fmt=None):
+        """Agrega una tabla (nombre de columna → arreglo) a exportar
+
+        :param path: archivo de destino.
+        :param columns: columnas de igual largo, en orden.
+        :param fmt: formato de ``EXPORT_FORMATS``; None = según la extensión.
+        """
+        self._jobs.append((path, lambda progress, cancelled:
+                           export_table(path, columns, fmt, progress, cancelled)))
+
+    def add_job(self, path, function):
+        """Agrega un trabajo arbitrario que crea ``path``
+
+        :param path: archivo que crea el trabajo (para el resumen final).
+        :param function: callable sin argumentos.
+        """
+        self._jobs.append((path, lambda progress, cancelled: function()))
+
+    def cancel(self):
+        """Pide cancelar; se atiende entre bloques y entre archivos"""
+        self._cancel.set()
+
+    def _report(self, index, fraction):
+        """Emite el avance total solo cuando cambia el porcentaje"""
+        percent = int(100 * (index + fraction) / max(len(self._jobs), 1))
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.progress.emit(percent)
+
+    def run(self):
+        """Escribe todos los archivos (en un hilo del pool)"""
+        saved = list(self.existing)
+        try:
+            for index, (path, job) in enumerate(self._jobs):
+                if self._cancel.is_set():
+                    raise ExportCancelled(path)
+                job(lambda fraction, index=index: self._report(index, fraction),
+                    self._cancel.is_set)
+                saved.append(path)
+                self._report(index, 1.0)
+        except ExportCancelled:
+            self.signals.cancelled.emit(saved)
+            return
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(saved)
+
+    def start(self):
+        """Encola la tarea en el pool global de hilos"""
+        QThreadPool.globalInstance().start(self)
+
+
+def ask_export_format(parent, session=False):
+    """Pide el formato de exportación entre ``EXPORT_FORMATS``
+
+    :param session: ofrecer además ``SESSION_FORMAT`` (sesión HDF5).
+    :return: formato elegido, o None si se canceló el diálogo.
+    """
+    formats = EXPORT_FORMATS + [SESSION_FORMAT] if session else EXPORT_FORMATS
+    current = formats.index(DEFAULT_EXPORT_FORMAT) if DEFAULT_EXPORT_FORMAT in formats else 0
+    label = "Formato de los archivos:"
+    if session:
+        label += f"\n({SESSION_FORMAT}: sesión HDF5 con señales, latidos y parámetros)"
+    fmt, ok = QInputDialog.getItem(parent, "Formato de Exportación", label, formats, current, False)
+    return fmt if ok else None
+
+
+def start_export(parent, task, log=None):
+    """Lanza una ``ExportTask`` con un diálogo de avance cancelable
+
+    La interfaz sigue respondiendo mientras se escribe; al terminar se
+    muestra la lista de archivos creados.
+
+    :param parent: widget dueño del diálogo.
+    :param task: tarea con los archivos ya agregados.
+    :param log: callable opcional para registrar mensajes en el log.
+    """
+    dialog = QProgressDialog("Exportando datos...", "Cancelar", 0, 100, parent)
+    dialog.setWindowTitle("Exportación")
+    dialog.setWindowModality(Qt.WindowModal)
+    dialog.setMinimumDuration(500)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+
+    def summary(paths):
+        return "\n".join(f"• {os.path.basename(path)}" for path in paths) or "Ningún archivo generado."
+
+    def on_finished(paths):
+        dialog.close()
+        dialog.deleteLater()
+        directory = os.path.dirname(paths[0]) if paths else ""
+        if log is not None:
+            log(f"Datos exportados en: {directory}")
+        QMessageBox.information(parent, "Guardado Exitoso",
+                                f"Datos guardados exitosamente en:\n{directory}\n\n"
+                                f"Archivos creados:\n{summary(paths)}")
+
+    def on_cancelled(paths):
+        dialog.close()
+        dialog.deleteLater()
+        if log is not None:
+            log("Exportación cancelada")
+        QMessageBox.warning(parent, "Exportación Cancelada",
+                            f"Exportación cancelada.\n\nArchivos completos:\n{summary(paths)}")
+
+    def on_failed(message):
+        dialog.close()
+        dialog.deleteLater()
+        if log is not None:
+            log(f"Error exportando datos: {message}")
+        QMessageBox.critical(parent, "Error al Guardar", f"Error al guardar los datos: {message}")
+
+    task.signals.progress.connect(dialog.setValue)
+    task.signals.finished.connect(on_finished)
+    task.signals.cancelled.connect(on_cancelled)
+    task.signals.failed.connect(on_failed)
+    dialog.canceled.connect(task.cancel)
+    # Mantener viva la tarea (y sus señales) mientras dure el diálogo
+    dialog.task = task
+    task.start()
+    return task
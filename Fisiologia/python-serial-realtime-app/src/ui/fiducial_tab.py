@@ -11,7 +11,6 @@ Flujo de uso:
 """
 
 import os
-import pandas as pd
 import numpy as np
 import pyqtgraph as pg
 
@@ -22,6 +21,10 @@ from PyQt5.QtWidgets import (
 )
 from PyQt5.QtCore import Qt
 from datetime import datetime
+from data.session_file import save_session, is_session_file
+from data.write_data import export_path, table_columns
+from .file_loader import FileLoadTask
+from .exporter import SESSION_FORMAT, ExportTask, ask_export_format, start_export
 
 
 class FiducialTab(QWidget):
@@ -38,7 +41,9 @@ class FiducialTab(QWidget):
         # Estado interno
         self.time_data = None       # array numpy con el eje temporal
         self.signal_data = None     # array numpy con la señal filtrada cargada
+        self.signal_channel = None  # canal cargado ('filtered', o 'raw' si no había filtrada)
         self.analysis_result = None  # dict devuelto por analyze_segment
+        self._load_task = None       # lectura de archivo en curso
 
         self.setup_ui()
 
@@ -209,24 +214,37 @@ class FiducialTab(QWidget):
     # ------------------------------------------------------------------ #
 
     def load_csv_file(self):
-        """Abre un CSV y carga las columnas de tiempo y señal"""
+        """Abre un CSV o una sesión HDF5 y carga las columnas de tiempo y señal"""
         file_path, _ = QFileDialog.getOpenFileName(
-            self, "Seleccionar CSV filtrado", "", "Archivos CSV (*.csv)"
+            self, "Seleccionar CSV filtrado", "",
+            "Archivos CSV (*.csv);;Parquet / Feather (*.parquet *.feather *.arrow);;"
+            "Sesiones HDF5 (*.h5 *.hdf5);;Grabaciones comprimidas (*.ppgz)"
         )
         if not file_path:
             return
 
+        # Lectura en un hilo del pool: la interfaz sigue respondiendo
+        self.load_btn.setEnabled(False)
+        self.file_info_label.setText("Cargando archivo... 0%")
+        self._load_task = FileLoadTask(
+            file_path, prefer=('filtered', 'raw'), fs=self.fs_spin.value()
+        )
+        self._load_task.signals.progress.connect(
+            lambda percent: self.file_info_label.setText(f"Cargando archivo... {percent}%")
+        )
+        self._load_task.signals.loaded.connect(self._on_file_loaded)
+        self._load_task.signals.failed.connect(self._on_file_load_failed)
+        self._load_task.start()
+
+    def _on_file_loaded(self, file_path, time_data, data, fs):
+        """Recibe el archivo leído por FileLoadTask y actualiza la pestaña"""
+        self._load_task = None
+        self.load_btn.setEnabled(True)
         try:
-            df = pd.read_csv(file_path)
-
-            if df.shape[1] >= 2:
-                self.time_data = df.iloc[:, 0].values.astype(float)
-                self.signal_data = df.iloc[:, 1].values.astype(float)
-            elif df.shape[1] == 1:
-                self.signal_data = df.iloc[:, 0].values.astype(float)
-                self.time_data = np.arange(len(self.signal_data)) / self.fs_spin.value()
-            else:
-                raise ValueError("El archivo debe tener al menos una columna de datos")
+            self.time_data = time_data
+            self.signal_channel, self.signal_data = next(iter(data.items()))
+            if is_session_file(file_path) and fs:
+                self.fs_spin.setValue(int(round(fs)))
 
             n = len(self.signal_data)
             duration = self.time_data[-1] - self.time_data[0]
@@ -251,8 +269,15 @@ class FiducialTab(QWidget):
             self._log(f"CSV cargado: {file_name}  ({n} pts, {duration:.2f} s)")
 
         except Exception as e:
-            QMessageBox.critical(self, "Error al cargar CSV", str(e))
-            self._log(f"Error cargando CSV: {e}")
+            self._on_file_load_failed(file_path, str(e))
+
+    def _on_file_load_failed(self, file_path, message):
+        """Informa un error de lectura de FileLoadTask"""
+        self._load_task = None
+        self.load_btn.setEnabled(True)
+        self.file_info_label.setText("No se pudo cargar el archivo")
+        QMessageBox.critical(self, "Error al cargar CSV", message)
+        self._log(f"Error cargando CSV: {message}")
 
     def detect_fiducials(self):
         """Llama a ppg_processor.analyze_segment() y visualiza los resultados"""
@@ -322,7 +347,7 @@ class FiducialTab(QWidget):
         )
 
     def save_results(self):
-        """Guarda los resultados en archivos CSV dentro de una carpeta elegida"""
+        """Exporta los resultados (en segundo plano) dentro de una carpeta elegida"""
         if self.analysis_result is None:
             QMessageBox.warning(self, "Sin análisis", "Calcule los puntos fiduciales primero.")
             return
@@ -342,55 +367,49 @@ class FiducialTab(QWidget):
             return
         base_name = base_name.strip()
 
-        saved = []
+        fmt = ask_export_format(self, session=True)
+        if fmt is None:
+            return
 
-        try:
+        base_path = os.path.join(directory, base_name)
+        task = ExportTask()
+        parameters = self.analysis_result.get('parameters', {})
+        beat_rows = self.analysis_result.get('beats', [])
+
+        if fmt == SESSION_FORMAT:
+            # Sesión HDF5 con la señal analizada (con el canal que se cargó) y los resultados
+            session_path = f"{base_path}_sesion.h5"
+            time_data, signal_data = self.time_data, self.signal_data
+            channel = self.signal_channel or 'filtered'
+            fiducials = self.analysis_result.get('fiducials')
+            fs = self.fs_spin.value()
+            task.add_job(session_path, lambda: save_session(
+                session_path,
+                time_data,
+                {channel: signal_data},
+                fs=fs,
+                beats=beat_rows,
+                fiducials=fiducials,
+                parameters=parameters,
+            ))
+        else:
             # 1. Parámetros
-            parameters = self.analysis_result.get('parameters', {})
             if parameters:
-                df_params = pd.DataFrame(
-                    list(parameters.items()),
-                    columns=['Parametro', 'Valor']
-                )
-                path = os.path.join(directory, f"{base_name}_parametros.csv")
-                df_params.to_csv(path, index=False)
-                saved.append(f"• {base_name}_parametros.csv")
+                task.add_table(export_path(f"{base_path}_parametros", fmt),
+                               table_columns(parameters), fmt)
 
             # 2. Puntos fiduciales por latido
-            beat_rows = self.analysis_result.get('beats', [])
             if beat_rows:
-                rows = []
-                for i, row in enumerate(beat_rows, start=1):
-                    rows.append({
-                        'latido':      i,
-                        'onset_idx':   row['onset_idx'],
-                        'onset_time':  row['onset_time'],
-                        'onset_amp':   row['onset_amp'],
-                        'sys_idx':     row['sys_idx'],
-                        'sys_time':    row['sys_time'],
-                        'sys_amp':     row['sys_amp'],
-                    })
-                df_fid = pd.DataFrame(
-                    rows,
-                    columns=['latido', 'onset_idx', 'onset_time', 'onset_amp',
-                             'sys_idx', 'sys_time', 'sys_amp']
-                )
-                path = os.path.join(directory, f"{base_name}_fiduciales.csv")
-                df_fid.to_csv(path, index=False)
-                saved.append(
-                    f"• {base_name}_fiduciales.csv ({len(df_fid)} latidos)"
+                rows = [dict(row, latido=i) for i, row in enumerate(beat_rows, start=1)]
+                task.add_table(
+                    export_path(f"{base_path}_fiduciales", fmt),
+                    table_columns(rows, ['latido', 'onset_idx', 'onset_time', 'onset_amp',
+                                         'sys_idx', 'sys_time', 'sys_amp']),
+                    fmt
                 )
 
-            files_list = "\n".join(saved) if saved else "Ningún archivo generado."
-            self._log(f"Resultados guardados en: {directory}")
-            QMessageBox.information(
-                self, "Guardado exitoso",
-                f"Archivos creados en:\n{directory}\n\n{files_list}"
-            )
-
-        except Exception as e:
-            self._log(f"Error guardando resultados: {e}")
-            QMessageBox.critical(self, "Error al guardar", str(e))
+        # Escritura en un hilo del pool con avance y cancelación
+        start_export(self, task, self._log)
 
     # ------------------------------------------------------------------ #
     #  Utilidades internas                                                 #
@@ -400,6 +419,7 @@ class FiducialTab(QWidget):
         """Limpia todos los datos y gráficos"""
         self.time_data = None
         self.signal_data = None
+        self.signal_channel = None
         self.analysis_result = None
 
         self.signal_curve.setData([], [])
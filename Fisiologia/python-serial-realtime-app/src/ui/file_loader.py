@@ -0,0 +1,59 @@
+"""
+Carga de archivos de señal en un hilo del pool de Qt
+"""
+import traceback
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+from data.read_data import load_signal_file
+
+
+class FileLoadSignals(QObject):
+    """Señales de ``FileLoadTask`` (un ``QRunnable`` no puede emitirlas)"""
+
+    #: Avance de la lectura. Parámetro: porcentaje (int)
+    progress = pyqtSignal(int)
+    #: Archivo cargado. Parámetros: ruta (str), tiempo (np.ndarray),
+    #: canales (dict canal → np.ndarray), fs (float o None)
+    loaded = pyqtSignal(str, object, object, object)
+    #: Error de lectura. Parámetros: ruta (str), mensaje (str)
+    failed = pyqtSignal(str, str)
+
+
+class FileLoadTask(QRunnable):
+    """Lee un CSV o una sesión ``.h5`` fuera del hilo de la interfaz
+
+    Los resultados llegan por ``signals`` al hilo de la interfaz, que sigue
+    respondiendo durante cargas grandes.
+    """
+
+    def __init__(self, path, **options):
+        """
+        :param path: archivo a leer.
+        :param options: argumentos de ``load_signal_file`` (``channels``,
+            ``prefer``, ``t_start``, ``t_end``, ``fs``).
+        """
+        super().__init__()
+        self.path = path
+        self.options = options
+        self.signals = FileLoadSignals()
+        self._last_percent = -1
+
+    def _report(self, fraction):
+        """Emite el avance solo cuando cambia el porcentaje"""
+        percent = int(fraction * 100)
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.progress.emit(percent)
+
+    def run(self):
+        """Ejecuta la lectura (en un hilo del pool)"""
+        try:
+            time_data, data, fs = load_signal_file(self.path, progress=self._report, **self.options)
+        except Exception as e:
+            traceback.print_exc()
+            self.signals.failed.emit(self.path, str(e))
+            return
+        self.signals.loaded.emit(self.path, time_data, data, fs)
+
+    def start(self):
+        """Encola la tarea en el pool global de hilos"""
+        QThreadPool.globalInstance().start(self)
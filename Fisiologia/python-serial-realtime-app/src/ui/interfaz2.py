@@ -23,6 +23,11 @@ from PyQt5.QtCore import (
 from PyQt5.QtGui import QFont, QColor
 import pyqtgraph as pg
 
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from core.processing.column_store import ColumnStore
+from core.processing.sample_queue import SampleQueue
+from data.read_data import load_signal_file
+
 # --- Configuraciones de PyQTGraph y Estilo ---
 pg.setConfigOption('background', '#FFFFFF') # Fondo blanco para los gráficos
 pg.setConfigOption('foreground', '#333333') # Eje y texto gris oscuro
@@ -38,10 +43,11 @@ class SerialReader(threading.Thread):
         self.ser = None
         self.port = port
         self.baud = baud
-        self.lock = threading.Lock()
         self.running = False
         self.paused = False
-        self.buffer = []
+        # Cola acotada (60 s a 125 Hz): si la UI se bloquea se descartan las
+        # muestras más antiguas en lugar de crecer sin límite
+        self.buffer = SampleQueue(7500, n_channels=3, policy='drop_oldest')
         
         # Regex para extraer los valores
         self.pattern = re.compile(r"Crudo:(-?\d+(?:\.\d+)?),Filtrado:(-?\d+(?:\.\d+)?),Normalizado:(-?\d+(?:\.\d+)?)", re.IGNORECASE)
@@ -100,8 +106,7 @@ class SerialReader(threading.Thread):
                         normalizado_val = float(match.group(3))
                         
                         ts = time.time()
-                        with self.lock:
-                            self.buffer.append((ts, crudo_val, filtrado_val, normalizado_val))
+                        self.buffer.put_many([ts], [[crudo_val, filtrado_val, normalizado_val]])
                 else:
                     time.sleep(0.01)
             except Exception as e:
@@ -109,11 +114,8 @@ class SerialReader(threading.Thread):
                 time.sleep(0.1)
     
     def get_data(self):
-        """Obtener datos del buffer"""
-        with self.lock:
-            data = self.buffer[:]
-            self.buffer.clear()
-        return data
+        """Obtener datos del buffer: (timestamps, valores n x 3)"""
+        return self.buffer.get_all()
 
 class PPGProcessor:
     """Clase para manejar el procesamiento, análisis y cálculo de parámetros PPG."""
@@ -121,13 +123,28 @@ class PPGProcessor:
     def __init__(self):
         # Datos para el procesamiento
         self.fs = 125.0 # Frecuencia de muestreo real del sensor
-        self.time = np.array([])
-        self.raw = np.array([])
-        self.filtered = np.array([])
-        self.normalized = np.array([])
+        # Historia completa de la sesión: agregado O(1) amortizado, sin np.append
+        self.store = ColumnStore(['time', 'raw', 'filtered', 'normalized'])
         self.serial_reader = None
         self.start_timestamp = None
         
+    # Vistas sin copia de cada canal almacenado
+    @property
+    def time(self):
+        return self.store.column('time')
+    
+    @property
+    def raw(self):
+        return self.store.column('raw')
+    
+    @property
+    def filtered(self):
+        return self.store.column('filtered')
+    
+    @property
+    def normalized(self):
+        return self.store.column('normalized')
+        
     def connect_serial(self, port, baudrate):
         """Conecta al puerto serial real."""
         try:
@@ -173,49 +190,34 @@ class PPGProcessor:
         if self.serial_reader is None:
             return [], [], [], []
             
-        new_data = self.serial_reader.get_data()
-        if not new_data:
+        timestamps, values = self.serial_reader.get_data()
+        if not len(timestamps):
             return [], [], [], []
         
-        t_new = []
-        raw_new = []
-        filtered_new = []
-        normalized_new = []
-        
-        for ts, crudo, filtrado, normalizado in new_data:
-            # Convertir timestamp a tiempo relativo desde el inicio
-            relative_time = ts - self.start_timestamp if self.start_timestamp else 0
-            t_new.append(relative_time)
-            raw_new.append(crudo)
-            filtered_new.append(filtrado)
-            normalized_new.append(normalizado)
+        # Convertir timestamp a tiempo relativo desde el inicio
+        if self.start_timestamp:
+            t_new = timestamps - self.start_timestamp
+        else:
+            t_new = np.zeros(len(timestamps))
         
-        return np.array(t_new), np.array(raw_new), np.array(filtered_new), np.array(normalized_new)
+        return t_new, values[:, 0], values[:, 1], values[:, 2]
 
     def update_data(self, t, raw, filtered, normalized):
         """Añade nuevos datos a los arrays internos."""
-        self.time = np.append(self.time, t)
-        self.raw = np.append(self.raw, raw)
-        self.filtered = np.append(self.filtered, filtered)
-        self.normalized = np.append(self.normalized, normalized)
+        self.store.append(t, raw, filtered, normalized)
 
     def clear_data(self):
         """Limpia todos los datos almacenados."""
-        self.time = np.array([])
-        self.raw = np.array([])
-        self.filtered = np.array([])
-        self.normalized = np.array([])
+        self.store.clear()
 
     def load_csv(self, filepath):
-        """Carga datos desde un archivo CSV."""
+        """Carga datos desde un archivo CSV o una sesión HDF5."""
         try:
             # Columnas esperadas: tiempo_relativo_s,Crudo,Filtrado,Normalizado
-            df = pd.read_csv(filepath)
-            
-            self.time = df['tiempo_relativo_s'].values
-            self.raw = df['Crudo'].values
-            self.filtered = df['Filtrado'].values
-            self.normalized = df['Normalizado'].values
+            # (en una sesión .h5: canales raw, filtered, normalized)
+            channels = ['raw', 'filtered', 'normalized']
+            time_data, data, _ = load_signal_file(filepath, channels=channels)
+            self.store.load(time_data, *(data[name] for name in channels))
             
             # Recalcular la frecuencia de muestreo (FS)
             if len(self.time) > 1:
@@ -881,22 +883,18 @@ class AcquisitionTab(QWidget):
         if len(t_new) > 0:
             self.processor.update_data(t_new, raw_new, filtered_new, normalized_new)
         
-        # Obtener todos los datos
-        t = self.processor.time
+        # Tiempo de la última muestra
+        t_last = self.processor.store.last_time()
         
-        if len(t) == 0:
+        if t_last is None:
             return
             
         # Limitar la ventana visible a los últimos 10 segundos
         max_visible_time = 10
-        t_start = max(t[-1] - max_visible_time, 0)
+        t_start = max(t_last - max_visible_time, 0)
         
-        # Recortar datos para una mejor visualización de alto rendimiento
-        idx_start = np.searchsorted(t, t_start)
-        t_view = t[idx_start:]
-        raw_view = self.processor.raw[idx_start:]
-        filtered_view = self.processor.filtered[idx_start:]
-        normalized_view = self.processor.normalized[idx_start:]
+        # Recortar datos para una mejor visualización de alto rendimiento (vistas sin copia)
+        t_view, raw_view, filtered_view, normalized_view = self.processor.store.time_range(t_start)
         
         # Actualizar solo las curvas visibles basado en la selección actual
         self.curve_raw.setData(t_view, raw_view)
@@ -907,8 +905,8 @@ class AcquisitionTab(QWidget):
         self.plot_widget.setXRange(t_view[0], t_view[-1] if len(t_view) > 1 else t_view[0] + 1)
         
         # Ajustar la posición inicial del ROI al final de la ventana
-        if len(t) > 0:
-            end_pos = t[-1]
+        if len(t_view) > 0:
+            end_pos = t_last
             start_pos = end_pos - self.default_window_s  # Mantener siempre el tamaño original
             
             # Solo mover el ROI si tenemos suficientes datos
@@ -926,7 +924,8 @@ class AcquisitionTab(QWidget):
     def load_csv_file(self):
         """Abre un diálogo para cargar un archivo CSV."""
         path, _ = QFileDialog.getOpenFileName(self, "Cargar Archivo CSV de PPG", "", 
-                                                "CSV Files (*.csv)")
+                                                "CSV Files (*.csv);;Parquet / Feather (*.parquet *.feather *.arrow);;"
+                                                "HDF5 Sessions (*.h5 *.hdf5)")
         if path:
             self.reset_acquisition()
             if self.processor.load_csv(path):
@@ -1179,7 +1178,8 @@ class PPGAnalyzerApp(QMainWindow):
 
     def save_acquisition_data(self):
         """Guarda los datos de adquisición en múltiples archivos CSV separados."""
-        if len(self.processor.time) == 0:
+        store = self.processor.store
+        if len(store) == 0:
             QMessageBox.warning(self, "Advertencia", "No hay datos para guardar. Inicie la adquisición o cargue un CSV.")
             return
             
@@ -1200,25 +1200,25 @@ class PPGAnalyzerApp(QMainWindow):
             
             # 1. Guardar datos del canal crudo (PPG sin procesar)
             df_raw = pd.DataFrame({
-                'tiempo_relativo_s': self.processor.time,
-                'valor_crudo': self.processor.raw
+                'tiempo_relativo_s': store['time'],
+                'valor_crudo': store['raw']
             })
             raw_path = os.path.join(directory, f"{base_name}_canal_crudo.csv")
             df_raw.to_csv(raw_path, index=False)
             
             # 2. Guardar PPG filtrada
             df_filtered = pd.DataFrame({
-                'tiempo_relativo_s': self.processor.time,
-                'valor_filtrado': self.processor.filtered
+                'tiempo_relativo_s': store['time'],
+                'valor_filtrado': store['filtered']
             })
             filtered_path = os.path.join(directory, f"{base_name}_ppg_filtrada.csv")
             df_filtered.to_csv(filtered_path, index=False)
             
             # 3. Guardar derivadas (primera y segunda) usando la señal filtrada
-            if len(self.processor.filtered) > 2:
-                d1, d2 = self.processor.calculate_derivatives(self.processor.filtered)
+            if len(store) > 2:
+                d1, d2 = self.processor.calculate_derivatives(store['filtered'])
                 df_derivatives = pd.DataFrame({
-                    'tiempo_relativo_s': self.processor.time,
+                    'tiempo_relativo_s': store['time'],
                     'primera_derivada': d1,
                     'segunda_derivada': d2
                 })
@@ -1227,14 +1227,12 @@ class PPGAnalyzerApp(QMainWindow):
             
             # 4. Calcular y guardar parámetros básicos de toda la señal
             # Usar una ventana representativa (últimos 10 segundos o toda la señal si es menor)
-            analysis_window_duration = min(10.0, self.processor.time[-1] if len(self.processor.time) > 0 else 0)
+            analysis_window_duration = min(10.0, store.last_time())
             if analysis_window_duration > 2.0:  # Solo si hay al menos 2 segundos de datos
-                t_end = self.processor.time[-1]
+                t_end = store.last_time()
                 t_start = t_end - analysis_window_duration
-                idx_start = np.searchsorted(self.processor.time, t_start)
                 
-                t_segment = self.processor.time[idx_start:]
-                raw_segment = self.processor.raw[idx_start:]
+                t_segment, raw_segment = store.time_range(t_start, columns=['time', 'raw'])
                 
                 # Analizar el segmento para obtener parámetros
                 analysis_data, parameters = self.processor.analyze_segment(t_segment, raw_segment)
@@ -1273,25 +1271,18 @@ class PPGAnalyzerApp(QMainWindow):
         region = self.acquisition_tab.roi.getRegion()
         t_start, t_end = region
         
-        full_time = self.processor.time
-        full_raw = self.processor.raw # Analizar el canal Crudo como se solicitó
-
-        if len(full_time) == 0:
+        if len(self.processor.store) == 0:
             QMessageBox.warning(self, "Advertencia", "No hay datos para analizar. Inicie la adquisición o cargue un CSV.")
             return
             
-        # Encontrar índices de inicio y fin
-        idx_start = np.searchsorted(full_time, t_start)
-        idx_end = np.searchsorted(full_time, t_end)
+        # Recortar datos (vistas sin copia); analizar el canal Crudo como se solicitó
+        t_segment, ppg_segment = self.processor.store.time_range(t_start, t_end,
+                                                                 columns=['time', 'raw'])
         
         # Asegurar que el rango sea válido
-        if idx_start >= idx_end:
+        if len(t_segment) == 0:
             QMessageBox.warning(self, "Advertencia", "El rango seleccionado es inválido o demasiado pequeño.")
             return
-
-        # Recortar datos
-        t_segment = full_time[idx_start:idx_end]
-        ppg_segment = full_raw[idx_start:idx_end]
         
         # 3. Realizar el análisis
         analysis_data, parameters = self.processor.analyze_segment(t_segment, ppg_segment)
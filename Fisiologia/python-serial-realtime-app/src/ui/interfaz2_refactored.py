@@ -4,13 +4,13 @@ Aplicación principal PPG Analyzer - Versión Refactorizada
 import sys
 import os
 import time
-import pandas as pd
 import numpy as np
 import pyqtgraph as pg
 import serial
 import threading
 import re
 import platform
+import tempfile
 from scipy.signal import find_peaks, savgol_filter, butter, filtfilt
 
 # Importaciones de PyQt5
@@ -27,10 +27,24 @@ from PyQt5.QtGui import QFont, QColor
 
 # Importar módulos refactorizados
 from .serial_reader import SerialReader
+from .process_reader import ProcessSerialReader
 from .ppg_processor import PPGProcessor
 from .acquisition_tab import AcquisitionTab
 from .analysis_tab import AnalysisTab
 from .fiducial_tab import FiducialTab
+from .catalog_tab import CatalogTab
+from .devices_tab import DevicesTab
+from .exporter import ExportTask, ask_export_format, start_export
+from config.settings import (SERIAL_BATCH_INTERVAL, SERIAL_PROTOCOL, ACQUISITION_BACKEND,
+                             LINE_SNIFF_LINES, LINE_FORMAT_MAX_FAILURES, RECORDING_DIR,
+                             RECORDER_FORMAT)
+from core.acquisition.session_recorder import SessionRecorder
+from data.packed_recording import PACKED_EXTENSION
+from data.range_index import build_range_index
+from data.read_data import load_signal_file
+from data.write_data import export_path, export_table, signal_columns
+from core.processing.line_format import LineFormatParser
+from config.serial_config import SerialConfig
 
 # --- Configuraciones de PyQTGraph y Estilo ---
 pg.setConfigOption('background', '#FFFFFF')  # Fondo blanco para los gráficos
@@ -46,9 +60,21 @@ class PPGAnalyzerApp(QMainWindow):
         self.setGeometry(100, 100, 1400, 900)
         
         # Componentes principales
-        self.serial_reader = SerialReader()
+        if ACQUISITION_BACKEND == 'process':
+            # Lectura en un proceso hijo: el análisis y el guardado no la demoran
+            self.serial_reader = ProcessSerialReader(batch_interval=SERIAL_BATCH_INTERVAL,
+                                                     protocol=SERIAL_PROTOCOL)
+        else:
+            self.serial_reader = SerialReader(batch_interval=SERIAL_BATCH_INTERVAL,
+                                              protocol=SERIAL_PROTOCOL)
         self.ppg_processor = PPGProcessor()
+        self.line_parser = LineFormatParser(LINE_SNIFF_LINES, LINE_FORMAT_MAX_FAILURES)
+        # Formato de línea conocido del puerto (caché): los lectores no lo detectan
+        self.line_format = None
         self.serial_port = None
+        # Grabación continua de la sesión en disco (no se limita al buffer de 60 s)
+        self.recorder = None
+        self.recorder_error_logged = False
         
         # Estados de la aplicación
         self.connected = False
@@ -58,6 +84,9 @@ class PPGAnalyzerApp(QMainWindow):
         self.setup_connections()
         self.setup_status_bar()
         
+        # Con la ventana ya visible: grabaciones que dejó un cierre inesperado
+        QTimer.singleShot(0, self.offer_pending_recordings)
+        
     def setup_ui(self):
         """Configura la interfaz del usuario"""
         central_widget = QWidget()
@@ -80,13 +109,28 @@ class PPGAnalyzerApp(QMainWindow):
         self.fiducial_tab = FiducialTab(self.ppg_processor)
         self.tab_widget.addTab(self.fiducial_tab, "Puntos Fiduciales")
 
+        # Pestaña de catálogo de grabaciones
+        self.catalog_tab = CatalogTab()
+        self.tab_widget.addTab(self.catalog_tab, "Catálogo")
+
+        # Pestaña de adquisición simultánea de varios sujetos
+        self.devices_tab = DevicesTab()
+        self.tab_widget.addTab(self.devices_tab, "Varios Sujetos")
+
         layout.addWidget(self.tab_widget)
         central_widget.setLayout(layout)
         
     def setup_connections(self):
         """Configura las conexiones entre componentes"""
+        # Abrir grabaciones del catálogo en la pestaña de análisis
+        self.catalog_tab.recording_selected.connect(self.open_recording)
+
         # Conexiones del lector serie
         self.serial_reader.data_received.connect(self.process_serial_data)
+        self.serial_reader.batch_received.connect(self.ppg_processor.append_many)
+        self.serial_reader.batch_received.connect(self.record_batch)
+        self.serial_reader.gap_detected.connect(self.ppg_processor.mark_gap)
+        self.ppg_processor.gap_detected.connect(self.on_samples_lost)
         self.serial_reader.connection_status_changed.connect(self.on_connection_changed)
         self.serial_reader.error_occurred.connect(self.on_serial_error)
         
@@ -108,10 +152,12 @@ class PPGAnalyzerApp(QMainWindow):
         # Etiquetas de estado
         self.connection_status_label = QLabel("Desconectado")
         self.data_rate_label = QLabel("0 pts/s")
+        self.serial_stats_label = QLabel("")
         self.hr_status_label = QLabel("FC: -- BPM")
         
         self.status_bar.addWidget(QLabel("Estado:"))
         self.status_bar.addWidget(self.connection_status_label)
+        self.status_bar.addPermanentWidget(self.serial_stats_label)
         self.status_bar.addPermanentWidget(self.data_rate_label)
         self.status_bar.addPermanentWidget(self.hr_status_label)
         
@@ -126,8 +172,17 @@ class PPGAnalyzerApp(QMainWindow):
         try:
             self.serial_port = serial.Serial(port, baudrate, timeout=1)
             self.connected = True
+            self.line_format = SerialConfig.get_cached_format(port, baudrate)
+            self.line_parser = LineFormatParser(LINE_SNIFF_LINES, LINE_FORMAT_MAX_FAILURES,
+                                                self.line_format if self.line_format != 'binary' else None)
+            SerialConfig.save_port_cache(port, baudrate)
             self.acquisition_tab.controls.set_connection_state(True)
             self.acquisition_tab.log_message(f"Conectado a {port} @ {baudrate}")
+            if self.line_format == 'binary' and SERIAL_PROTOCOL != 'binary':
+                self.acquisition_tab.log_message(
+                    "El dispositivo envió tramas binarias: configure SERIAL_PROTOCOL = 'binary'")
+            elif self.line_format:
+                self.acquisition_tab.log_message(f"Formato de línea conocido: {self.line_format}")
             self.connection_status_label.setText("Conectado")
             self.acquisition_tab.set_connection_status(True, False)
             
@@ -158,7 +213,12 @@ class PPGAnalyzerApp(QMainWindow):
         """Inicia la adquisición de datos"""
         if self.connected and self.serial_port and self.serial_port.is_open:
             try:
-                self.serial_reader.start_reading(self.serial_port)
+                if self.recorder is None:
+                    self.start_recorder()
+                else:
+                    self.recorder.start()
+                self.serial_reader.start_reading(self.serial_port, self.line_format)
+                self.line_parser.reset()
                 self.ppg_processor.start_processing()
                 self.acquiring = True
                 
@@ -179,6 +239,9 @@ class PPGAnalyzerApp(QMainWindow):
             self.serial_reader.stop_reading()
             self.ppg_processor.stop_processing()
             self.acquiring = False
+            if self.recorder is not None:
+                # Baja a disco lo pendiente; al reanudar se sigue agregando al mismo archivo
+                self.recorder.stop()
             
             self.acquisition_tab.controls.set_acquisition_state(False)
             self.acquisition_tab.log_message("Adquisición detenida")
@@ -194,6 +257,12 @@ class PPGAnalyzerApp(QMainWindow):
         """Resetea todos los datos"""
         try:
             self.ppg_processor.reset_data()
+            self.serial_reader.reset_clock()
+            if self.recorder is not None:
+                self.recorder.discard()
+                self.recorder = None
+                if self.acquiring:
+                    self.start_recorder()
             self.acquisition_tab.log_message("Datos reseteados")
             
             # Limpiar gráfico
@@ -203,11 +272,48 @@ class PPGAnalyzerApp(QMainWindow):
             error_msg = f"Error reseteando datos: {e}"
             self.acquisition_tab.log_message(error_msg)
             
+    def start_recorder(self):
+        """Crea la grabación en curso de una nueva sesión y la inicia"""
+        extension = PACKED_EXTENSION if RECORDER_FORMAT == 'packed' else '.csv'
+        path = os.path.join(RECORDING_DIR, time.strftime("sesion_%Y%m%d_%H%M%S") + extension + '.part')
+        self.recorder = SessionRecorder(path, fmt=RECORDER_FORMAT)
+        self.recorder.start()
+        self.recorder_error_logged = False
+        self.acquisition_tab.log_message(f"Grabando sesión en {path}")
+        
+    def offer_pending_recordings(self):
+        """Ofrece recuperar las grabaciones ``.part`` que dejó un cierre inesperado"""
+        pending = SessionRecorder.pending_recordings(RECORDING_DIR)
+        if not pending:
+            return
+        names = "\n".join(f"• {os.path.basename(path)}" for path in pending)
+        answer = QMessageBox.question(
+            self, "Grabaciones Interrumpidas",
+            f"Se encontraron grabaciones de sesiones que no se guardaron:\n{names}\n\n"
+            f"¿Recuperarlas en {RECORDING_DIR}?",
+            QMessageBox.Yes | QMessageBox.No, QMessageBox.Yes)
+        if answer != QMessageBox.Yes:
+            return
+        for path in pending:
+            try:
+                destination, samples = SessionRecorder.restore(path)
+                self.acquisition_tab.log_message(
+                    f"Grabación recuperada: {destination} ({samples} muestras)")
+            except Exception as e:
+                self.acquisition_tab.log_message(f"Error recuperando {path}: {e}")
+            
+    def record_batch(self, timestamps, values):
+        """Envía un lote a la grabación con tiempos relativos al inicio"""
+        if self.recorder is not None and self.ppg_processor.start_time is not None:
+            self.recorder.write(np.asarray(timestamps) - self.ppg_processor.start_time, values)
+            
     def save_acquisition_data(self):
-        """Guarda los datos crudos de adquisición en archivo CSV"""
+        """Guarda los datos crudos de adquisición (exportación en segundo plano)"""
         try:
             # Verificar que haya datos
-            if len(self.ppg_processor.time_buffer) == 0:
+            recorded = self.recorder is not None and (self.recorder.samples > 0
+                                                      or self.recorder.is_recording())
+            if len(self.ppg_processor.time_buffer) == 0 and not recorded:
                 QMessageBox.warning(self, "Advertencia", 
                                   "No hay datos para guardar. Inicie la adquisición primero.")
                 return
@@ -226,25 +332,51 @@ class PPGAnalyzerApp(QMainWindow):
             if not ok or not base_name:
                 return
             
-            # Obtener datos del procesador
-            time_data = list(self.ppg_processor.time_buffer)
-            raw_data = list(self.ppg_processor.raw_buffer)
-            
-            # Crear DataFrame
-            df = pd.DataFrame({
-                'tiempo_s': time_data,
-                'valor_raw': raw_data
-            })
+            fmt = ask_export_format(self)
+            if fmt is None:
+                return
             
-            # Guardar archivo
-            file_path = os.path.join(directory, f"{base_name}.csv")
-            df.to_csv(file_path, index=False)
+            base_path = os.path.join(directory, base_name)
+            file_path = export_path(base_path, fmt)
+            if recorded:
+                # La sesión completa ya está en disco (CSV o .ppgz): cerrar la
+                # grabación y moverla; en otro formato se convierte en segundo plano
+                packed = self.recorder.fmt == 'packed'
+                temporary = not packed and fmt != 'csv'
+                if packed:
+                    recording_path = base_path + PACKED_EXTENSION
+                elif temporary:
+                    # El CSV solo hace falta para convertirlo: archivo temporal
+                    # en lugar de dejar (o pisar) <base>.csv junto a la exportación
+                    handle, recording_path = tempfile.mkstemp(prefix=base_name + '_', suffix='.csv',
+                                                              dir=directory)
+                    os.close(handle)
+                else:
+                    recording_path = export_path(base_path, 'csv')
+                self.recorder.finalize(recording_path)
+                self.recorder = None
+                if self.acquiring:
+                    # Lo que siga llegando va a una nueva grabación
+                    self.start_recorder()
+                # El .ppgz queda como archivo; además se exporta en el formato pedido
+                task = ExportTask(existing=[recording_path] if packed else None)
+                if packed:
+                    self.acquisition_tab.log_message(f"Sesión grabada en {recording_path}")
+                if fmt == 'csv' and not packed:
+                    # Índice tiempo → byte: abrir luego una ventana no lee todo el CSV
+                    task.add_job(file_path, lambda: build_range_index(file_path))
+                else:
+                    task.add_job(file_path, lambda: self._convert_recording(
+                        recording_path, file_path, fmt, remove_source=temporary))
+            else:
+                # Sin grabación: guardar lo que retiene el buffer del procesador
+                task = ExportTask()
+                time_data = self.ppg_processor.time_buffer.last()
+                raw_data = self.ppg_processor.raw_buffer.last()
+                task.add_table(file_path, signal_columns(time_data, raw=raw_data), fmt)
             
-            # Mensaje de éxito
-            self.acquisition_tab.log_message(f"Datos guardados: {file_path}")
-            QMessageBox.information(self, "Guardado Exitoso", 
-                                  f"Datos guardados exitosamente en:\n{file_path}\n\n"
-                                  f"Total de puntos: {len(raw_data)}")
+            # Escritura en un hilo del pool con avance y cancelación
+            start_export(self, task, self.acquisition_tab.log_message)
             
         except Exception as e:
             error_msg = f"Error guardando datos: {e}"
@@ -252,6 +384,33 @@ class PPGAnalyzerApp(QMainWindow):
             QMessageBox.critical(self, "Error al Guardar", 
                                f"Error al guardar los datos: {e}")
             
+    @staticmethod
+    def _convert_recording(recording_path, file_path, fmt, remove_source=False):
+        """Convierte una grabación finalizada (CSV o .ppgz) a otro formato de exportación
+
+        Con ``remove_source`` la grabación se borra después de convertirla; si
+        la conversión falla se conserva para no perder la sesión.
+        """
+        time_data, data, _ = load_signal_file(recording_path, channels=['raw'])
+        export_table(file_path, signal_columns(time_data, raw=data['raw']), fmt)
+        if remove_source:
+            os.remove(recording_path)
+
+    def remember_line_format(self, serial_stats):
+        """Guarda en la caché del puerto el formato que detectó el lector
+
+        Así la próxima conexión al mismo puerto no vuelve a detectarlo.
+        """
+        detected = (serial_stats or {}).get('line_format') or self.line_parser.line_format
+        if detected and detected != self.line_format and self.serial_port is not None:
+            self.line_format = detected
+            SerialConfig.save_port_cache(self.serial_port.port, self.serial_port.baudrate, detected)
+
+    def open_recording(self, path):
+        """Abre una grabación del catálogo en la pestaña de análisis"""
+        self.tab_widget.setCurrentWidget(self.analysis_tab)
+        self.analysis_tab.load_file(path)
+
     def go_to_analysis(self):
         """Cambia a la pestaña de análisis y carga datos de adquisición"""
         try:
@@ -270,19 +429,13 @@ class PPGAnalyzerApp(QMainWindow):
     def process_serial_data(self, data_line):
         """Procesa una línea de datos recibida por serie"""
         try:
-            # Parsear datos usando el SerialReader
-            parsed_data = self.serial_reader.parse_data_line(data_line)
-            
-            if parsed_data is not None:
+            # Parser especializado según el formato detectado (ignora líneas inválidas)
+            for value in self.line_parser.parse([data_line.strip()]):
                 # Enviar datos al procesador PPG (solo canal raw)
-                self.ppg_processor.add_data_point(parsed_data)
-            else:
-                # Si no es el formato esperado, intentar como número simple
-                try:
-                    value = float(data_line.strip())
-                    self.ppg_processor.add_data_point(value)
-                except ValueError:
-                    pass  # Ignorar líneas que no son números
+                self.ppg_processor.add_data_point(value)
+                if self.recorder is not None:
+                    self.recorder.write(self.ppg_processor.time_buffer.last(1),
+                                        self.ppg_processor.raw_buffer.last(1))
                     
         except Exception as e:
             self.acquisition_tab.log_message(f"Error procesando datos: {e}")
@@ -292,6 +445,11 @@ class PPGAnalyzerApp(QMainWindow):
         status = "Conectado" if connected else "Desconectado"
         self.connection_status_label.setText(status)
         
+    def on_samples_lost(self, gap_time, missing):
+        """Informa un hueco de muestras perdidas en el log"""
+        self.acquisition_tab.log_message(
+            f"Hueco de {missing} muestras perdidas en t = {gap_time:.2f} s")
+        
     def on_serial_error(self, error_msg):
         """Maneja el error en comunicación serie"""
         self.acquisition_tab.log_message(f"Error serie: {error_msg}")
@@ -306,6 +464,36 @@ class PPGAnalyzerApp(QMainWindow):
             self.last_data_count = current_count
             self.data_rate_label.setText(f"{data_rate:.1f} pts/s")
             
+            # Estadísticas del lector serie
+            serial_stats = self.serial_reader.get_stats()
+            self.remember_line_format(serial_stats)
+            if serial_stats and 'bytes_per_s' in serial_stats and self.acquiring:
+                text = (
+                    f"{serial_stats['bytes_per_s'] / 1024:.1f} kB/s · "
+                    f"{serial_stats['lines_per_s']:.0f} líneas/s · "
+                    f"{serial_stats['wakeups_per_s']:.0f} lecturas/s · "
+                    f"fs {serial_stats['estimated_fs']:.1f} Hz · "
+                    f"{serial_stats['lost_samples']} perdidas"
+                )
+                if 'queue_capacity' in serial_stats:
+                    text += (f" · cola {serial_stats['queue_high_water']}/"
+                             f"{serial_stats['queue_capacity']} "
+                             f"({serial_stats['queue_dropped']} descartadas)")
+                if 'ring_capacity' in serial_stats:
+                    text += (f" · anillo {serial_stats['ring_pending']}/"
+                             f"{serial_stats['ring_capacity']} "
+                             f"({serial_stats['ring_overrun']} sobrescritas)")
+                if self.recorder is not None:
+                    text += f" · {self.recorder.samples} grabadas"
+                self.serial_stats_label.setText(text)
+            else:
+                self.serial_stats_label.setText("")
+            
+            # Informar una sola vez si la grabación en disco falló
+            if self.recorder is not None and self.recorder.error and not self.recorder_error_logged:
+                self.recorder_error_logged = True
+                self.acquisition_tab.log_message(f"Error de grabación: {self.recorder.error}")
+            
             # Actualizar frecuencia cardíaca
             stats = self.ppg_processor.get_current_stats()
             if stats['heart_rate'] > 0:
@@ -321,6 +509,10 @@ class PPGAnalyzerApp(QMainWindow):
         try:
             self.stop_acquisition()
             self.disconnect_serial()
+            if isinstance(self.serial_reader, ProcessSerialReader):
+                # Liberar la memoria compartida del proceso de adquisición
+                self.serial_reader.close()
+            self.devices_tab.close_all()
             event.accept()
         except Exception as e:
             print(f"Error cerrando aplicación: {e}")
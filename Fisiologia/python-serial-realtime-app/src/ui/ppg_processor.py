@@ -1,16 +1,21 @@
 """
 Módulo para el procesamiento de señales PPG en tiempo real
 """
-from collections import deque
 import numpy as np
 import time
 from PyQt5.QtCore import QObject, pyqtSignal, QTimer
 from scipy.signal import find_peaks, savgol_filter
-from config.settings import LOWCUT, HIGHCUT, FILTER_ORDER
+from config.settings import LOWCUT, HIGHCUT, FILTER_ORDER, PLOT_DECIMATION_FACTOR
+from core.processing.minmax_pyramid import MinMaxPyramid
+from core.processing.stream_processor import PPGStreamProcessor
 
 
 class PPGProcessor(QObject):
-    """Procesador de señales PPG con análisis en tiempo real"""
+    """Procesador de señales PPG con análisis en tiempo real
+
+    Adaptador Qt de ``PPGStreamProcessor``: agrega las señales y el QTimer
+    del análisis periódico; los buffers y el cálculo viven en el núcleo.
+    """
     
     # Señales para comunicación con la UI 
     
@@ -22,19 +27,23 @@ class PPGProcessor(QObject):
     segment_analyzed = pyqtSignal(dict)
     #: buffer de datos
     buffer_full = pyqtSignal()
+    #: hueco de muestras perdidas (tiempo relativo, muestras perdidas)
+    gap_detected = pyqtSignal(float, int)
     
     def __init__(self, sample_rate=100, buffer_size=7500):  # 60 segundos @ 100Hz
         super().__init__()
-        self.sample_rate = sample_rate
         self.buffer_size = buffer_size
         self.fs = sample_rate
         
-        # Buffers de datos (solo canal raw)
-        self.time_buffer = deque(maxlen=buffer_size)
-        self.raw_buffer = deque(maxlen=buffer_size)
+        # Núcleo sin Qt: buffers, reloj de muestras, huecos y FC/HRV
+        self.core = PPGStreamProcessor(sample_rate, buffer_size,
+                                       on_gap=self.gap_detected.emit)
+        self.time_buffer = self.core.time_buffer
+        self.raw_buffer = self.core.raw_buffer
+        # Sesión completa decimada para graficar (el buffer solo retiene buffer_size)
+        self.display_pyramid = MinMaxPyramid(PLOT_DECIMATION_FACTOR)
         
         # Variables de estado
-        self.start_time = None
         self.last_analysis_time = 0
         self.analysis_interval = 5.0  # Analizar cada 5 segundos
         
@@ -42,18 +51,33 @@ class PPGProcessor(QObject):
         self.analysis_timer = QTimer()
         self.analysis_timer.timeout.connect(self._periodic_analysis)
         
-        # Estadísticas en tiempo real
-        self.current_hr = 0
-        self.current_hrv = 0
+    @property
+    def sample_rate(self):
+        """Frecuencia de muestreo usada en el análisis de FC/HRV"""
+        return self.core.sample_rate
+        
+    @sample_rate.setter
+    def sample_rate(self, value):
+        self.core.sample_rate = value
+        
+    @property
+    def start_time(self):
+        """Tiempo del reloj de muestras de la primera muestra"""
+        return self.core.start_time
+        
+    @property
+    def current_hr(self):
+        return self.core.current_hr
+        
+    @property
+    def current_hrv(self):
+        return self.core.current_hrv
         
     def reset_data(self):
         """Resetea todos los buffers de datos"""
-        self.time_buffer.clear()
-        self.raw_buffer.clear()
-        self.start_time = None
+        self.core.reset()
+        self.display_pyramid.clear()
         self.last_analysis_time = 0
-        self.current_hr = 0
-        self.current_hrv = 0
         
     def start_processing(self):
         """Funcion del timer que inicia el procesamiento de datos"""
@@ -66,16 +90,8 @@ class PPGProcessor(QObject):
     def add_data_point(self, raw_value):
         """Agrega un nuevo punto de datos del canal raw"""
         try:
-            current_time = time.time()
-            
-            if self.start_time is None:
-                self.start_time = current_time
-                
-            relative_time = current_time - self.start_time
-            
-            # Agregar a buffers
-            self.time_buffer.append(relative_time)
-            self.raw_buffer.append(raw_value)
+            self.core.add_value(raw_value, time.monotonic())
+            self.display_pyramid.extend(self.time_buffer.last(1), self.raw_buffer.last(1))
             
             self.new_data_processed.emit()
             
@@ -86,24 +102,43 @@ class PPGProcessor(QObject):
         except Exception as e:
             print(f"Error procesando datos: {e}")
             
+    def append_many(self, timestamps, values):
+        """Agrega un lote de muestras del canal raw con una sola notificación a la UI
+
+        Args:
+            timestamps (np.ndarray): tiempos del reloj de muestras (s) de cada muestra
+            values (np.ndarray): valores raw
+        """
+        try:
+            count = self.core.append_many(timestamps, values)
+            if count == 0:
+                return
+            self.display_pyramid.extend(self.time_buffer.last(count), self.raw_buffer.last(count))
+                
+            self.new_data_processed.emit()
+            
+            if len(self.time_buffer) >= self.buffer_size:
+                self.buffer_full.emit()
+                
+        except Exception as e:
+            print(f"Error procesando lote de datos: {e}")
+            
+    def mark_gap(self, gap_time, missing):
+        """Registra un hueco de muestras perdidas (emite gap_detected)
+
+        Args:
+            gap_time (float): tiempo (reloj de muestras) de la primera muestra tras el hueco
+            missing (int): cantidad de muestras perdidas
+        """
+        self.core.mark_gap(gap_time, missing)
+            
     def _periodic_analysis(self):
         """Realiza el análisis periódico de la señal"""
-        if len(self.raw_buffer) < self.sample_rate * 2:  # Necesitamos al menos 2 segundos
-            return
-            
         try:
-            # Obtener los últimos 5 segundos de datos
-            segment_size = min(self.sample_rate * 5, len(self.raw_buffer))
-            signal_segment = list(self.raw_buffer)[-segment_size:]
-            time_segment = list(self.time_buffer)[-segment_size:]
-            
-            if len(signal_segment) > 0:
-                # Realizar análisis
-                results = self._analyze_segment(signal_segment, time_segment)
-                if results:
-                    self.current_hr = results.get('heart_rate', 0)
-                    self.current_hrv = results.get('hrv', 0)
-                    self.analysis_complete.emit(results)
+            # Analizar los últimos 5 segundos de datos
+            results = self.core.analyze_latest(5)
+            if results:
+                self.analysis_complete.emit(results)
                 
         except Exception as e:
             print(f"Error en análisis periódico: {e}")
@@ -113,61 +148,7 @@ class PPGProcessor(QObject):
         Se obtiene parámetros como fc, hrv y calidad de señal
         """
         try:
-            if len(signal) < 100:
-                return None
-                
-            # Convertir a arrays numpy
-            signal = np.array(signal)
-            time_data = np.array(time_data)
-            
-            # Normalizar señal
-            signal_norm = (signal - np.mean(signal)) / np.std(signal)
-            
-            # Detectar picos
-            # Distancia mínima entre picos: ~0.4s (150 BPM maximo)
-            min_distance = int(0.4 * self.sample_rate)
-            peaks, properties = find_peaks(signal_norm, 
-                                         height=0.3,  # Altura minima
-                                         distance=min_distance)
-            
-            results = {
-                'num_peaks': len(peaks),
-                'heart_rate': 0,
-                'hrv': 0,
-                'signal_quality': 'good'
-            }
-            
-            if len(peaks) >= 2:
-                # Calcular intervalos RR (en segundos)
-                rr_intervals = np.diff(time_data[peaks])
-                
-                # Calcular frecuencia cardíaca
-                mean_rr = np.mean(rr_intervals)
-                heart_rate = 60.0 / mean_rr if mean_rr > 0 else 0
-                
-                # Calcular HRV (RMSSD)
-                if len(rr_intervals) > 1:
-                    rr_diff = np.diff(rr_intervals)
-                    hrv = np.sqrt(np.mean(rr_diff**2)) * 1000  # en ms
-                else:
-                    hrv = 0
-                
-                results.update({
-                    'heart_rate': heart_rate,
-                    'hrv': hrv,
-                    'rr_intervals': rr_intervals.tolist(),
-                    'peak_times': time_data[peaks].tolist(),
-                    'mean_rr': mean_rr
-                })
-                
-                # Evaluar calidad de la señal
-                if heart_rate < 40 or heart_rate > 200:
-                    results['signal_quality'] = 'poor'
-                elif len(peaks) < 3:
-                    results['signal_quality'] = 'fair'
-                    
-            return results
-            
+            return self.core.analyze_segment(signal, time_data)
         except Exception as e:
             print(f"Error analizando segmento: {e}")
             return None
@@ -264,23 +245,10 @@ class PPGProcessor(QObject):
     def analyze_custom_segment(self, start_time, end_time):
         """Analiza un segmento específico de la señal"""
         try:
-            # Encontrar índices para el segmento
-            time_array = np.array(self.time_buffer)
-            start_idx = np.searchsorted(time_array, start_time)
-            end_idx = np.searchsorted(time_array, end_time)
-            
-            if start_idx >= end_idx or end_idx > len(self.raw_buffer):
-                return None
-                
-            # Extraer segmento
-            signal_segment = list(self.raw_buffer)[start_idx:end_idx]
-            time_segment = list(self.time_buffer)[start_idx:end_idx]
-            
-            if len(signal_segment) > 100:  # Mínimo de datos requerido
-                results = self._analyze_segment(signal_segment, time_segment)
-                if results:
-                    self.segment_analyzed.emit(results)
-                return results
+            results = self.core.analyze_range(start_time, end_time)
+            if results:
+                self.segment_analyzed.emit(results)
+            return results
                 
         except Exception as e:
             print(f"Error analizando segmento personalizado: {e}")
@@ -290,25 +258,13 @@ class PPGProcessor(QObject):
         """Obtiene los datos para mostrar en un gráfico
 
         Returns:
-            tuple: (time_data, raw_data) - Listas de tiempos y valores raw
+            tuple: (time_data, raw_data) - Vistas de solo lectura (sin copia)
+            de los últimos max_points tiempos y valores raw. Son válidas
+            hasta el próximo dato agregado.
         """
-        if not self.time_buffer:
-            return [], []
-            
         # Limitar el número de puntos para mejor rendimiento
-        if len(self.time_buffer) <= max_points:
-            return (list(self.time_buffer), 
-                   list(self.raw_buffer))
-        else:
-            # Tomar los últimos max_points puntos
-            return (list(self.time_buffer)[-max_points:],
-                   list(self.raw_buffer)[-max_points:])
+        return self.core.get_display_data(max_points)
                    
     def get_current_stats(self):
         """Obtiene las estadísticas actuales"""
-        return {
-            'heart_rate': self.current_hr,
-            'hrv': self.current_hrv,
-            'data_points': len(self.time_buffer),
-            'duration': self.time_buffer[-1] if self.time_buffer else 0
-        }
+        return self.core.get_current_stats()
@@ -0,0 +1,106 @@
+"""
+Módulo para la lectura del puerto serie en un proceso hijo
+"""
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from config.settings import SAMPLING_FREQUENCY, SERIAL_BATCH_INTERVAL, SHARED_RING_CAPACITY
+from core.acquisition.process_acquisition import ProcessAcquisition
+
+class ProcessSerialReader(QObject):
+    """Lector del puerto serie en un proceso hijo con memoria compartida
+
+    Adaptador Qt de ``ProcessAcquisition`` con las mismas señales que
+    ``SerialReader`` (siempre en modo por lotes): un temporizador lee las
+    muestras nuevas del anillo compartido en el hilo de la UI.
+    """
+
+    #: Compatibilidad con ``SerialReader``: este lector solo entrega lotes
+    data_received = pyqtSignal(str)
+    #: Señal emitida con un lote de muestras.
+    #: Parámetros: tiempos del reloj de muestras (np.ndarray), valores raw (np.ndarray)
+    batch_received = pyqtSignal(object, object)
+    #: Señal emitida al detectar muestras perdidas.
+    #: Parámetros: tiempo de la primera muestra tras el hueco (float), muestras perdidas (int)
+    gap_detected = pyqtSignal(float, int)
+    #: Señal emitida cuando cambia el estado de conexión.
+    #:Parámetro: estado (bool)
+    connection_status_changed = pyqtSignal(bool)
+    #: Señal emitida cuando ocurre un error.
+    #: Parámetro: mensaje de error (str)
+    error_occurred = pyqtSignal(str)
+
+    def __init__(self, batch_interval=SERIAL_BATCH_INTERVAL, protocol='text',
+                 sample_rate=SAMPLING_FREQUENCY, capacity=SHARED_RING_CAPACITY, output=None):
+        """
+        :param batch_interval: segundos entre lecturas del anillo compartido.
+        :param protocol: 'text' o 'binary'.
+        :param sample_rate: frecuencia nominal (Hz) del reloj de muestras.
+        :param capacity: muestras del anillo; atraso máximo de la UI sin pérdidas.
+        :param output: CSV que graba el proceso hijo durante la adquisición.
+        """
+        super().__init__()
+        self.acquisition = ProcessAcquisition(protocol, sample_rate, capacity, output,
+                                              on_batch=self.batch_received.emit,
+                                              on_gap=self.gap_detected.emit,
+                                              on_error=self.error_occurred.emit,
+                                              on_status=self.connection_status_changed.emit)
+        self.serial_port = None
+
+        self.poll_timer = QTimer()
+        self.poll_timer.setInterval(int(batch_interval * 1000))
+        self.poll_timer.timeout.connect(self._poll)
+
+    def start_reading(self, serial_port, line_format=None):
+        """Inicia la lectura en el proceso hijo
+
+        El puerto sigue abierto aquí mientras el hijo arranca; se cierra
+        cuando el hijo avisa que está listo para abrirlo.
+
+        :param line_format: formato de línea conocido; el hijo no lo detecta.
+        """
+        if self.is_reading():
+            return
+        self.serial_port = serial_port
+        self.acquisition.start(serial_port.port, serial_port.baudrate,
+                               release_port=self._release_port, line_format=line_format)
+        self.poll_timer.start()
+
+    def stop_reading(self):
+        """Detiene el proceso hijo y vuelve a abrir el puerto en este proceso"""
+        self.poll_timer.stop()
+        self.acquisition.stop()
+        if self.serial_port is not None and not self.serial_port.is_open:
+            try:
+                self.serial_port.open()
+            except Exception as e:
+                self.error_occurred.emit(str(e))
+
+    def reset_clock(self):
+        """Vuelve los tiempos a 0 para una sesión nueva (no al reanudar)"""
+        self.acquisition.reset_clock()
+
+    def is_reading(self):
+        """Verifica si el proceso hijo está leyendo"""
+        return self.acquisition.is_reading()
+
+    def get_stats(self):
+        """Obtiene las últimas estadísticas del lector del proceso hijo y el
+        estado del anillo compartido (pendientes y sobrescritas)"""
+        return self.acquisition.get_stats()
+
+    def close(self):
+        """Detiene el proceso hijo y libera la memoria compartida"""
+        self.poll_timer.stop()
+        self.acquisition.close()
+
+    def _release_port(self):
+        """Cierra el puerto en este proceso para que lo abra el hijo"""
+        if self.serial_port is not None and self.serial_port.is_open:
+            self.serial_port.close()
+
+    def _poll(self):
+        """Entrega las muestras y eventos nuevos del proceso hijo"""
+        self.acquisition.poll()
+        if not self.acquisition.is_reading():
+            # El hijo terminó (error o desconexión): entregar lo último, parar
+            # y recuperar el puerto en este proceso
+            self.stop_reading()
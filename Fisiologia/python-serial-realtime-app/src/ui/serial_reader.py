@@ -1,74 +1,118 @@
 """
 Módulo para la lectura de datos del puerto serie en un hilo separado
 """
-import threading
-import time
-import re
 from PyQt5.QtCore import QObject, pyqtSignal
+from config.constants import RAW_DATA_PATTERN
+from config.settings import (SAMPLING_FREQUENCY, SERIAL_QUEUE_CAPACITY, SERIAL_QUEUE_POLICY,
+                             SERIAL_QUEUE_BLOCK_TIMEOUT)
+from core.acquisition.serial_session import SerialSession
+from core.processing.sample_queue import SampleQueue
 
 class SerialReader(QObject):
-    """Clase para leer datos del puerto serie en un hilo separado"""
+    """Clase para leer datos del puerto serie en un hilo separado
+
+    Adaptador Qt de ``SerialSession``: reemite sus callbacks como señales.
+    """
     
     # Señales para comunicación con la UI
     #: Señal emitida cuando se reciben datos.
     #: Parámetro: línea de datos (str)
     data_received = pyqtSignal(str)
+    #: Señal emitida con un lote de muestras parseadas (modo por lotes).
+    #: Parámetros: tiempos del reloj de muestras (np.ndarray), valores raw (np.ndarray)
+    batch_received = pyqtSignal(object, object)
+    #: Señal emitida al detectar muestras perdidas (modo por lotes).
+    #: Parámetros: tiempo de la primera muestra tras el hueco (float), muestras perdidas (int)
+    gap_detected = pyqtSignal(float, int)
     #: Señal emitida cuando cambia el estado de conexión. 
     #:Parámetro: estado (bool)
     connection_status_changed = pyqtSignal(bool)
     #: Señal emitida cuando ocurre un error. 
     #: Parámetro: mensaje de error (str)
     error_occurred = pyqtSignal(str)
+    #: Aviso interno del hilo lector: hay muestras en la cola
+    _samples_ready = pyqtSignal()
     
-    def __init__(self):
+    def __init__(self, batch_interval=None, protocol='text', sample_rate=SAMPLING_FREQUENCY,
+                 queue_capacity=SERIAL_QUEUE_CAPACITY, queue_policy=SERIAL_QUEUE_POLICY):
+        """
+        :param batch_interval: si se indica (segundos), el hilo lector parsea
+            las líneas y emite ``batch_received`` con un lote cada intervalo
+            en lugar de ``data_received`` por cada línea.
+        :param protocol: 'text' para líneas ASCII o 'binary' para tramas
+            binarias. El modo binario siempre entrega lotes.
+        :param sample_rate: frecuencia nominal (Hz) con la que el reloj de
+            muestras reconstruye los tiempos de cada lote.
+        :param queue_capacity: muestras que pueden esperar a la UI; si se
+            bloquea (p. ej. un diálogo de archivo) se aplica ``queue_policy``.
+        :param queue_policy: 'block', 'drop_oldest' o 'drop_newest'. Las
+            muestras descartadas se emiten como ``gap_detected``.
+        """
         super().__init__()
-        self.serial_port = None
-        self.reading = False
-        self.reading_thread = None
+        # Los lotes esperan en una cola acotada en lugar de acumularse como
+        # eventos de Qt; la UI recibe un solo aviso pendiente a la vez
+        self.queue = SampleQueue(queue_capacity, policy=queue_policy,
+                                 block_timeout=SERIAL_QUEUE_BLOCK_TIMEOUT)
+        self._drain_pending = False
+        self._samples_ready.connect(self._drain_queue)
+        
+        # Núcleo sin Qt; las señales emitidas desde el hilo lector llegan en cola a la UI
+        self.session = SerialSession(batch_interval, protocol, sample_rate,
+                                     on_batch=self._enqueue_batch,
+                                     on_line=self.data_received.emit,
+                                     on_gap=self.gap_detected.emit,
+                                     on_error=self.error_occurred.emit,
+                                     on_status=self.connection_status_changed.emit)
         
         # Regex para extraer los valores del formato esperado
-        self.pattern = re.compile(
-            r"Raw:(-?\d+(?:\.\d+)?)", 
-            re.IGNORECASE
-        )
+        self.pattern = RAW_DATA_PATTERN
+        
+    def start_reading(self, serial_port, line_format=None):
+        """Inicia la lectura del puerto serie
+
+        :param line_format: formato de línea conocido (p. ej. el de la caché
+            del puerto); evita detectarlo con las primeras líneas.
+        """
+        self.queue.clear()
+        self.session.start(serial_port, line_format)
         
-    def start_reading(self, serial_port):
-        """Inicia la lectura del puerto serie"""
-        if self.reading:
-            return
+    def _enqueue_batch(self, timestamps, values):
+        """Encola un lote (hilo lector) y avisa a la UI si no hay aviso pendiente"""
+        self.queue.put_many(timestamps, values)
+        if not self._drain_pending:
+            self._drain_pending = True
+            self._samples_ready.emit()
             
-        self.serial_port = serial_port
-        self.reading = True
-        self.reading_thread = threading.Thread(target=self._read_loop, daemon=True)
-        self.reading_thread.start()
-        self.connection_status_changed.emit(True)
+    def _drain_queue(self):
+        """Vacía la cola en el hilo de la UI y emite un único lote"""
+        self._drain_pending = False
+        # Los descartes por desborde son huecos igual que los del puerto
+        for gap_time, missing in self.queue.pop_drops():
+            self.gap_detected.emit(gap_time, missing)
+        timestamps, values = self.queue.get_all()
+        if len(timestamps):
+            self.batch_received.emit(timestamps, values)
         
     def stop_reading(self):
         """Detiene la lectura del puerto serie"""
-        self.reading = False
-        if self.reading_thread and self.reading_thread.is_alive():
-            self.reading_thread.join(timeout=1.0)
-        self.connection_status_changed.emit(False)
-        
-    def _read_loop(self):
-        """Bucle principal de lectura de datos"""
-        while self.reading and self.serial_port and self.serial_port.is_open:
-            try:
-                if self.serial_port.in_waiting > 0:
-                    line = self.serial_port.readline().decode('utf-8').strip()
-                    if line:
-                        # Emitir la línea completa para procesamiento posterior
-                        self.data_received.emit(line)
-                else:
-                    time.sleep(0.001)  # Pequeña pausa para no saturar CPU
-            except Exception as e:
-                self.error_occurred.emit(str(e))
-                self.reading = False
-                break
+        self.session.stop()
+
+    def reset_clock(self):
+        """Reinicia el reloj de muestras para una sesión nueva (no al reanudar)"""
+        self.session.reset_clock()
                 
     def is_reading(self):
         """Verifica si está leyendo datos"""
-        return self.reading
+        return self.session.is_reading()
+        
+    def get_stats(self):
+        """Obtiene bytes/s, líneas/s y despertares/s desde la última consulta,
+        junto con la fs estimada, las muestras perdidas del reloj de muestras
+        y los contadores de la cola hacia la UI"""
+        stats = self.session.get_stats()
+        if stats is not None:
+            stats.update(self.queue.get_stats())
+        return stats
         
     def parse_data_line(self, line):
         """Parsea la línea de datos y extraer el valor Raw"""
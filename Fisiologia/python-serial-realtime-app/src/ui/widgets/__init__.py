@@ -3,6 +3,7 @@ Submódulo widgets - Componentes reutilizables de la interfaz.
 
 Este módulo contiene widgets personalizados para:
 - Controles de adquisición (acquisition_controls.py)
+- Curvas decimadas por pirámide mín/máx (decimated_curve.py)
 - Gráficos PPG (ppg_plot_widget.py)
 - Panel de estado (status_panel.py)
 """
@@ -13,8 +14,14 @@ try:
 except ImportError as e:
     print(f"Warning: No se pudo importar AcquisitionControls: {e}")
 
+try:
+    from .decimated_curve import DecimatedCurve
+except ImportError as e:
+    print(f"Warning: No se pudo importar DecimatedCurve: {e}")
+
 
 
 __all__ = [
     'AcquisitionControls',
+    'DecimatedCurve',
 ]
\ No newline at end of file
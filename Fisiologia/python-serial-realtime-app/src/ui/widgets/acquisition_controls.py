@@ -8,7 +8,9 @@ from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
                             QComboBox, QLabel, QLineEdit, QSpinBox, QGroupBox,
                             QMessageBox)
 from PyQt5.QtCore import pyqtSignal
+import threading
 import serial.tools.list_ports
+from config.serial_config import SerialConfig
 
 class AcquisitionControls(QWidget):
     """Widget de control para la adquisición de datos del puerto serie"""
@@ -28,11 +30,14 @@ class AcquisitionControls(QWidget):
     save_data = pyqtSignal()
     #: Señal emitida cuando se solicita analizar datos.
     analyze_data = pyqtSignal()  
+    #: Aviso interno del hilo de detección: puerto encontrado (str) o None
+    _port_detected = pyqtSignal(object)
     
     def __init__(self):
         super().__init__()
         self.connected = False
         self.acquiring = False
+        self._port_detected.connect(self._on_port_detected)
         self.setup_ui()
         
     def setup_ui(self):
@@ -55,6 +60,12 @@ class AcquisitionControls(QWidget):
         refresh_btn.clicked.connect(self.refresh_ports)
         refresh_btn.setMaximumWidth(80)
         port_layout.addWidget(refresh_btn)
+        
+        self.detect_btn = QPushButton("Detectar")
+        self.detect_btn.setToolTip("Sondea los puertos en paralelo y elige el que envía datos")
+        self.detect_btn.clicked.connect(self.detect_port)
+        self.detect_btn.setMaximumWidth(80)
+        port_layout.addWidget(self.detect_btn)
         connection_layout.addLayout(port_layout)
         
         # Baudrate
@@ -159,6 +170,35 @@ class AcquisitionControls(QWidget):
                 display_text += f" - {port.description}"
             self.port_combo.addItem(display_text)
             
+        # Preseleccionar el último puerto que funcionó (sin sondear)
+        cached = SerialConfig.load_port_cache()
+        if cached:
+            devices = [port.device for port in ports]
+            if cached['port'] in devices:
+                self.port_combo.setCurrentIndex(devices.index(cached['port']))
+            
+    def detect_port(self):
+        """Busca el puerto del dispositivo en un hilo (sin bloquear la interfaz)"""
+        self.detect_btn.setEnabled(False)
+        self.detect_btn.setText("Buscando...")
+        try:
+            baud = int(self.baudrate_combo.currentText())
+        except ValueError:
+            baud = 115200
+        threading.Thread(
+            target=lambda: self._port_detected.emit(SerialConfig.get_default_port(baud)),
+            daemon=True).start()
+        
+    def _on_port_detected(self, port):
+        """Selecciona el puerto encontrado por detect_port"""
+        self.detect_btn.setEnabled(True)
+        self.detect_btn.setText("Detectar")
+        if port is None:
+            QMessageBox.information(self, "Detección", "No se encontró ningún dispositivo")
+            return
+        # refresh_ports preselecciona el puerto guardado en caché por la detección
+        self.refresh_ports()
+        
     def toggle_connection(self):
         """Alterna el estado de conexión"""
         if not self.connected:
@@ -208,6 +248,7 @@ class AcquisitionControls(QWidget):
             self.start_btn.setEnabled(True)
             self.port_combo.setEnabled(False)
             self.baudrate_combo.setEnabled(False)
+            self.detect_btn.setEnabled(False)
         else:
             self.connect_btn.setText("Conectar")
             self.connect_btn.setStyleSheet("""
@@ -226,6 +267,7 @@ class AcquisitionControls(QWidget):
             self.start_btn.setEnabled(False)
             self.port_combo.setEnabled(True)
             self.baudrate_combo.setEnabled(True)
+            self.detect_btn.setEnabled(True)
             self.set_acquisition_state(False)
             
     def set_acquisition_state(self, acquiring):
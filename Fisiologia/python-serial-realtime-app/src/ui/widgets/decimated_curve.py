@@ -0,0 +1,75 @@
+"""
+Curva de PyQtGraph que dibuja una pirámide mín/máx según el zoom
+"""
+import numpy as np
+from PyQt5.QtCore import QObject
+from config.settings import PLOT_DECIMATION_FACTOR
+from core.processing.minmax_pyramid import MinMaxPyramid
+
+
+class DecimatedCurve(QObject):
+    """Alimenta un ``PlotDataItem`` con el nivel de ``MinMaxPyramid`` adecuado
+
+    Cada vez que cambia el rango X o el tamaño del gráfico se eligen los
+    puntos del rango visible con un presupuesto de dos puntos por píxel de
+    ancho, de modo que registros de horas se desplazan con fluidez y los
+    picos siguen visibles.
+    """
+
+    def __init__(self, plot_widget, curve, pyramid=None):
+        """
+        :param plot_widget: ``pg.PlotWidget`` que contiene la curva.
+        :param curve: ``PlotDataItem`` a actualizar.
+        :param pyramid: pirámide compartida (p. ej. la del procesador en
+            tiempo real); si se omite se crea una propia para ``set_data``.
+        """
+        super().__init__()
+        self.plot_widget = plot_widget
+        self.curve = curve
+        self.pyramid = pyramid if pyramid is not None else MinMaxPyramid(PLOT_DECIMATION_FACTOR)
+        self._refreshing = False
+
+        view_box = plot_widget.getViewBox()
+        view_box.sigXRangeChanged.connect(self.refresh)
+        view_box.sigResized.connect(self.refresh)
+
+    def set_data(self, time_data, values):
+        """Reemplaza la señal y la dibuja completa al nivel que corresponda"""
+        self.pyramid.set_data(time_data, values)
+        # Mostrar la señal completa: el autoajuste parte de su extensión total
+        self.refresh(full=True)
+
+    def clear(self):
+        """Elimina la señal de la curva"""
+        self.pyramid.clear()
+        self.curve.setData([], [])
+
+    def refresh(self, *args, full=False):
+        """Vuelve a elegir los puntos del rango visible"""
+        if self._refreshing:
+            return
+        self._refreshing = True
+        try:
+            if len(self.pyramid) == 0:
+                self.curve.setData([], [])
+                return
+            view_box = self.plot_widget.getViewBox()
+            max_points = 2 * max(int(view_box.width()), 100)
+            if full:
+                time_data, values, _ = self.pyramid.select(max_points=max_points)
+            else:
+                (x_min, x_max), _ = view_box.viewRange()
+                time_data, values, _ = self.pyramid.select(x_min, x_max, max_points)
+                # Conservar la primera y la última muestra fuera de la vista para
+                # que el autoajuste siga abarcando el registro completo
+                base = self.pyramid.levels[0]
+                first_t, last_t = base['time'][0], base['time'][-1]
+                if not len(time_data) or time_data[0] > first_t:
+                    time_data = np.concatenate(([first_t], time_data))
+                    values = np.concatenate(([base['value'][0]], values))
+                if time_data[-1] < last_t:
+                    time_data = np.concatenate((time_data, [last_t]))
+                    values = np.concatenate((values, [base['value'][-1]]))
+            self.curve.setData(time_data, values)
+        finally:
+            self._refreshing = False
@@ -0,0 +1,7 @@
+"""
+Configuración común de las pruebas: agrega ``src`` al path de importación.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
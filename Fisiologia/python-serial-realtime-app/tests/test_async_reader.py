@@ -0,0 +1,33 @@
+"""
+Descarte de lotes del lector asyncio con el consumidor atrasado.
+"""
+import numpy as np
+import serial
+from core.acquisition.async_reader import AsyncSerialReader
+
+
+def batch(start, n, gaps=()):
+    t = np.arange(start, start + n) / 100
+    return t, np.arange(start, start + n, dtype=np.float64), list(gaps)
+
+
+def test_dropped_batch_becomes_gap_of_next_batch():
+    reader = AsyncSerialReader(serial.serial_for_url('loop://', timeout=0), max_batches=2)
+    reader._publish(batch(0, 10, [(0.0, 3)]))
+    reader._publish(batch(10, 10))
+    reader._publish(batch(20, 10))
+
+    assert reader.dropped_batches == 1
+    assert reader.dropped_samples == 10
+    kept = [reader.batches.get_nowait() for _ in range(reader.batches.qsize())]
+    assert [b[0][0] for b in kept] == [0.1, 0.2]
+    # Los huecos del lote descartado y sus propias muestras viajan en el publicado
+    assert kept[-1][2] == [(0.0, 3), (0.09, 10)]
+
+
+def test_end_of_reading_is_never_dropped():
+    reader = AsyncSerialReader(serial.serial_for_url('loop://', timeout=0), max_batches=1)
+    reader._publish(batch(0, 10))
+    reader._publish(None)
+    assert reader.dropped_batches == 0
+    assert reader.batches.qsize() == 2
@@ -0,0 +1,53 @@
+"""
+Pruebas del protocolo binario por tramas.
+"""
+import numpy as np
+from core.processing.binary_protocol import BinaryFrameDecoder, encode_frames
+
+
+def frames(n, start_seq=0, channel_dtype='int16'):
+    values = np.arange(n * 3).reshape(n, 3)
+    return values, encode_frames(values, start_seq, channel_dtype)
+
+
+def test_round_trip_int16_and_float32():
+    for channel_dtype in ('int16', 'float32'):
+        values, data = frames(5, channel_dtype=channel_dtype)
+        seq, decoded = BinaryFrameDecoder(3, channel_dtype).feed(data)
+        np.testing.assert_array_equal(seq, np.arange(5))
+        np.testing.assert_array_equal(decoded, values)
+
+
+def test_frames_split_across_chunks():
+    values, data = frames(4)
+    decoder = BinaryFrameDecoder(3)
+    first_seq, first = decoder.feed(data[:7])
+    rest_seq, rest = decoder.feed(data[7:])
+    assert len(first_seq) + len(rest_seq) == 4
+    np.testing.assert_array_equal(np.concatenate([first, rest]), values)
+
+
+def test_resync_after_corrupted_frame():
+    values, data = frames(6)
+    size = BinaryFrameDecoder(3).frame_size
+    corrupted = bytearray(data)
+    corrupted[2 * size + 5] ^= 0xFF        # canal de la trama 2: CRC inválido
+    garbage = b'\x01\x02\x03'                # basura entre tramas
+    stream = bytes(corrupted[:4 * size]) + garbage + bytes(corrupted[4 * size:])
+
+    decoder = BinaryFrameDecoder(3)
+    seq, decoded = decoder.feed(stream)
+    np.testing.assert_array_equal(seq, [0, 1, 3, 4, 5])
+    np.testing.assert_array_equal(decoded, values[[0, 1, 3, 4, 5]])
+    stats = decoder.get_stats()
+    assert stats['crc_errors'] == 1
+    assert stats['lost_frames'] == 1
+    assert stats['bytes_discarded'] == size + len(garbage)
+
+
+def test_sequence_wraps_without_counting_losses():
+    _, data = frames(4, start_seq=0xFFFE)
+    decoder = BinaryFrameDecoder(3)
+    seq, _ = decoder.feed(data)
+    np.testing.assert_array_equal(seq, [0xFFFE, 0xFFFF, 0, 1])
+    assert decoder.lost_frames == 0
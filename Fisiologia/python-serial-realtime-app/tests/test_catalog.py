@@ -0,0 +1,37 @@
+"""
+Pruebas del resumen de grabaciones del catálogo.
+"""
+import numpy as np
+import pandas as pd
+from data.catalog import summarize_recording
+
+
+def write_recording(path, signal, fs=100):
+    t = np.arange(len(signal)) / fs
+    pd.DataFrame({'tiempo_s': t, 'valor_raw': signal}).to_csv(path, index=False)
+
+
+def test_clean_pulse_has_mean_hr(tmp_path):
+    path = str(tmp_path / 'limpia.csv')
+    t = np.arange(3000) / 100
+    write_recording(path, 2000 + 100 * np.sin(2 * np.pi * 1.2 * t))
+    summary = summarize_recording(path)
+    assert abs(summary['mean_hr'] - 72) < 3
+    assert summary['quality'] > 0.9
+
+
+def test_noise_has_no_mean_hr(tmp_path):
+    path = str(tmp_path / 'ruido.csv')
+    rng = np.random.default_rng(0)
+    write_recording(path, 2000 + 100 * rng.standard_normal(3000))
+    summary = summarize_recording(path)
+    assert summary['mean_hr'] is None
+    assert summary['quality'] is not None
+
+
+def test_implausible_rate_has_no_mean_hr(tmp_path):
+    path = str(tmp_path / 'lenta.csv')
+    t = np.arange(6000) / 100
+    # 0.5 Hz = 30 BPM: fuera del rango fisiológico
+    write_recording(path, 2000 + 100 * np.sin(2 * np.pi * 0.5 * t))
+    assert summarize_recording(path)['mean_hr'] is None
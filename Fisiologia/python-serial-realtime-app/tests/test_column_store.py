@@ -0,0 +1,47 @@
+"""
+Pruebas del almacén columnar creciente.
+"""
+import numpy as np
+import pytest
+from core.processing.column_store import ColumnStore
+
+
+def test_growth_across_chunk_boundaries_keeps_data():
+    store = ColumnStore(['t', 'raw'], chunk_size=4)
+    t = np.arange(23, dtype=np.float64)
+    # Lotes de largos distintos que cruzan varios límites de bloque
+    for start, stop in [(0, 3), (3, 4), (4, 9), (9, 9), (9, 23)]:
+        store.append(t[start:stop], 10 * t[start:stop])
+    assert len(store) == 23
+    assert store._capacity % 4 == 0 and store._capacity >= 23
+    np.testing.assert_array_equal(store['t'], t)
+    np.testing.assert_array_equal(store['raw'], 10 * t)
+    assert store.last_time() == 22
+
+
+def test_time_range_is_half_open_view():
+    store = ColumnStore(['t', 'raw'], chunk_size=4)
+    store.append(np.arange(10) / 10, np.arange(10))
+    t, raw = store.time_range(0.25, 0.6)
+    np.testing.assert_array_equal(raw, [3, 4, 5])
+    assert np.shares_memory(raw, store['raw'])
+    (raw_only,) = store.time_range(0.8, columns=['raw'])
+    np.testing.assert_array_equal(raw_only, [8, 9])
+    assert len(store.time_range(5.0)[0]) == 0
+
+
+def test_append_rejects_mismatched_columns():
+    store = ColumnStore(['t', 'raw'])
+    with pytest.raises(ValueError):
+        store.append([1.0, 2.0], [1.0])
+    with pytest.raises(ValueError):
+        store.append([1.0])
+
+
+def test_clear_and_load():
+    store = ColumnStore(['t', 'raw'], chunk_size=2)
+    store.append(np.arange(5), np.arange(5))
+    store.load([7.0], [8.0])
+    assert len(store) == 1 and store.last_time() == 7.0
+    store.clear()
+    assert len(store) == 0 and store.last_time() is None
@@ -0,0 +1,59 @@
+"""
+Pruebas del códec delta + zig-zag + empaquetado de bits.
+"""
+import io
+import numpy as np
+import pytest
+from core.processing.delta_codec import (decode_block, decode_deltas, encode_block, encode_deltas,
+                                         read_block_header, zigzag_decode, zigzag_encode)
+
+
+def round_trip_block(t, raw):
+    handle = io.BytesIO(encode_block(t, raw))
+    length, samples, _, _ = read_block_header(handle)
+    return decode_block(handle.read(length), samples)
+
+
+@pytest.mark.parametrize('order', [1, 2])
+@pytest.mark.parametrize('values', [[], [7], [7, -3], [5, 5, 5, 5], [1, 2, 4, 7, 11, 16]])
+def test_round_trip_short_streams(values, order):
+    decoded, end = decode_deltas(encode_deltas(values, order))
+    assert decoded.tolist() == values
+    assert end == len(encode_deltas(values, order))
+
+
+@pytest.mark.parametrize('order', [1, 2])
+def test_round_trip_large_deltas(order):
+    values = np.array([0, 2 ** 62, -2 ** 62, 2 ** 40 + 1, -1, 2 ** 31], dtype=np.int64)
+    decoded, _ = decode_deltas(encode_deltas(values, order))
+    np.testing.assert_array_equal(decoded, values)
+
+
+def test_streams_are_concatenable():
+    data = encode_deltas([1, 2, 3]) + encode_deltas([10, 8], order=2)
+    first, offset = decode_deltas(data)
+    second, end = decode_deltas(data, offset)
+    assert first.tolist() == [1, 2, 3]
+    assert second.tolist() == [10, 8]
+    assert end == len(data)
+
+
+def test_zigzag_round_trip():
+    values = np.array([0, -1, 1, -2, 2 ** 62, -2 ** 63], dtype=np.int64)
+    assert zigzag_encode(values)[:4].tolist() == [0, 1, 2, 3]
+    np.testing.assert_array_equal(zigzag_decode(zigzag_encode(values)), values)
+
+
+@pytest.mark.parametrize('n', [0, 1, 2, 1000])
+def test_block_round_trip(n):
+    t = np.arange(n) / 100
+    raw = (2000 + 100 * np.sin(np.arange(n) / 10)).round()
+    decoded_t, decoded_raw = round_trip_block(t, raw)
+    np.testing.assert_allclose(decoded_t, t, rtol=0, atol=1e-6)
+    np.testing.assert_array_equal(decoded_raw, raw)
+
+
+def test_block_with_decimals_is_float32():
+    raw = np.array([1.25, 2.5, 3.1])
+    _, decoded = round_trip_block(np.arange(3) / 100, raw)
+    np.testing.assert_array_equal(decoded, raw.astype(np.float32))
@@ -0,0 +1,51 @@
+"""
+Pruebas del parser de líneas por lotes.
+"""
+import numpy as np
+import serial
+from core.acquisition.chunk_decoder import ChunkDecoder
+from core.acquisition.line_reader import SerialLineReader
+from core.processing.line_format import LineFormatParser, parse_lines
+
+
+def test_raw_lines():
+    values, bad = parse_lines(['Raw:10', 'raw:11.5', 'Raw:-3'], 'raw')
+    np.testing.assert_array_equal(values, [10, 11.5, -3])
+    assert bad == 0
+
+
+def test_raw_rejects_other_keys():
+    values, bad = parse_lines(['Raw:10', 'Temp:36.5', 'Raw:12'], 'raw')
+    np.testing.assert_array_equal(values, [10, 12])
+    assert bad == 1
+
+
+def test_triple_rejects_wrong_shape_and_key():
+    lines = ['Crudo:1,Filtrado:2,Normalizado:3',
+             'Crudo:4,Filtrado:5',
+             'Otro:6,Filtrado:7,Normalizado:8',
+             'Crudo:9,Filtrado:10,Normalizado:11']
+    values, bad = parse_lines(lines, 'triple')
+    np.testing.assert_array_equal(values, [1, 9])
+    assert bad == 2
+
+
+def test_mismatches_counted_in_lines_bad():
+    parser = LineFormatParser(sniff_lines=3, line_format='raw')
+    values = parser.parse(['Raw:1', 'Bpm:72', 'Raw:2'])
+    np.testing.assert_array_equal(values, [1, 2])
+    assert parser.get_stats()['lines_bad'] == 1
+    assert parser.get_stats()['lines_ok'] == 2
+
+
+def test_known_format_skips_sniffing():
+    line_reader = SerialLineReader(serial.serial_for_url('loop://', timeout=0))
+    decoder = ChunkDecoder(line_reader, line_format='raw')
+    _, values, _ = decoder.decode(b'Raw:10\nRaw:11\n', 0.0)
+    np.testing.assert_array_equal(values, [10, 11])
+
+
+def test_cached_binary_format_is_ignored_by_text_decoder():
+    line_reader = SerialLineReader(serial.serial_for_url('loop://', timeout=0))
+    decoder = ChunkDecoder(line_reader, line_format='binary')
+    assert decoder.line_parser.line_format is None
@@ -0,0 +1,22 @@
+"""
+Pruebas de las grabaciones comprimidas .ppgz.
+"""
+import numpy as np
+import pandas as pd
+from data.packed_recording import pack_csv, read_packed, write_packed
+
+
+def test_read_packed_keeps_counts_above_float32(tmp_path):
+    path = str(tmp_path / 'grande.ppgz')
+    raw = [2 ** 25 + 1] * 10
+    write_packed(path, np.arange(10) / 100, raw)
+    _, values = read_packed(path)
+    assert values.tolist() == raw
+
+
+def test_pack_csv_keeps_counts_above_float32(tmp_path):
+    csv_path = str(tmp_path / 'grande.csv')
+    raw = np.arange(10) + 2 ** 25 + 1
+    pd.DataFrame({'timestamp': np.arange(10) / 100, 'raw_signal': raw}).to_csv(csv_path, index=False)
+    _, values = read_packed(pack_csv(csv_path))
+    assert values.tolist() == raw.tolist()
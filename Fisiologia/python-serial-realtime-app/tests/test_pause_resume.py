@@ -0,0 +1,69 @@
+"""
+Los tiempos de una lectura pausada y reanudada siguen creciendo.
+"""
+import time
+import numpy as np
+from core.acquisition.serial_session import SerialSession
+
+
+class FakePort:
+    """Puerto que entrega líneas 'Raw:n' a 100 Hz según el reloj real"""
+
+    def __init__(self, fs=100):
+        self.fs = fs
+        self.timeout = 0.02
+        self.is_open = True
+        self.t0 = time.monotonic()
+        self.sent = 0
+
+    @property
+    def in_waiting(self):
+        return 0
+
+    def read(self, size):
+        time.sleep(self.timeout)
+        due = int((time.monotonic() - self.t0) * self.fs)
+        lines = b''.join(b'Raw:%d\n' % (2000 + i % 50) for i in range(self.sent, due))
+        self.sent = due
+        return lines
+
+
+def test_timestamps_monotonic_across_pause_and_resume():
+    batches, gaps = [], []
+    session = SerialSession(batch_interval=0.05,
+                            on_batch=lambda t, v: batches.append(np.array(t)),
+                            on_gap=lambda t, missing: gaps.append((t, missing)))
+    port = FakePort()
+    session.start(port)
+    time.sleep(0.6)
+    session.stop()
+    before = sum(len(b) for b in batches)
+
+    time.sleep(0.5)
+    # Lo que el dispositivo envió durante la pausa no se lee
+    port.sent = int((time.monotonic() - port.t0) * port.fs)
+    session.start(port)
+    time.sleep(0.6)
+    session.stop()
+
+    timestamps = np.concatenate(batches)
+    assert before > 0 and len(timestamps) > before
+    assert np.all(np.diff(timestamps) > 0)
+    # La pausa queda registrada como hueco y los tiempos saltan hacia adelante
+    assert len(gaps) == 1
+    assert timestamps[before] - timestamps[before - 1] > 0.4
+
+
+def test_reset_clock_starts_again_at_zero():
+    batches = []
+    session = SerialSession(batch_interval=0.05, on_batch=lambda t, v: batches.append(np.array(t)))
+    port = FakePort()
+    session.start(port)
+    time.sleep(0.3)
+    session.stop()
+    session.reset_clock()
+    batches.clear()
+    session.start(port)
+    time.sleep(0.3)
+    session.stop()
+    assert abs(batches[0][0]) < 1e-6
@@ -0,0 +1,33 @@
+"""
+Arranque del proceso hijo de adquisición.
+"""
+import os
+import subprocess
+import sys
+import time
+from core.acquisition.process_acquisition import ProcessAcquisition
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+
+
+def test_acquisition_import_skips_analysis_dependencies():
+    code = ("import sys, core.acquisition.serial_session, core.acquisition.process_acquisition; "
+            "print(','.join(m for m in ('heartpy', 'scipy') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True,
+                            cwd=SRC_DIR, check=True)
+    assert result.stdout.strip() == ''
+
+
+def test_port_released_only_when_child_is_ready():
+    events = []
+    acquisition = ProcessAcquisition(on_status=lambda status: events.append(('status', status)))
+    acquisition.start('loop://', 115200, release_port=lambda: events.append(('release', None)))
+    try:
+        deadline = time.monotonic() + 20
+        while ('status', True) not in events and time.monotonic() < deadline:
+            acquisition.poll()
+            time.sleep(0.02)
+        assert events[:2] == [('release', None), ('status', True)]
+    finally:
+        acquisition.close()
+    assert events[-1] == ('status', False)
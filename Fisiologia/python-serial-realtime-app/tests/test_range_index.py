@@ -0,0 +1,37 @@
+"""
+Pruebas del índice tiempo → byte de los CSV.
+"""
+import numpy as np
+import pandas as pd
+from data.range_index import RangeIndex
+
+
+def write_csv(path, times):
+    pd.DataFrame({'tiempo_s': times, 'valor_raw': np.arange(len(times))}).to_csv(path, index=False)
+
+
+def rows_in_range(path, index, t_start, t_end):
+    start, end = index.byte_range(t_start, t_end)
+    with open(path, 'rb') as handle:
+        handle.seek(start)
+        block = handle.read(end - start).decode()
+    times = [float(line.split(',')[0]) for line in block.splitlines()]
+    return [t for t in times if t_start <= t < t_end]
+
+
+def test_byte_range_covers_window(tmp_path):
+    path = str(tmp_path / 'senal.csv')
+    times = np.arange(100) / 10
+    write_csv(path, times)
+    index = RangeIndex.build(path, stride=7)
+    np.testing.assert_allclose(rows_in_range(path, index, 2.05, 5.0), times[21:50])
+
+
+def test_byte_range_with_repeated_timestamps(tmp_path):
+    path = str(tmp_path / 'repetidos.csv')
+    # La fila indexada 4 tiene tiempo 3.0 y las filas 3 a 7 también
+    times = [0.0, 1.0, 2.0, 3.0, 3.0, 3.0, 3.0, 3.0, 4.0, 5.0, 6.0, 7.0]
+    write_csv(path, times)
+    index = RangeIndex.build(path, stride=4)
+    assert list(index.times) == [0.0, 3.0, 4.0]
+    assert rows_in_range(path, index, 3.0, 5.0) == [3.0] * 5 + [4.0]
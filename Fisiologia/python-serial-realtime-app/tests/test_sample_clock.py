@@ -0,0 +1,71 @@
+"""
+Pruebas del reloj de muestras con dispositivos más lentos y más rápidos que la fs nominal.
+"""
+import numpy as np
+from core.processing.sample_clock import SampleClock
+
+
+def simulate(clock, true_fs, duration, batch=0.05, jitter=0.01, seed=0):
+    """Entrega al reloj lotes de un dispositivo a true_fs con latencia variable
+
+    Returns:
+        tuple: (tiempos asignados, tiempo real de cada muestra desde la primera)
+    """
+    rng = np.random.default_rng(seed)
+    true_times = np.arange(int(duration * true_fs)) / true_fs
+    stamps = []
+    start = 0
+    for t_read in np.arange(batch, duration, batch):
+        stop = int(np.searchsorted(true_times, t_read, side='right'))
+        if stop > start:
+            host_time = 1000.0 + t_read + rng.uniform(0, jitter)
+            stamps.append(clock.stamp(stop - start, host_time))
+            start = stop
+    stamps = np.concatenate(stamps)
+    return stamps, true_times[:len(stamps)]
+
+
+def check_tracks(true_fs):
+    clock = SampleClock(100)
+    stamps, true_times = simulate(clock, true_fs, duration=60)
+
+    assert clock.total_gaps == 0
+    assert clock.lost_samples == 0
+    assert np.all(np.diff(stamps) > 0)
+    assert abs(clock.estimated_fs() - true_fs) / true_fs < 0.005
+    # Pasado el ajuste inicial los tiempos siguen al host
+    settled = true_times > 30
+    assert np.max(np.abs(stamps[settled] - true_times[settled])) < 0.03
+
+
+def test_slower_device_has_no_phantom_gaps():
+    check_tracks(63.3)
+
+
+def test_faster_device_keeps_up():
+    check_tracks(150.0)
+
+
+def test_nominal_device():
+    check_tracks(100.0)
+
+
+def test_lost_samples_are_a_gap():
+    clock = SampleClock(100)
+    for i in range(40):
+        clock.stamp(5, 1000.0 + (i + 1) * 0.05)
+    clock.pop_gaps()
+    # 0.5 s sin muestras y luego el lote siguiente
+    stamps = clock.stamp(5, 1000.0 + 41 * 0.05 + 0.5)
+    gaps = clock.pop_gaps()
+    assert len(gaps) == 1
+    assert abs(gaps[0][1] - 50) <= 1
+    assert stamps[0] > 2.4
+
+
+def test_sequence_gaps():
+    clock = SampleClock(100)
+    clock.stamp(3, seq=[10, 11, 12])
+    stamps = clock.stamp(2, seq=[15, 16])
+    assert clock.pop_gaps() == [(0.05, 2)]
+    np.testing.assert_allclose(stamps, [0.05, 0.06])
@@ -0,0 +1,49 @@
+"""
+Pruebas de la cola acotada entre el hilo lector y la interfaz.
+"""
+import numpy as np
+import pytest
+from core.processing.sample_queue import SampleQueue
+
+
+def batch(start, n):
+    t = (start + np.arange(n)) / 100
+    return t, t * 10
+
+
+def test_drop_oldest_reports_gap():
+    queue = SampleQueue(10, policy='drop_oldest')
+    queue.put_many(*batch(0, 8))
+    queue.put_many(*batch(8, 5))
+    assert queue.pop_drops() == [(0.03, 3)]
+    timestamps, _ = queue.get_all()
+    assert timestamps[0] == 0.03
+    assert queue.pop_drops() == []
+
+
+def test_drop_oldest_larger_than_capacity():
+    queue = SampleQueue(10, policy='drop_oldest')
+    queue.put_many(*batch(0, 4))
+    queue.put_many(*batch(4, 15))
+    assert queue.pop_drops() == [(0.09, 9)]
+    assert queue.dropped == 9
+
+
+def test_drop_newest_reports_gap():
+    queue = SampleQueue(10, policy='drop_newest')
+    queue.put_many(*batch(0, 8))
+    queue.put_many(*batch(8, 5))
+    assert queue.pop_drops() == [(0.12, 3)]
+    assert queue.dropped == 3
+
+
+def test_block_timeout_reports_gap():
+    queue = SampleQueue(10, policy='block', block_timeout=0.01)
+    queue.put_many(*batch(0, 8))
+    queue.put_many(*batch(8, 5))
+    assert queue.pop_drops() == [(0.12, 3)]
+
+
+def test_decimate_is_refused():
+    with pytest.raises(ValueError):
+        SampleQueue(10, policy='decimate')
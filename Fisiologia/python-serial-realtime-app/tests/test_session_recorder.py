@@ -0,0 +1,51 @@
+"""
+Pruebas de la grabación continua de la sesión.
+"""
+import numpy as np
+import pandas as pd
+from config.settings import EXPORT_COLUMNS
+from core.acquisition.session_recorder import SessionRecorder
+
+
+def record(tmp_path, values):
+    path = str(tmp_path / 'sesion.csv.part')
+    recorder = SessionRecorder(path, chunk_interval=0.05, fmt='csv')
+    recorder.start()
+    recorder.write(np.arange(len(values)) / 100, values)
+    recorder.stop()
+    return pd.read_csv(path, float_precision='round_trip')
+
+
+def test_csv_keeps_24_bit_counts(tmp_path):
+    values = np.array([1234567, 8388607, -8388608, 0], dtype=np.float64)
+    data = record(tmp_path, values)
+    assert data['raw_signal'].tolist() == values.tolist()
+
+
+def test_csv_keeps_float_values_exactly(tmp_path):
+    values = np.array([1234.5678, 0.1, 1e-9 / 3, 2000.000001])
+    data = record(tmp_path, values)
+    assert np.array_equal(data['raw_signal'].to_numpy(), values)
+
+
+def test_csv_header_matches_export_columns(tmp_path):
+    data = record(tmp_path, np.array([1.0, 2.0]))
+    assert list(data.columns) == EXPORT_COLUMNS[:2]
+
+
+def test_restore_keeps_committed_chunks(tmp_path):
+    path = str(tmp_path / 'sesion.csv.part')
+    recorder = SessionRecorder(path, chunk_interval=0.05, fmt='csv')
+    recorder.start()
+    recorder.write(np.arange(5) / 100, np.arange(5))
+    recorder.stop()
+    # Bloque a medio escribir cuando se cortó la aplicación
+    with open(path, 'a') as data:
+        data.write('0.05,12')
+
+    assert SessionRecorder.pending_recordings(str(tmp_path)) == [path]
+    destination, samples = SessionRecorder.restore(path)
+    assert destination == str(tmp_path / 'sesion.csv')
+    assert samples == 5
+    assert pd.read_csv(destination)['raw_signal'].tolist() == [0, 1, 2, 3, 4]
+    assert SessionRecorder.pending_recordings(str(tmp_path)) == []